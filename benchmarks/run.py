@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.server import DEFAULT_PAGE_SIZE, MockConnectServer
+from benchmarks.workbooks import generate_customers_workbook, generate_product_workbook
+from benchmarks.worker import SCENARIOS
+from connect.cli import get_version
+
+
+DEFAULT_SIZES = (100, 1000)
+DEFAULT_THRESHOLD = 0.2
+WORKBOOK_GENERATORS = {
+    'sync': generate_product_workbook,
+    'customers-sync': generate_customers_workbook,
+}
+
+
+def run_scenario(scenario, size, latency=0, page_size=DEFAULT_PAGE_SIZE):
+    with tempfile.TemporaryDirectory() as workdir, MockConnectServer(
+        items=size,
+        accounts=size,
+        latency=latency,
+        page_size=page_size,
+    ) as server:
+        input_file = ''
+        if scenario in WORKBOOK_GENERATORS:
+            input_dir = os.path.join(workdir, 'input')
+            os.mkdir(input_dir)
+            with contextlib.redirect_stdout(io.StringIO()):
+                input_file = WORKBOOK_GENERATORS[scenario](server.api_url, input_dir)
+        server.reset_counters()
+        result_file = os.path.join(workdir, 'result.json')
+        # a process per run so the peak RSS belongs to the command alone
+        process = subprocess.run(
+            [
+                sys.executable,
+                '-m',
+                'benchmarks.worker',
+                scenario,
+                server.api_url,
+                workdir,
+                input_file,
+                result_file,
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            cwd=os.path.join(os.path.dirname(__file__), '..'),
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f'{scenario} with {size} rows failed:\n{process.stderr.decode()}')
+        with open(result_file) as f:
+            result = json.load(f)
+    return {
+        'scenario': scenario,
+        'size': size,
+        'wall_time': result['wall_time'],
+        'requests': server.requests,
+        'requests_by_method': server.requests_by_method,
+        'peak_rss': result['peak_rss'],
+        'rows_per_sec': size / result['wall_time'],
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    previous = {(result['scenario'], result['size']): result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        base = previous.get((result['scenario'], result['size']))
+        if not base:
+            continue
+        for metric in ('wall_time', 'peak_rss'):
+            if result[metric] > base[metric] * (1 + threshold):
+                regressions.append(
+                    f"{result['scenario']} ({result['size']} rows): {metric} went from "
+                    f"{base[metric]:.2f} to {result[metric]:.2f}",
+                )
+        if result['requests'] > base['requests']:
+            regressions.append(
+                f"{result['scenario']} ({result['size']} rows): requests went from "
+                f"{base['requests']} to {result['requests']}",
+            )
+    return regressions
+
+
+def print_results(results):
+    print(f"{'Scenario':<18}{'Rows':>8}{'Time (s)':>10}{'Requests':>10}{'Peak RSS (MB)':>15}{'Rows/s':>10}")
+    for result in results:
+        print(
+            f"{result['scenario']:<18}{result['size']:>8}{result['wall_time']:>10.2f}{result['requests']:>10}"
+            f"{result['peak_rss'] / 1024 / 1024:>15.1f}{result['rows_per_sec']:>10.1f}",
+        )
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run',
+        description='Benchmark connect-cli commands against a local mock of the Connect API.',
+    )
+    parser.add_argument(
+        '--scenario',
+        action='append',
+        choices=list(SCENARIOS),
+        help='Scenario to run, can be repeated (default: all).',
+    )
+    parser.add_argument(
+        '--sizes',
+        default=','.join(str(size) for size in DEFAULT_SIZES),
+        help='Comma separated number of items and customers to run each scenario with (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0,
+        help='Seconds the mock server waits before answering each request (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--page-size',
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help='Largest page the mock server returns, bigger limits are rejected (default: %(default)s).',
+    )
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--compare', help='Compare the results with a JSON baseline and fail on regressions.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Allowed relative increase of wall time and peak RSS over the baseline (default: %(default)s).',
+    )
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results = [
+        run_scenario(scenario, size, args.latency, args.page_size)
+        for size in sizes
+        for scenario in args.scenario or SCENARIOS
+    ]
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(
+                {
+                    'version': get_version(),
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'latency': args.latency,
+                    'page_size': args.page_size,
+                    'results': results,
+                },
+                f,
+                indent=4,
+            )
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f'Regression: {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import copy
+import hashlib
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures')
+PRODUCT_ID = 'PRD-276-377-545'
+API_PREFIX = '/public/v1'
+PRODUCT_COLLECTIONS = ('items', 'parameters', 'media', 'templates', 'actions', 'configurations')
+DEFAULT_PAGE_SIZE = 1000
+ID_PREFIXES = {
+    'items': PRODUCT_ID,
+    'parameters': 'PRM',
+    'media': 'PRDM',
+    'templates': 'TL',
+    'actions': 'ACT',
+    'configurations': 'CFG',
+}
+
+
+def _load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        return json.load(f)
+
+
+def _get_value(resource, field):
+    for key in field.split('.'):
+        if not isinstance(resource, dict):
+            return
+        resource = resource.get(key)
+    return resource
+
+
+def _matches(resource, rql):
+    for field, value in re.findall(r'eq\(([\w.]+),([^)]*)\)', rql):
+        if str(_get_value(resource, field)) != value:
+            return False
+    for field, values in re.findall(r'in\(([\w.]+),\(([^)]*)\)\)', rql):
+        if str(_get_value(resource, field)) not in values.split(','):
+            return False
+    return True
+
+
+def generate_items(product_id, count):
+    templates = _load_fixture('items_response.json')
+    items = []
+    for idx, template in zip(range(count), itertools.cycle(templates)):
+        item = copy.deepcopy(template)
+        item.update(
+            {
+                'id': f'{product_id}-{idx + 1:04d}',
+                'name': f'Item {idx + 1}',
+                'display_name': f'Item {idx + 1}',
+                'mpn': f'MPN-{idx + 1:06d}',
+                'local_id': f'{product_id.replace("-", "_")}_{idx + 1:04d}',
+                'position': (idx + 1) * 100,
+            },
+        )
+        items.append(item)
+    return items
+
+
+def generate_parameters(product_id, count=None):
+    parameters = (
+        _load_fixture('ordering_parameters_response.json')
+        + _load_fixture('fulfillment_parameters_response.json')
+        + _load_fixture('configuration_parameters_response.json')
+    )
+    if count is None:
+        return parameters
+    generated = []
+    for idx, template in zip(range(count), itertools.cycle(parameters)):
+        parameter = copy.deepcopy(template)
+        parameter['id'] = f'PRM-{product_id[4:]}-{idx + 1:04d}'
+        parameter['name'] = f'parameter_{idx + 1}'
+        generated.append(parameter)
+    return generated
+
+
+def generate_accounts(count):
+    template = _load_fixture('customer/customer.json')
+    accounts = []
+    reseller = None
+    for idx in range(count):
+        account = copy.deepcopy(template)
+        account.update(
+            {
+                'id': f'TA-0000-{idx // 10000:04d}-{idx % 10000:04d}',
+                'name': f'Account {idx}',
+                'external_id': str(idx),
+                'external_uid': str(uuid.uuid5(uuid.NAMESPACE_OID, str(idx))),
+            },
+        )
+        if idx % 10 == 0:
+            account['type'] = 'reseller'
+            account.pop('parent')
+            reseller = account
+        else:
+            account['parent'] = {
+                'id': reseller['id'],
+                'name': reseller['name'],
+                'external_id': reseller['external_id'],
+            }
+        accounts.append(account)
+    return accounts
+
+
+class MockConnectServer:
+    def __init__(
+        self,
+        items=100,
+        parameters=None,
+        accounts=100,
+        latency=0,
+        page_size=DEFAULT_PAGE_SIZE,
+        host='127.0.0.1',
+        port=0,
+    ):
+        self.latency = latency
+        self.page_size = page_size
+        self.requests = 0
+        self.requests_by_method = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        with open(os.path.join(FIXTURES_DIR, 'image.png'), 'rb') as f:
+            self._media_content = f.read()
+        self._media_etag = f'"{hashlib.sha256(self._media_content).hexdigest()}"'
+        self.products = {}
+        self._add_product(
+            _load_fixture('product_response.json'),
+            {
+                'items': generate_items(PRODUCT_ID, items),
+                'parameters': generate_parameters(PRODUCT_ID, parameters),
+                'media': _load_fixture('media_response.json'),
+                'templates': _load_fixture('templates_response.json'),
+                'actions': _load_fixture('actions_response.json'),
+                'configurations': _load_fixture('configurations_response.json'),
+            },
+        )
+        self.categories = _load_fixture('categories_response.json')
+        self.units = _load_fixture('units_response.json')
+        self.hubs = [{'id': 'HB-0000-0000', 'name': 'None'}]
+        self.accounts = generate_accounts(accounts)
+        self._templates = {
+            name: copy.deepcopy(collection[0])
+            for name, collection in self.products[PRODUCT_ID]['collections'].items()
+            if collection
+        }
+        self._templates['TA'] = _load_fixture('customer/customer.json')
+        self._httpd = ThreadingHTTPServer((host, port), self._get_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def api_url(self):
+        return f'{self.url}{API_PREFIX}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.requests_by_method = {}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _add_product(self, product, collections):
+        self.products[product['id']] = {
+            'product': product,
+            'collections': {name: collections.get(name, []) for name in PRODUCT_COLLECTIONS},
+        }
+
+    def _get_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                server._handle(self, 'GET')
+
+            def do_POST(self):
+                server._handle(self, 'POST')
+
+            def do_PUT(self):
+                server._handle(self, 'PUT')
+
+            def do_DELETE(self):
+                server._handle(self, 'DELETE')
+
+        return Handler
+
+    def _handle(self, handler, method):
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length else b''
+        with self._lock:
+            self.requests += 1
+            self.requests_by_method[method] = self.requests_by_method.get(method, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        path, _, query = handler.path.partition('?')
+        if path.startswith('/media/'):
+            return self._send_media(handler)
+        if not path.startswith(API_PREFIX):
+            return self._send_error(handler, 404, 'Not found.')
+        segments = [segment for segment in path[len(API_PREFIX):].split('/') if segment]
+        payload = None
+        if body and 'json' in (handler.headers.get('Content-Type') or ''):
+            payload = json.loads(body)
+
+        with self._lock:
+            response = self._route(method, segments, unquote(query), payload)
+            if response is not None:
+                status, data, headers = response
+                content = json.dumps(data).encode('utf-8') if data is not None else b''
+        if response is None:
+            return self._send_error(handler, 404, 'Not found.')
+        self._send(handler, status, content, headers)
+
+    def _route(self, method, segments, query, payload):  # noqa: CCR001
+        if segments == ['categories']:
+            return self._list(self.categories, query)
+        if segments == ['hubs']:
+            return self._list(self.hubs, query)
+        if segments[:2] == ['settings', 'units']:
+            return self._dispatch(method, self.units, segments[2:], query, payload, 'UNIT')
+        if segments[:2] == ['tier', 'accounts']:
+            return self._dispatch(method, self.accounts, segments[2:], query, payload, 'TA')
+        if segments[:1] != ['products']:
+            return
+        if len(segments) == 1:
+            if method == 'GET':
+                return self._list([product['product'] for product in self.products.values()], query)
+            if method == 'POST':
+                return self._create_product(payload or {})
+            return
+        product = self.products.get(segments[1])
+        if product is None:
+            return
+        if len(segments) == 2:
+            if method == 'PUT':
+                product['product'].update(payload or {})
+            return 200, product['product'], {}
+        collection = product['collections'].get(segments[2])
+        if collection is None:
+            return
+        return self._dispatch(method, collection, segments[3:], query, payload, segments[2])
+
+    def _dispatch(self, method, collection, segments, query, payload, kind):
+        if not segments:
+            if method == 'GET':
+                return self._list(collection, query)
+            if method == 'POST':
+                return self._create(collection, payload, kind)
+            return
+        resource = next((resource for resource in collection if resource.get('id') == segments[0]), None)
+        if resource is None:
+            return
+        if method == 'PUT':
+            resource.update(payload or {})
+        if method == 'DELETE':
+            collection.remove(resource)
+            return 204, None, {}
+        return 200, resource, {}
+
+    def _list(self, collection, query):
+        params = {}
+        rql = []
+        for part in query.split('&'):
+            key, sep, value = part.partition('=')
+            if sep and key in ('limit', 'offset'):
+                params[key] = int(value)
+            elif part:
+                rql.append(part)
+        limit = params.get('limit', 100)
+        offset = params.get('offset', 0)
+        if limit > self.page_size:
+            return 400, {'error_code': 'VAL_001', 'errors': [f'Limit must be at most {self.page_size}.']}, {}
+        resources = [resource for resource in collection if _matches(resource, '&'.join(rql))]
+        page = resources[offset:offset + limit]
+        last = offset + len(page) - 1 if page else offset
+        return 200, page, {'Content-Range': f'items {offset}-{last}/{len(resources)}'}
+
+    def _create(self, collection, payload, kind):
+        resource = copy.deepcopy(self._templates.get(kind, {}))
+        resource.update(payload or {})
+        resource['id'] = f'{ID_PREFIXES.get(kind, kind)}-999-{next(self._sequence):06d}'
+        if kind == 'TA':
+            resource.setdefault('external_uid', str(uuid.uuid4()))
+        collection.append(resource)
+        return 201, resource, {}
+
+    def _create_product(self, payload):
+        product = copy.deepcopy(self.products[PRODUCT_ID]['product'])
+        product.update(payload)
+        product['id'] = f'PRD-999-{next(self._sequence):03d}-000'
+        self._add_product(product, {})
+        return 201, product, {}
+
+    def _send(self, handler, status, content, headers):
+        handler.send_response(status)
+        if content:
+            handler.send_header('Content-Type', 'application/json')
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _send_error(self, handler, status, message):
+        content = json.dumps({'error_code': 'NFND_001', 'errors': [message]}).encode('utf-8')
+        self._send(handler, status, content, {})
+
+    def _send_media(self, handler):
+        if handler.headers.get('If-None-Match') == self._media_etag:
+            handler.send_response(304)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'image/png')
+        handler.send_header('ETag', self._media_etag)
+        handler.send_header('Content-Length', str(len(self._media_content)))
+        handler.end_headers()
+        handler.wfile.write(self._media_content)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+DEFAULT_COMMANDS = (
+    'account list',
+    '--help',
+    'product --help',
+    'customer --help',
+)
+DEFAULT_RUNS = 20
+
+
+def time_command(command, config_dir, runs=DEFAULT_RUNS):
+    args = [sys.executable, '-m', 'connect.cli.ccli', '-c', config_dir, *command.split()]
+    timings = []
+    for _ in range(runs):
+        started_at = time.monotonic()
+        subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.monotonic() - started_at)
+    return {
+        'command': command,
+        'runs': runs,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'max': max(timings),
+    }
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.startup',
+        description='Measure how long ccli takes to run short commands.',
+    )
+    parser.add_argument(
+        '--command',
+        action='append',
+        help='Command line to time, without the ccli program name, can be repeated.',
+    )
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=DEFAULT_RUNS,
+        help='Number of times each command runs (default: %(default)s).',
+    )
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory() as config_dir:
+        results = [
+            time_command(command, os.path.join(config_dir, '.ccli'), args.runs)
+            for command in args.command or DEFAULT_COMMANDS
+        ]
+    print(f"{'Command':<24}{'Min (ms)':>10}{'Median (ms)':>13}{'Max (ms)':>10}")
+    for result in results:
+        print(
+            f"{result['command']:<24}{result['min'] * 1000:>10.0f}"
+            f"{result['median'] * 1000:>13.0f}{result['max'] * 1000:>10.0f}",
+        )
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=4)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import os
+
+from openpyxl import load_workbook
+
+from benchmarks.server import PRODUCT_ID
+from connect.cli.plugins.customer.export import dump_customers
+from connect.cli.plugins.product.export import dump_product
+
+
+API_KEY = 'ApiKey SU-000-000-000:benchmark'
+ACCOUNT_ID = 'VA-000-000'
+
+
+def _set_action(ws, column, action):
+    for row in range(2, ws.max_row + 1):
+        ws[f'{column}{row}'].value = action
+
+
+def generate_product_workbook(api_url, output_path):
+    output_file = dump_product(
+        api_url,
+        API_KEY,
+        PRODUCT_ID,
+        '',
+        True,
+        output_path=output_path,
+    )
+    wb = load_workbook(output_file)
+    ws = wb['Items']
+    _set_action(ws, 'C', 'update')
+    for row in range(2, ws.max_row + 1):
+        ws[f'E{row}'].value = f'Updated description {row}'
+    wb.save(output_file)
+    return output_file
+
+
+def generate_customers_workbook(api_url, output_path):
+    output_file = dump_customers(
+        api_url,
+        API_KEY,
+        ACCOUNT_ID,
+        'customers.xlsx',
+        True,
+        output_path=output_path,
+    )
+    wb = load_workbook(output_file)
+    _set_action(wb['Customers'], 'D', 'update')
+    wb.save(output_file)
+    return os.path.abspath(output_file)
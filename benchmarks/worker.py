@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import json
+import resource
+import sys
+import time
+
+from benchmarks.server import PRODUCT_ID
+from benchmarks.workbooks import ACCOUNT_ID, API_KEY
+from connect.cli.core.config import Config
+from connect.cli.plugins.customer.commands import grp_customer
+from connect.cli.plugins.customer.export import dump_customers
+from connect.cli.plugins.product.clone import ProductCloner
+from connect.cli.plugins.product.commands import grp_product
+from connect.cli.plugins.product.export import dump_product
+
+
+def _get_config(api_url):
+    config = Config()
+    config.add_account(ACCOUNT_ID, 'Benchmark', API_KEY, api_url)
+    config.silent = True
+    return config
+
+
+def run_export(api_url, workdir, input_file):
+    dump_product(api_url, API_KEY, PRODUCT_ID, '', True, output_path=workdir)
+
+
+def run_sync(api_url, workdir, input_file):
+    grp_product.main(['sync', input_file, '-y'], obj=_get_config(api_url), standalone_mode=False)
+
+
+def run_clone(api_url, workdir, input_file):
+    cloner = ProductCloner(_get_config(api_url), ACCOUNT_ID, ACCOUNT_ID, PRODUCT_ID)
+    cloner.dump()
+    cloner.load_wb()
+    cloner.create_product()
+    cloner.clean_wb()
+    cloner.inject()
+
+
+def run_customers_export(api_url, workdir, input_file):
+    dump_customers(api_url, API_KEY, ACCOUNT_ID, 'customers.xlsx', True, output_path=workdir)
+
+
+def run_customers_sync(api_url, workdir, input_file):
+    grp_customer.main(['sync', input_file, '-y'], obj=_get_config(api_url), standalone_mode=False)
+
+
+SCENARIOS = {
+    'export': run_export,
+    'sync': run_sync,
+    'clone': run_clone,
+    'customers-export': run_customers_export,
+    'customers-sync': run_customers_sync,
+}
+
+
+def get_peak_rss():
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS bytes
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def main(scenario, api_url, workdir, input_file, result_file):
+    started_at = time.monotonic()
+    SCENARIOS[scenario](api_url, workdir, input_file)
+    wall_time = time.monotonic() - started_at
+    with open(result_file, 'w') as f:
+        json.dump({'wall_time': wall_time, 'peak_rss': get_peak_rss()}, f)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -5,7 +5,7 @@
 import os
 import re
 
-from pkg_resources import DistributionNotFound, get_distribution
+from importlib.metadata import PackageNotFoundError, version
 
 
 MODULE_REGEX = r'[0-9]+.[0-9]'
@@ -17,8 +17,8 @@ try:
     if os.path.exists(VERSION_FILE):
         __version__ = re.search(MODULE_REGEX, open(VERSION_FILE, 'r').read()).group()
     else:
-        __version__ = get_distribution('connect-cli').version
-except DistributionNotFound:  # pragma: no cover
+        __version__ = version('connect-cli')
+except PackageNotFoundError:  # pragma: no cover
     __version__ = '0.0.0'
 
 
@@ -5,10 +5,10 @@
 
 import click
 
-from connect.client import ClientError, ConnectClient, RequestLogger
-
 
 def add_account(config, api_key, endpoint):
+    from connect.client import ClientError, ConnectClient, RequestLogger
+
     try:
         client = ConnectClient(
             api_key=api_key,
@@ -1,22 +1,30 @@
 import os
+from functools import partial
 
 import click
 
 from connect.cli import get_version
 from connect.cli.core.account.commands import grp_account
+from connect.cli.core.cache.commands import grp_cache
+from connect.cli.core.cache.helpers import get_cache_dir, ResponseCache, set_response_cache
 from connect.cli.core.config import pass_config
+from connect.cli.core.metrics import get_metrics, report_metrics
+from connect.cli.core.plugins import LazyGroup
 from connect.cli.core.utils import check_for_updates
 
 
+DEFAULT_CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.ccli')
+
+
 def print_version(ctx, param, value):
     if not value or ctx.resilient_parsing:
         return
     click.echo(f'CloudBlue Connect CLI, version {get_version()}')
-    check_for_updates()
+    check_for_updates(ctx.params.get('config_dir', DEFAULT_CONFIG_DIR))
     ctx.exit()
 
 
-@click.group(context_settings={'help_option_names': ['-h', '--help']})
+@click.group(cls=LazyGroup, context_settings={'help_option_names': ['-h', '--help']})
 @click.option(
     '--version',
     is_flag=True,
@@ -25,8 +33,9 @@ def print_version(ctx, param, value):
     callback=print_version,
 )
 @click.option('-c', '--config-dir',
-              default=os.path.join(os.path.expanduser('~'), '.ccli'),
+              default=DEFAULT_CONFIG_DIR,
               type=click.Path(file_okay=False),
+              is_eager=True,
               help='set the config directory.')
 @click.option(
     '-s',
@@ -40,14 +49,42 @@ def print_version(ctx, param, value):
     is_flag=True,
     help='Write verbose messages, including HTTP session',
 )
+@click.option(
+    '--metrics',
+    is_flag=True,
+    help='Print the count and latency of the HTTP requests per endpoint when the command ends.',
+)
+@click.option(
+    '--trace',
+    'trace_file',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write every HTTP request made by the command to this file.',
+)
+@click.option(
+    '--trace-format',
+    type=click.Choice(('json', 'otlp')),
+    default='json',
+    help='Format of the trace file: plain JSON or OpenTelemetry (OTLP/JSON) spans.',
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Do not read nor store the cached categories, units, marketplaces and hubs.',
+)
 @pass_config
-def cli(config, config_dir, silent, verbose):
+def cli(config, config_dir, silent, verbose, metrics, trace_file, trace_format, no_cache):
     """CloudBlue Connect Command Line Interface"""
     if not os.path.exists(config_dir):
         os.makedirs(config_dir)
     config.load(config_dir)
     config.silent = silent
     config.verbose = verbose
+    set_response_cache(None if no_cache else ResponseCache(get_cache_dir(config_dir)))
+    if metrics or trace_file:
+        ctx = click.get_current_context()
+        get_metrics().start(f'{ctx.info_name} {ctx.invoked_subcommand}')
+        ctx.call_on_close(partial(report_metrics, metrics, trace_file, trace_format))
 
 
 cli.add_command(grp_account)
+cli.add_command(grp_cache)
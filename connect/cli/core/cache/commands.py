@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import click
+from cmr import render
+
+from connect.cli.core.cache.constants import CACHE_STATS
+from connect.cli.core.cache.helpers import get_cache_dir, ResponseCache
+from connect.cli.core.config import pass_config
+
+
+def _format_duration(seconds):
+    if seconds <= 0:
+        return 'expired'
+    if seconds < 60 * 60:
+        return f'{int(seconds // 60)}m'
+    if seconds < 24 * 60 * 60:
+        return f'{int(seconds // (60 * 60))}h'
+    return f'{int(seconds // (24 * 60 * 60))}d'
+
+
+@click.group(name='cache', short_help='Manage the cached reference data.')
+def grp_cache():
+    pass  # pragma: no cover
+
+
+@grp_cache.command(
+    name='stats',
+    short_help='List the cached responses.',
+)
+@pass_config
+def cmd_cache_stats(config):
+    cache = ResponseCache(get_cache_dir(config.config_dir))
+    entries = cache.get_entries()
+    if not entries:
+        click.echo(f'The cache stored at {cache.cache_dir} is empty.')
+        return
+    rows = [CACHE_STATS]
+    for entry in entries:
+        rows.append(
+            f"| {entry['resource']} | {entry['endpoint']} | {entry['size'] / 1024:.1f} | "
+            f"{_format_duration(entry['age'])} | {_format_duration(entry['expires_in'])} | "
+            f"{_format_duration(entry['used'])} |\n",
+        )
+    click.echo(render(''.join(rows)))
+    click.echo(
+        f"{len(entries)} cached responses, {sum(entry['size'] for entry in entries) / 1024:.1f} KB "
+        f'stored at {cache.cache_dir}.',
+    )
+
+
+@grp_cache.command(
+    name='clear',
+    short_help='Remove every cached response.',
+)
+@pass_config
+def cmd_cache_clear(config):
+    cache = ResponseCache(get_cache_dir(config.config_dir))
+    count = cache.clear()
+    if not config.silent:
+        click.secho(f'{count} cached responses removed.', fg='green')
@@ -0,0 +1,7 @@
+CACHE_STATS = """
+# Cached responses
+
+
+| Resource | Endpoint | Size (KB) | Age | Expires in | Last used |
+|:--------|:--------|--------:|--------:|--------:|--------:|
+"""
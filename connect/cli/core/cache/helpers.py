@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from connect.cli.core.constants import CACHE_DIR, CACHE_DIR_ENV_VAR, CACHE_MAX_ENTRIES, CACHE_MAX_SIZE
+
+
+_cache = None
+
+
+def get_cache_dir(config_dir):
+    return os.environ.get(CACHE_DIR_ENV_VAR) or os.path.join(config_dir, CACHE_DIR)
+
+
+def _write_file(path, content):
+    tmp_file = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(content)
+    os.replace(tmp_file, path)
+
+
+def _read_json(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ResponseCache:
+    # every response is stored in its own data and metadata files, so concurrent ccli processes never
+    # rewrite a shared file: a hit only touches the data file and eviction scans the folder
+    def __init__(self, cache_dir, max_entries=CACHE_MAX_ENTRIES, max_size=CACHE_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, client, resource):
+        key = self._get_key(client, resource)
+        with self._lock:
+            meta = _read_json(self._get_meta_path(key))
+            data = None
+            if meta and time.time() - meta['stored_at'] < meta['ttl']:
+                data = _read_json(self._get_path(key))
+            if data is None:
+                self.misses += 1
+                return
+            try:
+                now = time.time()
+                os.utime(self._get_path(key), (now, now))
+            except OSError:
+                pass
+            self.hits += 1
+            return data
+
+    def set(self, client, resource, data, ttl):
+        key = self._get_key(client, resource)
+        meta = {
+            'resource': resource,
+            'endpoint': str(client.endpoint),
+            'stored_at': time.time(),
+            'ttl': ttl,
+        }
+        with self._lock:
+            try:
+                # a read-only config directory only disables the cache
+                os.makedirs(self.cache_dir, exist_ok=True)
+                _write_file(self._get_meta_path(key), json.dumps(meta))
+                _write_file(self._get_path(key), json.dumps(data))
+                os.utime(self._get_path(key), (meta['stored_at'], meta['stored_at']))
+            except OSError:
+                return
+            self._evict()
+
+    def invalidate(self, client, resource):
+        key = self._get_key(client, resource)
+        with self._lock:
+            _remove_file(self._get_path(key))
+            _remove_file(self._get_meta_path(key))
+
+    def clear(self):
+        with self._lock:
+            entries = self._scan()
+            for key in entries:
+                _remove_file(self._get_path(key))
+                _remove_file(self._get_meta_path(key))
+            return len(entries)
+
+    def get_entries(self):
+        with self._lock:
+            entries = self._scan()
+        now = time.time()
+        return sorted(
+            (
+                {
+                    'resource': entry['meta']['resource'],
+                    'endpoint': entry['meta']['endpoint'],
+                    'size': entry['size'],
+                    'age': now - entry['meta']['stored_at'],
+                    'expires_in': entry['meta']['stored_at'] + entry['meta']['ttl'] - now,
+                    'used': now - entry['used_at'],
+                }
+                for entry in entries.values()
+                if entry['meta']
+            ),
+            key=lambda entry: (entry['endpoint'], entry['resource']),
+        )
+
+    def _scan(self):
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return {}
+        entries = {}
+        for name in names:
+            key, ext = os.path.splitext(name)
+            if ext != '.json':
+                if ext == '.meta' and f'{key}.json' not in names:
+                    _remove_file(self._get_meta_path(key))
+                continue
+            try:
+                stat = os.stat(self._get_path(key))
+            except OSError:
+                continue
+            entries[key] = {
+                'meta': _read_json(self._get_meta_path(key)),
+                'size': stat.st_size,
+                'used_at': stat.st_mtime,
+            }
+        return entries
+
+    def _evict(self):
+        # least recently used entries go first, expired or orphaned ones before any other
+        now = time.time()
+        entries = self._scan()
+        keys = sorted(
+            entries,
+            key=lambda key: (
+                bool(entries[key]['meta']) and now - entries[key]['meta']['stored_at'] < entries[key]['meta']['ttl'],
+                entries[key]['used_at'],
+            ),
+        )
+        count = len(entries)
+        size = sum(entry['size'] for entry in entries.values())
+        for key in keys:
+            if count <= self.max_entries and size <= self.max_size:
+                break
+            _remove_file(self._get_path(key))
+            _remove_file(self._get_meta_path(key))
+            count -= 1
+            size -= entries[key]['size']
+
+    def _get_key(self, client, resource):
+        return hashlib.sha256(
+            '|'.join((str(client.endpoint), str(client.api_key), resource)).encode('utf-8'),
+        ).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def _get_meta_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.meta')
+
+
+def get_response_cache():
+    return _cache
+
+
+def set_response_cache(cache):
+    global _cache
+    _cache = cache
+
+
+def get_cached_collection(client, resource, ttl, fetch):
+    cache = get_response_cache()
+    if cache is None:
+        return list(fetch())
+    data = cache.get(client, resource)
+    if data is None:
+        data = list(fetch())
+        cache.set(client, resource, data, ttl)
+    return data
+
+
+def invalidate_cached_collection(client, resource):
+    cache = get_response_cache()
+    if cache is not None:
+        cache.invalidate(client, resource)
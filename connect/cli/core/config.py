@@ -23,6 +23,7 @@ class Account:
 
 class Config(object):
     def __init__(self):
+        self._config_dir = None
         self._config_path = None
         self._active = None
         self._silent = True
@@ -34,6 +35,10 @@ class Config(object):
         if not self._active:
             self._active = self._accounts[id]
 
+    @property
+    def config_dir(self):
+        return self._config_dir
+
     @property
     def active(self):
         return self._active
@@ -78,6 +83,7 @@ class Config(object):
         raise ClickException(f'The account identified by {id} does not exist.')
 
     def load(self, config_dir):
+        self._config_dir = config_dir
         self._config_path = os.path.join(config_dir, 'config.json')
         if not os.path.isfile(self._config_path):
             return
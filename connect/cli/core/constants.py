@@ -13,3 +13,26 @@ and make sure your PATH environment variable includes also the Cairo shared libr
 """
 
 PYPI_JSON_API_URL = 'https://pypi.org/pypi/connect-cli/json'
+VERSION_CHECK_FILE = 'version_check.json'
+VERSION_CHECK_TTL = 24 * 60 * 60
+VERSION_CHECK_TIMEOUT = 2
+OFFLINE_ENV_VAR = 'CCLI_OFFLINE'
+
+CACHE_DIR = 'cache'
+CACHE_DIR_ENV_VAR = 'CCLI_CACHE_DIR'
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_SIZE = 16 * 1024 * 1024
+
+SCHEDULER_RATE = 50
+SCHEDULER_MIN_RATE = 1
+SCHEDULER_BURST = 100
+SCHEDULER_CONCURRENCY = 8
+SCHEDULER_MAX_CONCURRENCY = 64
+SCHEDULER_LATENCY_TOLERANCE = 3
+SCHEDULER_LATENCY_WINDOW = 20
+SCHEDULER_DEGRADED_SAMPLES = 3
+SCHEDULER_MAX_RETRIES = 5
+SCHEDULER_BACKOFF_BASE = 1
+SCHEDULER_BACKOFF_MAX = 60
+SCHEDULER_RETRY_STATUSES = (429, 502, 503)
+SCHEDULER_THROTTLE_STATUSES = (429, 503)
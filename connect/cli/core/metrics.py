@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+import click
+from cmr import render
+
+from connect.cli import get_version
+
+
+def get_endpoint_template(url):
+    segments = [segment for segment in urlparse(url).path.split('/') if segment]
+    for idx, segment in enumerate(segments):
+        if re.fullmatch(r'v\d+', segment):
+            segments = segments[idx + 1:]
+            break
+    return '/'.join(
+        '{id}' if any(char.isdigit() for char in segment) else segment
+        for segment in segments
+    )
+
+
+def get_percentile(values, percentile):
+    values = sorted(values)
+    return values[max(0, math.ceil(percentile / 100 * len(values)) - 1)]
+
+
+def _get_size(response):
+    length = response.headers.get('Content-Length')
+    if length is not None and length.isdigit():
+        return int(length)
+    return len(response.content or b'')
+
+
+def _get_attribute(key, value):
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.enabled = False
+        self.name = None
+        self.started_at = None
+        self.finished_at = None
+        self._requests = []
+        self._lock = threading.Lock()
+
+    def start(self, name):
+        with self._lock:
+            self.enabled = True
+            self.name = name
+            self.started_at = time.time()
+            self.finished_at = None
+            self._requests = []
+
+    def stop(self):
+        with self._lock:
+            self.enabled = False
+            self.finished_at = time.time()
+
+    @property
+    def requests(self):
+        with self._lock:
+            return list(self._requests)
+
+    def record(self, method, url, started_at, latency, response=None, retries=0, error=None):
+        if not self.enabled:
+            return
+        request = {
+            'endpoint': get_endpoint_template(url),
+            'method': method.upper(),
+            'url': url,
+            'status': response.status_code if response is not None else None,
+            'started_at': started_at,
+            'latency': latency,
+            'bytes': _get_size(response) if response is not None else 0,
+            'retries': retries,
+            'error': error,
+        }
+        with self._lock:
+            self._requests.append(request)
+
+    def get_summary(self):
+        endpoints = {}
+        for request in self.requests:
+            endpoints.setdefault((request['endpoint'], request['method']), []).append(request)
+        summary = []
+        for (endpoint, method), requests in sorted(endpoints.items()):
+            latencies = [request['latency'] for request in requests]
+            summary.append(
+                {
+                    'endpoint': endpoint,
+                    'method': method,
+                    'count': len(requests),
+                    'errors': sum(
+                        1 for request in requests
+                        if request['status'] is None or request['status'] >= 400
+                    ),
+                    'retries': sum(request['retries'] for request in requests),
+                    'bytes': sum(request['bytes'] for request in requests),
+                    'p50': get_percentile(latencies, 50),
+                    'p95': get_percentile(latencies, 95),
+                    'p99': get_percentile(latencies, 99),
+                    'total': sum(latencies),
+                },
+            )
+        return summary
+
+    def to_json(self):
+        return {
+            'command': self.name,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'endpoints': self.get_summary(),
+            'requests': self.requests,
+        }
+
+    def to_spans(self):
+        trace_id = os.urandom(16).hex()
+        root_id = os.urandom(8).hex()
+        finished_at = self.finished_at or time.time()
+        spans = [
+            {
+                'traceId': trace_id,
+                'spanId': root_id,
+                'name': self.name or 'ccli',
+                'kind': 1,
+                'startTimeUnixNano': str(int(self.started_at * 1e9)),
+                'endTimeUnixNano': str(int(finished_at * 1e9)),
+                'attributes': [],
+                'status': {},
+            },
+        ]
+        for request in self.requests:
+            failed = request['status'] is None or request['status'] >= 400
+            spans.append(
+                {
+                    'traceId': trace_id,
+                    'spanId': os.urandom(8).hex(),
+                    'parentSpanId': root_id,
+                    'name': f"{request['method']} {request['endpoint']}",
+                    'kind': 3,
+                    'startTimeUnixNano': str(int(request['started_at'] * 1e9)),
+                    'endTimeUnixNano': str(int((request['started_at'] + request['latency']) * 1e9)),
+                    'attributes': [
+                        _get_attribute(key, value)
+                        for key, value in (
+                            ('http.method', request['method']),
+                            ('http.url', request['url']),
+                            ('http.route', request['endpoint']),
+                            ('http.status_code', request['status']),
+                            ('http.response_content_length', request['bytes']),
+                            ('ccli.retries', request['retries']),
+                            ('error.type', request['error']),
+                        )
+                        if value is not None
+                    ],
+                    'status': {'code': 2} if failed else {},
+                },
+            )
+        return {
+            'resourceSpans': [
+                {
+                    'resource': {
+                        'attributes': [
+                            _get_attribute('service.name', 'connect-cli'),
+                            _get_attribute('service.version', get_version()),
+                        ],
+                    },
+                    'scopeSpans': [{'scope': {'name': 'connect.cli'}, 'spans': spans}],
+                },
+            ],
+        }
+
+
+_metrics = RequestMetrics()
+
+
+def get_metrics():
+    return _metrics
+
+
+def print_metrics(metrics):
+    summary = metrics.get_summary()
+    if not summary:
+        return
+    msg = '''
+# HTTP requests
+
+
+| Endpoint | Method | Count | Errors | Retries | p50 (ms) | p95 (ms) | p99 (ms) | Total (s) | KB |
+|:--------|:--------|--------:|--------:|--------:|--------:|--------:|--------:|--------:|--------:|
+    '''
+    row = '|{endpoint}|{method}|{count}|{errors}|{retries}|{p50:.0f}|{p95:.0f}|{p99:.0f}|{total:.2f}|{kb:.1f}|\n'
+    for endpoint in summary:
+        msg += row.format(
+            endpoint=endpoint['endpoint'],
+            method=endpoint['method'],
+            count=endpoint['count'],
+            errors=endpoint['errors'],
+            retries=endpoint['retries'],
+            p50=endpoint['p50'] * 1000,
+            p95=endpoint['p95'] * 1000,
+            p99=endpoint['p99'] * 1000,
+            total=endpoint['total'],
+            kb=endpoint['bytes'] / 1024,
+        )
+    click.echo(f'\n{render(msg)}\n', err=True)
+
+
+def write_trace(metrics, trace_file, trace_format='json'):
+    data = metrics.to_spans() if trace_format == 'otlp' else metrics.to_json()
+    with open(trace_file, 'w') as f:
+        json.dump(data, f, indent=4)
+
+
+def report_metrics(print_table, trace_file=None, trace_format='json'):
+    metrics = get_metrics()
+    metrics.stop()
+    if print_table:
+        print_metrics(metrics)
+    if trace_file:
+        write_trace(metrics, trace_file, trace_format)
@@ -1,22 +1,71 @@
+from importlib import metadata
+
 import click
-import pkg_resources
+
+
+class LazyGroup(click.Group):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = {}
+
+    def add_lazy_command(self, name, entrypoint):
+        self.commands.pop(name, None)
+        self.lazy_commands[name] = entrypoint
+
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        entrypoint = self.lazy_commands.pop(cmd_name, None)
+        if entrypoint is not None:
+            command_fn = entrypoint.load()
+            self.add_command(command_fn(), cmd_name)
+        return self.commands.get(cmd_name)
+
+
+class PluginGroup(click.Group):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.entrypoints = []
+
+    def add_entrypoint(self, entrypoint):
+        self.entrypoints.append(entrypoint)
+
+    def list_commands(self, ctx):
+        self._load_entrypoints()
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx, cmd_name):
+        self._load_entrypoints()
+        return super().get_command(ctx, cmd_name)
+
+    def _load_entrypoints(self):
+        entrypoints, self.entrypoints = self.entrypoints, []
+        for entrypoint in entrypoints:
+            command_fn = entrypoint.load()
+            self.add_command(command_fn())
+
+
+def get_entry_points(group):
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return entry_points.select(group=group)
+    return entry_points.get(group, ())  # pragma: no cover
 
 
 def load_plugins(cli):
-    @click.group(name='plugin', short_help='Third party plugins.')
+    @click.group(name='plugin', short_help='Third party plugins.', cls=PluginGroup)
     def grp_plugins():
         pass  # pragma: no cover
 
     has_3rd_party_plugins = False
 
-    for entrypoint in pkg_resources.iter_entry_points('connect.cli.plugins'):
-        if entrypoint.module_name.startswith('connect.cli.plugins.'):
-            command_fn = entrypoint.load()
-            cli.add_command(command_fn())
+    for entrypoint in get_entry_points('connect.cli.plugins'):
+        if entrypoint.value.startswith('connect.cli.plugins.'):
+            cli.add_lazy_command(entrypoint.name, entrypoint)
         else:
             has_3rd_party_plugins = True
-            command_fn = entrypoint.load()
-            grp_plugins.add_command(command_fn())
+            grp_plugins.add_entrypoint(entrypoint)
 
     if has_3rd_party_plugins:
         cli.add_command(grp_plugins)
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from connect.cli.core.constants import (
+    SCHEDULER_BACKOFF_BASE,
+    SCHEDULER_BACKOFF_MAX,
+    SCHEDULER_BURST,
+    SCHEDULER_CONCURRENCY,
+    SCHEDULER_DEGRADED_SAMPLES,
+    SCHEDULER_LATENCY_TOLERANCE,
+    SCHEDULER_LATENCY_WINDOW,
+    SCHEDULER_MAX_CONCURRENCY,
+    SCHEDULER_MAX_RETRIES,
+    SCHEDULER_MIN_RATE,
+    SCHEDULER_RATE,
+    SCHEDULER_RETRY_STATUSES,
+    SCHEDULER_THROTTLE_STATUSES,
+)
+from connect.cli.core.metrics import get_endpoint_template, get_metrics
+from connect.client import ConnectClient, RequestLogger
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_retry_after(response):
+    value = response.headers.get('Retry-After')
+    if not value:
+        return
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return
+
+
+def get_backoff(retries, base=SCHEDULER_BACKOFF_BASE, maximum=SCHEDULER_BACKOFF_MAX):
+    delay = min(maximum, base * 2 ** (retries - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class TokenBucket:
+    def __init__(self, rate=SCHEDULER_RATE, burst=SCHEDULER_BURST, min_rate=SCHEDULER_MIN_RATE):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def try_acquire(self):
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def slow_down(self):
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self):
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 100)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class AdaptiveConcurrency:
+    def __init__(
+        self,
+        limit=SCHEDULER_CONCURRENCY,
+        max_limit=SCHEDULER_MAX_CONCURRENCY,
+        latency_tolerance=SCHEDULER_LATENCY_TOLERANCE,
+        latency_window=SCHEDULER_LATENCY_WINDOW,
+        degraded_samples=SCHEDULER_DEGRADED_SAMPLES,
+    ):
+        self.limit = limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self._latency_tolerance = latency_tolerance
+        self._latency_window = latency_window
+        self._degraded_samples = degraded_samples
+        self._latencies = {}
+        self._slow_responses = {}
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def try_acquire(self):
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency, throttled=False, endpoint=None):
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit / 2)
+            elif self._is_degraded(endpoint, latency):
+                self.limit = max(1, self.limit * 0.9)
+            elif self.in_flight + 1 >= int(self.limit):
+                # only grow while the limit is what holds requests back
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def _is_degraded(self, endpoint, latency):
+        # each endpoint is compared with the median of its own recent latencies, and only a run of
+        # slow responses counts as a degradation
+        latencies = self._latencies.setdefault(endpoint, deque(maxlen=self._latency_window))
+        slow = bool(latencies) and latency > statistics.median(latencies) * self._latency_tolerance
+        latencies.append(latency)
+        self._slow_responses[endpoint] = self._slow_responses.get(endpoint, 0) + 1 if slow else 0
+        if self._slow_responses[endpoint] < self._degraded_samples:
+            return False
+        self._slow_responses[endpoint] = 0
+        return True
+
+
+class RequestScheduler:
+    def __init__(
+        self,
+        bucket=None,
+        concurrency=None,
+        max_retries=SCHEDULER_MAX_RETRIES,
+        backoff_base=SCHEDULER_BACKOFF_BASE,
+    ):
+        self.bucket = bucket or TokenBucket()
+        self.concurrency = concurrency or AdaptiveConcurrency()
+        self.max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._paused_until = 0
+        self._lock = threading.Lock()
+
+    def request(self, send, method, url, kwargs):
+        requested_at = time.time()
+        endpoint = get_endpoint_template(url)
+        first_attempt_at = time.monotonic()
+        retries = 0
+        while True:
+            self._wait()
+            self.bucket.acquire()
+            self.concurrency.acquire()
+            started_at = time.monotonic()
+            try:
+                response = send(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                self.concurrency.release(time.monotonic() - started_at, True, endpoint)
+                if method.lower() != 'get' or retries >= self.max_retries:
+                    get_metrics().record(
+                        method,
+                        url,
+                        requested_at,
+                        time.monotonic() - first_attempt_at,
+                        retries=retries,
+                        error=error.__class__.__name__,
+                    )
+                    raise
+                retries += 1
+                time.sleep(get_backoff(retries, self._backoff_base))
+                continue
+            throttled = response.status_code in SCHEDULER_THROTTLE_STATUSES
+            self.complete(endpoint, time.monotonic() - started_at, throttled)
+            if response.status_code not in SCHEDULER_RETRY_STATUSES or retries >= self.max_retries:
+                get_metrics().record(
+                    method,
+                    url,
+                    requested_at,
+                    time.monotonic() - first_attempt_at,
+                    response,
+                    retries,
+                )
+                return response
+            retries += 1
+            delay = get_backoff(retries, self._backoff_base)
+            if throttled:
+                retry_after = get_retry_after(response)
+                # the server throttles the account, so every request waits, not only this one
+                self.pause(delay if retry_after is None else retry_after)
+            else:
+                time.sleep(delay)
+
+    def complete(self, endpoint, latency, throttled):
+        self.concurrency.release(latency, throttled, endpoint)
+        if throttled:
+            self.bucket.slow_down()
+        else:
+            self.bucket.speed_up()
+
+    def pause(self, delay):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def get_pause(self):
+        with self._lock:
+            return max(0, self._paused_until - time.monotonic())
+
+    def _wait(self):
+        while True:
+            delay = self.get_pause()
+            if not delay:
+                return
+            time.sleep(delay)
+
+
+def get_scheduler(endpoint, api_key):
+    key = (endpoint, api_key)
+    with _schedulers_lock:
+        if key not in _schedulers:
+            _schedulers[key] = RequestScheduler()
+        return _schedulers[key]
+
+
+def clear_schedulers():
+    with _schedulers_lock:
+        _schedulers.clear()
+
+
+class ScheduledClient(ConnectClient):
+    def __init__(self, *args, scheduler=None, session=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._scheduler = scheduler or get_scheduler(self.endpoint, self.api_key)
+        self._session = session
+
+    def _execute_http_call(self, method, url, kwargs):
+        if self.logger:
+            self.logger.log_request(method, url, kwargs)
+
+        send = self._session.request if self._session is not None else requests.request
+        self.response = self._scheduler.request(send, method, url, kwargs)
+
+        if self.logger:
+            self.logger.log_response(self.response)
+
+        if self.response.status_code >= 400:
+            self.response.raise_for_status()
+
+
+def create_client(api_key, endpoint, verbose=False, session=None, **kwargs):
+    return ScheduledClient(
+        api_key=api_key,
+        endpoint=endpoint,
+        use_specs=False,
+        logger=RequestLogger() if verbose else None,
+        session=session,
+        **kwargs,
+    )
@@ -2,13 +2,23 @@
 
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+import atexit
+import json
+import os
 import sys
+import threading
+import time
 
 import click
-import requests
 
 from connect.cli import get_version
-from connect.cli.core.constants import PYPI_JSON_API_URL
+from connect.cli.core.constants import (
+    OFFLINE_ENV_VAR,
+    PYPI_JSON_API_URL,
+    VERSION_CHECK_FILE,
+    VERSION_CHECK_TIMEOUT,
+    VERSION_CHECK_TTL,
+)
 
 
 def continue_or_quit():
@@ -23,22 +33,75 @@ def continue_or_quit():
             return False
 
 
-def check_for_updates(*args):
+def is_offline():
+    return os.environ.get(OFFLINE_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+
+def fetch_latest_version(timeout=VERSION_CHECK_TIMEOUT):
+    import requests
+
     try:
-        res = requests.get(PYPI_JSON_API_URL)
+        res = requests.get(PYPI_JSON_API_URL, timeout=timeout)
         if res.status_code == 200:
-            data = res.json()
-            version = data['info']['version']
-            current = get_version()
-            if version != current:
-                click.secho(
-                    f'\nYou are running CloudBlue Connect CLI version {current}. '
-                    f'A newer version is available: {version}.\n',
-                    fg='yellow',
-                )
-    except requests.RequestException:
+            return res.json()['info']['version']
+    except (requests.RequestException, ValueError, KeyError):
         pass
 
 
+def _read_version_cache(cache_file):
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_version_cache(cache_file, version):
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({'checked_at': time.time(), 'version': version}, f)
+    except OSError:
+        pass
+
+
+def get_latest_version(config_dir=None, timeout=VERSION_CHECK_TIMEOUT):
+    cache_file = os.path.join(config_dir, VERSION_CHECK_FILE) if config_dir else None
+    cache = _read_version_cache(cache_file) if cache_file else {}
+    if is_offline() or time.time() - cache.get('checked_at', 0) < VERSION_CHECK_TTL:
+        return cache.get('version')
+    if cache_file:
+        # stamped before asking PyPI, so a request that never ends is not retried until the next day
+        _write_version_cache(cache_file, cache.get('version'))
+
+    result = {}
+
+    def refresh():
+        result['version'] = fetch_latest_version(timeout) or cache.get('version')
+        if cache_file:
+            _write_version_cache(cache_file, result['version'])
+
+    # the request runs in a daemon thread because the requests timeout does not cover name resolution
+    thread = threading.Thread(target=refresh, daemon=True)
+    thread.start()
+    if cache.get('version'):
+        # the stored version is answered at once, the refresh has until the command exits to complete
+        atexit.register(thread.join, timeout)
+        return cache['version']
+    thread.join(timeout)
+    return result.get('version')
+
+
+def check_for_updates(config_dir=None):
+    version = get_latest_version(config_dir)
+    current = get_version()
+    if version and version != current:
+        click.secho(
+            f'\nYou are running CloudBlue Connect CLI version {current}. '
+            f'A newer version is available: {version}.\n',
+            fg='yellow',
+        )
+
+
 def is_bundle():
     return getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
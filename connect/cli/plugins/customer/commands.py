@@ -6,11 +6,10 @@ import warnings
 
 import click
 
-from connect.client import ConnectClient, RequestLogger
 from connect.cli.core.config import pass_config
-from connect.cli.plugins.customer.export import dump_customers
-from connect.cli.plugins.customer.sync import CustomerSynchronizer
+from connect.cli.plugins.customer.constants import SYNC_DEFAULT_WORKERS
 from connect.cli.plugins.customer.utils import print_sync_result
+from connect.cli.plugins.tables import get_table_format, TABLE_FORMATS
 
 
 @click.group(name='customer', short_help='Export/synchronize customers.')
@@ -34,10 +33,20 @@ def grp_customer():
     '-o',
     'output_file',
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
-    help='Output Excel file name.',
+    help='Output Excel file or table directory name.',
+)
+@click.option(
+    '--format',
+    '-f',
+    'output_format',
+    type=click.Choice(('xlsx',) + TABLE_FORMATS),
+    default='xlsx',
+    help='Write an excel file or a directory with a table file per sheet.',
 )
 @pass_config
-def cmd_export_customers(config, output_path, output_file):
+def cmd_export_customers(config, output_path, output_file, output_format):
+    from connect.cli.plugins.customer.export import dump_customers
+
     config.validate()
     acc_id = config.active.id
     acc_name = config.active.name
@@ -54,6 +63,7 @@ def cmd_export_customers(config, output_path, output_file):
         output_path=output_path,
         account_id=acc_id,
         verbose=config.verbose,
+        output_format=output_format,
     )
     if not config.silent:
         click.secho(
@@ -75,13 +85,24 @@ def cmd_export_customers(config, output_path, output_file):
     is_flag=True,
     help='Answer yes to all questions.',
 )
+@click.option(
+    '--workers',
+    '-w',
+    'workers',
+    type=click.IntRange(1, 16),
+    default=SYNC_DEFAULT_WORKERS,
+    help='Number of customers of the same level to create or update concurrently.',
+)
 @pass_config
-def cmd_sync_customers(config, input_file, yes):
+def cmd_sync_customers(config, input_file, yes, workers):
+    from connect.cli.core.scheduler import create_client
+    from connect.cli.plugins.customer.sync import CustomerSynchronizer
+
     config.validate()
     acc_id = config.active.id
     acc_name = config.active.name
 
-    if '.xlsx' not in input_file:
+    if '.xlsx' not in input_file and not get_table_format(input_file):
         input_file = f'{input_file}/{input_file}.xlsx'
 
     if not config.silent:
@@ -89,18 +110,17 @@ def cmd_sync_customers(config, input_file, yes):
             f'Current active account: {acc_id} - {acc_name}\n',
             fg='blue',
         )
-    client = ConnectClient(
-        api_key=config.active.api_key,
-        endpoint=config.active.endpoint,
-        use_specs=False,
-        max_retries=3,
-        logger=RequestLogger() if config.verbose else None,
+    client = create_client(
+        config.active.api_key,
+        config.active.endpoint,
+        verbose=config.verbose,
     )
 
     synchronizer = CustomerSynchronizer(
         client=client,
         silent=config.silent,
         account_id=acc_id,
+        workers=workers,
     )
     warnings.filterwarnings("ignore", category=UserWarning)
     synchronizer.open(input_file, 'Customers')
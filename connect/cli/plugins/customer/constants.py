@@ -28,3 +28,11 @@ SYNC_RESULT_OUTPUT = """
 | Module | Processed | Created | Updated | Deleted | Skipped | Errors |
 |:--------|--------:| --------:|--------:|----------:|----------:|----------:|
 """
+
+HUBS_CACHE_TTL = 60 * 60
+
+ACCOUNTS_LOOKUP_BATCH_SIZE = 100
+
+ACCOUNTS_LOOKUP_PAGE_SIZE = 1000
+
+SYNC_DEFAULT_WORKERS = 1
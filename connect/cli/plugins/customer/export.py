@@ -3,8 +3,6 @@ import os
 from click import ClickException
 from iso3166 import countries
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill
-from openpyxl.styles.colors import Color
 from openpyxl.worksheet.datavalidation import DataValidation
 from tqdm import trange
 
@@ -12,11 +10,23 @@ from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.core.http import (
     handle_http_error,
 )
+from connect.cli.core.scheduler import create_client
 from connect.cli.plugins.customer.constants import COL_HEADERS
-from connect.client import ClientError, ConnectClient, RequestLogger
-
-
-def dump_customers(api_url, api_key, account_id, output_file, silent, verbose=False, output_path=None):  # noqa: CCR001
+from connect.cli.plugins.sheets import get_sheet_writer
+from connect.cli.plugins.tables import TableBook
+from connect.client import ClientError
+
+
+def dump_customers(  # noqa: CCR001
+    api_url,
+    api_key,
+    account_id,
+    output_file,
+    silent,
+    verbose=False,
+    output_path=None,
+    output_format='xlsx',
+):
     if not output_path:
         output_path = os.path.join(os.getcwd(), account_id)
     else:
@@ -27,7 +37,10 @@ def dump_customers(api_url, api_key, account_id, output_file, silent, verbose=Fa
         output_path = os.path.join(output_path, account_id)
 
     if not output_file:
-        output_file = os.path.join(output_path, 'customers.xlsx')
+        if output_format == 'xlsx':
+            output_file = os.path.join(output_path, 'customers.xlsx')
+        else:
+            output_file = os.path.join(output_path, f'customers_{output_format}')
     else:
         output_file = os.path.join(output_path, output_file)
 
@@ -38,38 +51,40 @@ def dump_customers(api_url, api_key, account_id, output_file, silent, verbose=Fa
             "Exists a file with account id as name but a directory is expected, please rename it",
         )
     try:
-        client = ConnectClient(
-            max_retries=3,
-            api_key=api_key,
-            endpoint=api_url,
-            use_specs=False,
+        client = create_client(
+            api_key,
+            api_url,
+            verbose=verbose,
             default_limit=1000,
-            logger=RequestLogger() if verbose else None,
         )
-        wb = Workbook()
-        _prepare_worksheet(wb.create_sheet('Customers'))
+        if output_format == 'xlsx':
+            wb = Workbook(write_only=True)
+        else:
+            wb = TableBook(output_file, output_format)
+        writer = _prepare_worksheet(wb.create_sheet('Customers'))
         _add_countries(wb.create_sheet('Countries'))
+        action_validation, search_criteria_validation = _get_customer_validations()
 
         customers = client.ns('tier').accounts.all()
-        row_idx = 2
         count = customers.count()
         progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
         for customer in customers:
             progress.set_description(f'Processing customer {customer["id"]}')
             progress.update(1)
-            _fill_customer_row(wb['Customers'], row_idx, customer)
-            row_idx += 1
+            writer.append(
+                _get_customer_row(customer),
+                validations={'D': action_validation, 'F': search_criteria_validation},
+            )
+        writer.close()
     except ClientError as error:
         handle_http_error(error)
 
-    default_sheet = wb['Sheet']
-    wb.remove(default_sheet)
     wb.save(output_file)
 
     return output_file
 
 
-def _fill_customer_row(ws, row_idx, customer):
+def _get_customer_validations():
     action_validation = DataValidation(
         type='list',
         formula1='"-,create,update"',
@@ -88,40 +103,34 @@ def _fill_customer_row(ws, row_idx, customer):
     search_criteria_validation.errorTitle = str('Invalid search criteria')
     search_criteria_validation.prompt = str('Please choose search criteria from list')
     search_criteria_validation.promptTitle = str('List of choices')
-
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(search_criteria_validation)
-
-    ws.cell(row_idx, 1, value=customer.get('id', '-'))
-    ws.cell(row_idx, 2, value=customer.get('external_id', '-'))
-    ws.cell(row_idx, 3, value=customer.get('external_uid', '-'))
-    ws.cell(row_idx, 4, value='-')
-    ws.cell(row_idx, 5, value=customer['hub'].get('id', '-') if 'hub' in customer else '-')
-    ws.cell(row_idx, 6, value='id' if 'parent' in customer else '-')
-    ws.cell(row_idx, 7, value=customer['parent'].get('id', '-') if 'parent' in customer else '-')
-    ws.cell(row_idx, 8, value=customer.get('type', '-'))
-    ws.cell(row_idx, 9, value=customer.get('tax_id', '-'))
-    ws.cell(row_idx, 10, value=customer.get('name', '-'))
-    ws.cell(row_idx, 11, value=customer['contact_info'].get('address_line1', '-'))
-    ws.cell(row_idx, 12, value=customer['contact_info'].get('address_line2', '-'))
-    ws.cell(row_idx, 13, value=customer['contact_info'].get('city', '-'))
-    ws.cell(row_idx, 14, value=customer['contact_info'].get('state', '-'))
-    ws.cell(row_idx, 15, value=customer['contact_info'].get('zip', '-'))
-    ws.cell(row_idx, 16, value=customer['contact_info'].get('country', '-'))
-    ws.cell(row_idx, 17, value=customer['contact_info']['contact'].get('first_name', '-'))
-    ws.cell(row_idx, 18, value=customer['contact_info']['contact'].get('last_name', '-'))
-    ws.cell(row_idx, 19, value=customer['contact_info']['contact'].get('email', '-'))
-    ws.cell(
-        row_idx, 20, value=_get_phone_number(
-            customer['contact_info']['contact'].get(
-                'phone_number',
-                '-',
-            ),
-        ),
-    )
-
-    action_validation.add(f'D{row_idx}')
-    search_criteria_validation.add(f'F{row_idx}')
+    return action_validation, search_criteria_validation
+
+
+def _get_customer_row(customer):
+    contact_info = customer['contact_info']
+    contact = contact_info['contact']
+    return [
+        customer.get('id', '-'),
+        customer.get('external_id', '-'),
+        customer.get('external_uid', '-'),
+        '-',
+        customer['hub'].get('id', '-') if 'hub' in customer else '-',
+        'id' if 'parent' in customer else '-',
+        customer['parent'].get('id', '-') if 'parent' in customer else '-',
+        customer.get('type', '-'),
+        customer.get('tax_id', '-'),
+        customer.get('name', '-'),
+        contact_info.get('address_line1', '-'),
+        contact_info.get('address_line2', '-'),
+        contact_info.get('city', '-'),
+        contact_info.get('state', '-'),
+        contact_info.get('zip', '-'),
+        contact_info.get('country', '-'),
+        contact.get('first_name', '-'),
+        contact.get('last_name', '-'),
+        contact.get('email', '-'),
+        _get_phone_number(contact.get('phone_number', '-')),
+    ]
 
 
 def _get_phone_number(number):
@@ -140,39 +149,23 @@ def _get_phone_number(number):
 
 
 def _prepare_worksheet(ws):
-    color = Color('d3d3d3')
-    fill = PatternFill('solid', color)
-    cels = ws['A1': 'T1']
-    for cel in cels[0]:
-        if cel.column_letter in ['J', 'K', 'L']:
-            ws.column_dimensions[cel.column_letter].width = 50
-        elif cel.column_letter in ['B', 'D', 'E', 'F']:
-            ws.column_dimensions[cel.column_letter].width = 15
+    widths = {}
+    for letter in COL_HEADERS.keys():
+        if letter in ['J', 'K', 'L']:
+            widths[letter] = 50
+        elif letter in ['B', 'D', 'E', 'F']:
+            widths[letter] = 15
         else:
-            ws.column_dimensions[cel.column_letter].width = 20
-        ws.column_dimensions[cel.column_letter].auto_size = True
-        cel.fill = fill
-        cel.value = COL_HEADERS[cel.column_letter]
+            widths[letter] = 20
+    writer = get_sheet_writer(ws)
+    writer.write_header(list(COL_HEADERS.values()), widths)
+    return writer
 
 
 def _add_countries(ws):
-    col_headers = {
-        'A': '2 letters country code',
-        'B': 'Country name',
-    }
-    color = Color('d3d3d3')
-    fill = PatternFill('solid', color)
-    ws.column_dimensions['A'].width = 15
-    ws.column_dimensions['A'].auto_size = True
-    ws.column_dimensions['B'].width = 50
-    cels = ws['A1': 'B1']
-    for cel in cels[0]:
-        cel.fill = fill
-        cel.value = col_headers[cel.column_letter]
-    row_idx = 2
+    writer = get_sheet_writer(ws)
+    writer.write_header(['2 letters country code', 'Country name'], {'A': 15, 'B': 50})
     for country in countries:
-        ws.cell(row_idx, 1, value=country.alpha2)
-        ws.cell(row_idx, 2, value=country.name)
-        row_idx += 1
-    ws.cell(row_idx, 1, value='-')
-    ws.cell(row_idx, 2, value='Not Selected')
+        writer.append([country.alpha2, country.name])
+    writer.append(['-', 'Not Selected'])
+    writer.close()
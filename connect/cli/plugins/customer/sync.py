@@ -1,37 +1,78 @@
 import uuid
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import phonenumbers
 from click import ClickException
-from tqdm import trange
+from tqdm import tqdm
 
 from connect.client import ClientError, R
 
-from zipfile import BadZipFile
-
-from openpyxl import load_workbook
-from openpyxl.utils.exceptions import InvalidFileException
-
+from connect.cli.core.cache.helpers import get_cached_collection
 from connect.cli.core.constants import DEFAULT_BAR_FORMAT
-from connect.cli.plugins.customer.constants import COL_HEADERS
+from connect.cli.plugins.customer.constants import (
+    ACCOUNTS_LOOKUP_BATCH_SIZE,
+    ACCOUNTS_LOOKUP_PAGE_SIZE,
+    COL_HEADERS,
+    HUBS_CACHE_TTL,
+    SYNC_DEFAULT_WORKERS,
+)
 from connect.cli.plugins.exceptions import SheetNotFoundError
+from connect.cli.plugins.sheets import get_header_row
+from connect.cli.plugins.tables import open_session
 
 fields = (v.replace(' ', '_').lower() for v in COL_HEADERS.values())
 
 _RowData = namedtuple('RowData', fields)
 
+LOOKUP_FIELDS = ('id', 'external_id', 'external_uid')
+
+
+def _get_lookup_field(criteria):
+    return criteria if criteria in ('id', 'external_id') else 'external_uid'
+
+
+def _get_levels(rows):
+    # a row waits for the rows of the same sheet that create or update the account it uses as parent
+    providers = {}
+    for row_idx, (data, _) in rows.items():
+        for field in LOOKUP_FIELDS:
+            value = getattr(data, field)
+            if value:
+                providers.setdefault((field, str(value)), set()).add(row_idx)
+    remaining = {}
+    for row_idx, (data, _) in rows.items():
+        remaining[row_idx] = set()
+        if data.parent_search_criteria != '-' and data.parent_search_value:
+            key = (_get_lookup_field(data.parent_search_criteria), str(data.parent_search_value))
+            remaining[row_idx] = providers.get(key, set()) - {row_idx}
+    levels = []
+    while remaining:
+        level = sorted(row_idx for row_idx, parents in remaining.items() if not parents & remaining.keys())
+        if not level:
+            break
+        levels.append(level)
+        for row_idx in level:
+            del remaining[row_idx]
+    return levels, sorted(remaining)
+
 
 class CustomerSynchronizer:
-    def __init__(self, client, silent, account_id):
+    def __init__(self, client, silent, account_id, workers=SYNC_DEFAULT_WORKERS):
         self._client = client
         self._silent = silent
+        self._workers = workers
+        self._session = None
         self._wb = None
         self.account_id = account_id
         self.hubs = ['HB-0000-0000']
+        self._accounts = {field: {} for field in LOOKUP_FIELDS}
+        self._lookup_errors = {field: set() for field in LOOKUP_FIELDS}
+        self._indexed = {}
 
     def populate_hubs(self):
         if self.account_id.startswith('PA-'):
-            hubs = self._client.hubs.all()
+            hubs = get_cached_collection(self._client, 'hubs', HUBS_CACHE_TTL, self._client.hubs.all)
             for hub in hubs:
                 if hub['instance']['type'] != 'OA':
                     self.hubs.append(hub['id'])
@@ -44,181 +85,223 @@ class CustomerSynchronizer:
         self._validate_worksheet_sheet(ws)
 
     def save(self, output_file):
-        self._wb.save(output_file)
+        self._session.save(output_file)
 
     def _open_workbook(self, input_file):
-        try:
-            self._wb = load_workbook(
-                input_file,
-                data_only=True,
-            )
-        except InvalidFileException as ife:
-            raise ClickException(str(ife))
-        except BadZipFile:
-            raise ClickException(f'{input_file} is not a valid xlsx file.')
+        self._session = open_session(input_file)
+        self._wb = self._session.workbook
 
     @staticmethod
     def _validate_worksheet_sheet(ws):
-        cels = ws['A1': 'T1']
-        for cel in cels[0]:
-            if cel.value != COL_HEADERS[cel.column_letter]:
+        for letter, value in zip(COL_HEADERS.keys(), get_header_row(ws, len(COL_HEADERS))):
+            if value != COL_HEADERS[letter]:
                 raise ClickException(
-                    f'Column `{cel.coordinate}` must be {COL_HEADERS[cel.column_letter]}` '
-                    f'and is {cel.value} ',
+                    f'Column `{letter}1` must be {COL_HEADERS[letter]}` '
+                    f'and is {value} ',
                 )
 
-    def sync(self):  # noqa: CCR001
+    def sync(self):
         ws = self._wb['Customers']
+        patch = self._session.get_patch('Customers')
         errors = {}
         skipped_count = 0
-        created_items = []
-        updated_items = []
-        parent_uuid = {}
-        parent_external_id = {}
-        parent_id = []
+        created_count = 0
+        updated_count = 0
 
         self.populate_hubs()
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 21)])
-            row_indexes.set_description(
-                f'Processing item {data.id or data.external_id or data.external_uid}',
+        rows = [
+            (row_idx, _RowData(*values))
+            for row_idx, values in enumerate(
+                ws.iter_rows(min_row=2, max_col=len(_RowData._fields), values_only=True),
+                start=2,
             )
+        ]
+        self._load_accounts(rows)
+        progress = tqdm(
+            total=len(rows),
+            disable=self._silent,
+            leave=True,
+            bar_format=DEFAULT_BAR_FORMAT,
+        )
+        pending = {}
+        for row_idx, data in rows:
             if data.action == '-':
                 skipped_count += 1
+                progress.update()
                 continue
-            row_errors = self._validate_row(data)
+            row_errors = self._check_row(data)
             if row_errors:
                 errors[row_idx] = row_errors
+                progress.update()
                 continue
-            if data.parent_search_criteria and not data.parent_search_value:
-                errors[row_idx] = ["Parent search value is needed if criteria is set"]
-                continue
-            if data.hub_id and (data.hub_id != '' or data.hub_id != '-'):
-                if data.hub_id not in self.hubs:
-                    errors[row_idx] = [f"Accounts on hub {data.hub_id} can not be modified"]
-                    continue
-            name = f'{data.technical_contact_first_name} {data.technical_contact_last_name}'
-            model = {
-                "type": data.type,
-                "name": data.company_name if data.company_name else name,
-                "contact_info": {
-                    "address_line1": data.address_line_1,
-                    "address_line2": data.address_line_2,
-                    "city": data.city,
-                    "country": data.country,
-                    "postal_code": data.zip,
-                    "state": data.state,
-                    "contact": {
-                        "first_name": data.technical_contact_first_name,
-                        "last_name": data.technical_contact_last_name,
-                        "email": data.technical_contact_email,
-                    },
-                },
-            }
-            if data.external_id:
-                model['external_id'] = data.external_id
-            if data.external_uid:
-                model['external_uid'] = data.external_uid
-            else:
-                model['external_uid'] = str(uuid.uuid4())
-            if data.technical_contact_phone:
-                try:
-                    phone = phonenumbers.parse(data.technical_contact_phone, data.country)
-                    phone_number = {
-                        "country_code": f'+{str(phone.country_code)}',
-                        "area_code": '',
-                        "extension": str(phone.extension) if phone.extension else '-',
-                        'phone_number': str(phone.national_number),
-                    }
-                    model['contact_info']['contact']['phone_number'] = phone_number
-                except Exception:
-                    pass
-            if data.parent_search_criteria != '-':
-                model['parent'] = {}
-                if data.parent_search_criteria == 'id':
-                    if data.parent_search_value not in parent_id:
-                        try:
-                            pacc = self._client.ns('tier').accounts[data.parent_search_value].get()
-                            parent_id.append(pacc['id'])
-                        except ClientError:
-                            errors[row_idx] = [
-                                f'Parent with id {data.parent_search_value} does not exist',
-                            ]
-                            continue
-                    model['parent']['id'] = data.parent_search_value
-                elif data.parent_search_criteria == 'external_id':
-                    if data.parent_search_value not in parent_external_id:
-                        try:
-                            r = R().external_id.eq(str(data.parent_search_value))
-                            pacc = self._client.ns('tier').accounts.filter(r).all()
-                            pacc_count = pacc.count()
-                            if pacc_count == 0:
-                                errors[row_idx] = [
-                                    f'Parent with external_id {data.parent_search_value} not found',
-                                ]
-                                continue
-                            elif pacc_count > 1:
-                                errors[row_idx] = [
-                                    f'More than one Parent with external_id {data.parent_search_value}',
-                                ]
-                                continue
-                            parent_external_id[data.parent_search_value] = pacc[0]['id']
-                        except ClientError:
-                            errors[row_idx] = ['Error when obtaining parent data from Connect']
-                            continue
-                    model['parent']['id'] = parent_external_id[data.parent_search_value]
-                else:
-                    if data.parent_search_value not in parent_uuid:
-                        try:
-                            r = R().external_uid.eq(str(data.parent_search_value))
-                            pacc = self._client.ns('tier').accounts.filter(r).all()
-                            if pacc.count() == 0:
-                                errors[row_idx] = [
-                                    f'Parent with external_uid {data.parent_search_value} not found',
-                                ]
-                                continue
-                            elif pacc.count() > 1:
-                                errors[row_idx] = [
-                                    f'More than one Parent with external_uid {data.parent_search_value}',
-                                ]
-                                continue
-                            parent_uuid[data.parent_search_value] = pacc[0]['id']
-                        except ClientError:
-                            errors[row_idx] = ['Error when obtaining parent data from Connect']
-                            continue
-                    model['parent']['id'] = parent_uuid[data.parent_search_value]
-            if data.action == 'create':
-                try:
-                    account = self._client.ns('tier').accounts.create(model)
-                except ClientError as e:
-                    errors[row_idx] = [f'Error when creating account: {str(e)}']
-                    continue
-                created_items.append(account)
-                self._update_sheet_row(ws, row_idx, account)
-            else:
-                try:
-                    model['id'] = data.id
-                    account = self._client.ns('tier').accounts[data.id].update(model)
-                except ClientError as e:
-                    errors[row_idx] = [f'Error when updating account: {str(e)}']
-                    continue
-                updated_items.append(account)
-                self._update_sheet_row(ws, row_idx, account)
+            pending[row_idx] = (data, self._get_model(data))
+
+        levels, circular = _get_levels(pending)
+        for row_idx in circular:
+            errors[row_idx] = ['Circular reference between parent accounts']
+            progress.update()
+
+        executor = ThreadPoolExecutor(max_workers=self._workers) if self._workers > 1 else None
+        try:
+            for level_idx, level in enumerate(levels, start=1):
+                progress.set_description(f'Synchronizing level {level_idx} of {len(levels)}')
+                results = list(
+                    (executor.map if executor else map)(
+                        lambda row_idx: self._sync_row(*pending[row_idx]),
+                        level,
+                    ),
+                )
+                for row_idx, (account, row_error) in zip(level, results):
+                    progress.update()
+                    if row_error:
+                        errors[row_idx] = [row_error]
+                        continue
+                    if pending[row_idx][0].action == 'create':
+                        created_count += 1
+                    else:
+                        updated_count += 1
+                    self._index_account(account)
+                    self._update_sheet_row(patch, row_idx, account)
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            progress.close()
         return (
             skipped_count,
-            len(created_items),
-            len(updated_items),
+            created_count,
+            updated_count,
             errors,
         )
 
+    def _check_row(self, data):
+        row_errors = self._validate_row(data)
+        if row_errors:
+            return row_errors
+        if data.parent_search_criteria and not data.parent_search_value:
+            return ["Parent search value is needed if criteria is set"]
+        if data.hub_id and (data.hub_id != '' or data.hub_id != '-'):
+            if data.hub_id not in self.hubs:
+                return [f"Accounts on hub {data.hub_id} can not be modified"]
+
     @staticmethod
-    def _update_sheet_row(ws, row_idx, account):
-        ws.cell(row_idx, 1, value=account['id'])
-        ws.cell(row_idx, 3, value=account['external_uid'])
-        ws.cell(row_idx, 4, value='-')
+    def _get_model(data):
+        name = f'{data.technical_contact_first_name} {data.technical_contact_last_name}'
+        model = {
+            "type": data.type,
+            "name": data.company_name if data.company_name else name,
+            "contact_info": {
+                "address_line1": data.address_line_1,
+                "address_line2": data.address_line_2,
+                "city": data.city,
+                "country": data.country,
+                "postal_code": data.zip,
+                "state": data.state,
+                "contact": {
+                    "first_name": data.technical_contact_first_name,
+                    "last_name": data.technical_contact_last_name,
+                    "email": data.technical_contact_email,
+                },
+            },
+        }
+        if data.external_id:
+            model['external_id'] = data.external_id
+        if data.external_uid:
+            model['external_uid'] = data.external_uid
+        else:
+            model['external_uid'] = str(uuid.uuid4())
+        if data.technical_contact_phone:
+            try:
+                phone = phonenumbers.parse(data.technical_contact_phone, data.country)
+                phone_number = {
+                    "country_code": f'+{str(phone.country_code)}',
+                    "area_code": '',
+                    "extension": str(phone.extension) if phone.extension else '-',
+                    'phone_number': str(phone.national_number),
+                }
+                model['contact_info']['contact']['phone_number'] = phone_number
+            except Exception:
+                pass
+        return model
+
+    def _sync_row(self, data, model):
+        if data.parent_search_criteria != '-':
+            parent_id, parent_error = self._find_parent(
+                data.parent_search_criteria,
+                data.parent_search_value,
+            )
+            if parent_error:
+                return None, parent_error
+            model['parent'] = {'id': parent_id}
+        if data.action == 'create':
+            try:
+                return self._client.ns('tier').accounts.create(model), None
+            except ClientError as e:
+                return None, f'Error when creating account: {str(e)}'
+        try:
+            model['id'] = data.id
+            return self._client.ns('tier').accounts[data.id].update(model), None
+        except ClientError as e:
+            return None, f'Error when updating account: {str(e)}'
+
+    def _load_accounts(self, rows):
+        values = {field: set() for field in LOOKUP_FIELDS}
+        for _, data in rows:
+            if data.action not in ('create', 'update'):
+                continue
+            if data.action == 'update' and data.id:
+                values['id'].add(str(data.id))
+            if data.parent_search_criteria != '-' and data.parent_search_value:
+                values[_get_lookup_field(data.parent_search_criteria)].add(str(data.parent_search_value))
+        for field in LOOKUP_FIELDS:
+            self._resolve_accounts(field, sorted(values[field]))
+
+    def _resolve_accounts(self, field, values):
+        for idx in range(0, len(values), ACCOUNTS_LOOKUP_BATCH_SIZE):
+            batch = values[idx:idx + ACCOUNTS_LOOKUP_BATCH_SIZE]
+            query = R().n(field).in_(batch)
+            try:
+                accounts = list(
+                    self._client.ns('tier').accounts.filter(query).limit(ACCOUNTS_LOOKUP_PAGE_SIZE),
+                )
+            except ClientError:
+                self._lookup_errors[field].update(batch)
+                continue
+            for account in accounts:
+                self._index_account(account)
+
+    def _index_account(self, account):
+        account_id = account['id']
+        for field, value in self._indexed.get(account_id, {}).items():
+            account_ids = self._accounts[field][value]
+            account_ids.discard(account_id)
+            if not account_ids:
+                del self._accounts[field][value]
+        values = {field: str(account[field]) for field in LOOKUP_FIELDS if account.get(field)}
+        for field, value in values.items():
+            self._accounts[field].setdefault(value, set()).add(account_id)
+        self._indexed[account_id] = values
+
+    def _find_parent(self, criteria, value):
+        field = _get_lookup_field(criteria)
+        value = str(value)
+        account_ids = self._accounts[field].get(value, set())
+        if not account_ids and value in self._lookup_errors[field]:
+            return None, 'Error when obtaining parent data from Connect'
+        if field == 'id':
+            if not account_ids:
+                return None, f'Parent with id {value} does not exist'
+            return value, None
+        if not account_ids:
+            return None, f'Parent with {field} {value} not found'
+        if len(account_ids) > 1:
+            return None, f'More than one Parent with {field} {value}'
+        return next(iter(account_ids)), None
+
+    @staticmethod
+    def _update_sheet_row(patch, row_idx, account):
+        patch.cell(row_idx, 1, value=account['id'])
+        patch.cell(row_idx, 3, value=account['external_uid'])
+        patch.cell(row_idx, 4, value='-')
 
     def _validate_row(self, row):
         errors = []
@@ -254,11 +337,11 @@ class CustomerSynchronizer:
         if row.action == 'update' and not row.id.startswith('TA-'):
             errors.append('Update operation requires account ID to be set')
             return errors
-        if row.action == 'update':
-            try:
-                self._client.ns('tier').accounts[row.id].get()
-            except ClientError:
+        if row.action == 'update' and str(row.id) not in self._accounts['id']:
+            if str(row.id) in self._lookup_errors['id']:
+                errors.append('Error when obtaining account data from Connect')
+            else:
                 errors.append(
                     f'Account with id {row.id} does not exist',
                 )
-                return errors
+            return errors
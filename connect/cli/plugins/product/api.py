@@ -3,6 +3,7 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
+from connect.cli.core.cache.helpers import invalidate_cached_collection
 from connect.cli.core.http import handle_http_error
 from connect.client import ClientError, R
 
@@ -12,6 +13,7 @@ def create_unit(client, data):
         res = client.ns('settings').units.create(data)
     except ClientError as error:
         handle_http_error(error)
+    invalidate_cached_collection(client, 'settings/units')
     return res
 
 
@@ -25,6 +27,13 @@ def get_item(client, product_id, item_id):
     return res
 
 
+def get_items(client, product_id):
+    try:
+        return list(client.products[product_id].items.all())
+    except ClientError as error:
+        handle_http_error(error)
+
+
 def get_item_by_mpn(client, product_id, mpn):
     rql = R().mpn.eq(mpn)
 
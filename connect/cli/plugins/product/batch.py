@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import os
+import time
+from concurrent.futures import as_completed, ThreadPoolExecutor
+
+import click
+import requests
+from click import ClickException
+from requests.adapters import HTTPAdapter
+
+from connect.cli.core.scheduler import create_client
+from connect.cli.plugins.product.constants import BATCH_DEFAULT_WORKERS, MEDIA_DEFAULT_WORKERS
+from connect.cli.plugins.product.export import dump_product
+from connect.cli.plugins.product.media import MediaCache
+from connect.cli.plugins.tables import get_table_format
+from connect.client import ClientError
+
+
+class ClientPool:
+    def __init__(self, api_url, api_key, size, verbose=False):
+        self._api_url = api_url
+        self._api_key = api_key
+        self._verbose = verbose
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_client(self):
+        # clients keep the last response, so each thread gets its own one on top of the shared session
+        return create_client(self._api_key, self._api_url, verbose=self._verbose, session=self._session)
+
+    def close(self):
+        self._session.close()
+
+
+def get_product_ids(client, product_ids, query=None):
+    product_ids = list(product_ids)
+    if query:
+        try:
+            product_ids.extend(product['id'] for product in client.products.filter(query))
+        except ClientError as error:
+            raise ClickException(f'Cannot list the products matching the query: {error}')
+    return list(dict.fromkeys(product_ids))
+
+
+def _export_product(pool, product_id, options):
+    started_at = time.monotonic()
+    result = {'id': product_id, 'status': 'exported', 'output': None, 'error': None}
+    try:
+        result['output'] = dump_product(
+            options['api_url'],
+            options['api_key'],
+            product_id,
+            None,
+            True,
+            output_path=options['output_path'],
+            workers=options['collection_workers'],
+            media_workers=options['media_workers'],
+            output_format=options['output_format'],
+            client=pool.get_client(),
+            media_cache=options['media_cache'],
+        )
+    except ClickException as error:
+        result.update(status='failed', error=error.format_message())
+    except Exception as error:
+        result.update(status='failed', error=f'{error.__class__.__name__}: {error}')
+    result['duration'] = round(time.monotonic() - started_at, 3)
+    return result
+
+
+def _echo_result(result, done, total):
+    if result['status'] == 'exported':
+        click.echo(f"[{done}/{total}] {result['id']} exported to {result['output']}.")
+    else:
+        click.echo(click.style(f"[{done}/{total}] {result['id']} failed: {result['error']}", fg='red'))
+
+
+def export_products(
+    api_url,
+    api_key,
+    product_ids,
+    silent,
+    verbose=False,
+    query=None,
+    output_path=None,
+    workers=BATCH_DEFAULT_WORKERS,
+    collection_workers=1,
+    media_workers=MEDIA_DEFAULT_WORKERS,
+    media_cache_dir=None,
+    output_format='xlsx',
+):
+    started_at = time.monotonic()
+    media_cache = MediaCache(media_cache_dir) if media_cache_dir else None
+    options = {
+        'api_url': api_url,
+        'api_key': api_key,
+        'output_path': output_path,
+        'collection_workers': collection_workers,
+        'media_workers': media_workers,
+        'media_cache': media_cache,
+        'output_format': output_format,
+    }
+    with ClientPool(api_url, api_key, workers * collection_workers, verbose) as pool:
+        product_ids = get_product_ids(pool.get_client(), product_ids, query)
+        if not product_ids:
+            raise ClickException('No products to export.')
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_export_product, pool, product_id, options)
+                for product_id in product_ids
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result['id']] = result
+                if not silent:
+                    _echo_result(result, len(results), len(product_ids))
+
+    products = [results[product_id] for product_id in product_ids]
+    exported = sum(1 for result in products if result['status'] == 'exported')
+    return {
+        'total': len(products),
+        'exported': exported,
+        'failed': len(products) - exported,
+        'duration': round(time.monotonic() - started_at, 3),
+        'media_cache': {'hits': media_cache.hits, 'misses': media_cache.misses} if media_cache else None,
+        'products': products,
+    }
+
+
+def get_sync_inputs(input_dir):
+    inputs = []
+    for name in sorted(os.listdir(input_dir)):
+        path = os.path.join(input_dir, name)
+        if os.path.isfile(path):
+            if name.endswith('.xlsx') and not name.startswith('~$'):
+                inputs.append(path)
+        elif get_table_format(path):
+            inputs.append(path)
+        elif os.path.isfile(os.path.join(path, f'{name}.xlsx')):
+            inputs.append(os.path.join(path, f'{name}.xlsx'))
+    return inputs
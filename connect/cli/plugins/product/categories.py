@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import threading
+
+from connect.cli.core.cache.helpers import get_cached_collection
+from connect.cli.plugins.product.constants import CATEGORIES_CACHE_TTL
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+class CategoryIndex:
+    def __init__(self, client, ttl=CATEGORIES_CACHE_TTL):
+        self._client = client
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._categories = None
+        self._ids = None
+
+    @property
+    def categories(self):
+        self._load()
+        return self._categories
+
+    def get_id(self, name):
+        self._load()
+        return self._ids.get(name)
+
+    def _load(self):
+        with self._lock:
+            if self._categories is not None:
+                return
+            categories = get_cached_collection(
+                self._client,
+                'categories',
+                self._ttl,
+                self._fetch_categories,
+            )
+            self._ids = {}
+            for category in categories:
+                self._ids.setdefault(category['name'], category['id'])
+            self._categories = categories
+
+    def _fetch_categories(self):
+        return [
+            {'id': category['id'], 'name': category['name']}
+            for category in self._client.categories.all()
+        ]
+
+
+def get_category_index(client):
+    key = (client.endpoint, client.api_key)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = CategoryIndex(client)
+        return _indexes[key]
+
+
+def clear_category_indexes():
+    with _indexes_lock:
+        _indexes.clear()
@@ -4,26 +4,38 @@ from click import ClickException, echo as clickecho
 from fs.tempfs import TempFS
 from openpyxl import load_workbook
 
+from connect.cli.core.scheduler import create_client
+from connect.cli.plugins.product.categories import get_category_index
 from connect.cli.plugins.product.export import dump_product
 from connect.cli.plugins.product.sync import (
     ActionsSynchronizer,
+    AsyncMutationExecutor,
     CapabilitiesSynchronizer,
     GeneralSynchronizer,
     ItemSynchronizer,
     MediaSynchronizer,
     ParamsSynchronizer,
     TemplatesSynchronizer,
+    WorkbookSession,
 )
-from connect.client import ClientError, ConnectClient, RequestLogger
+from connect.client import ClientError, RequestLogger
 
 
 class ProductCloner:
-    def __init__(self, config, source_account, destination_account, product_id):
+    def __init__(
+        self,
+        config,
+        source_account,
+        destination_account,
+        product_id,
+        concurrency=None,
+    ):
         self.fs = TempFS(identifier=f'_clone_{product_id}')
         self.config = config
         self.source_account = (source_account if source_account else config.active.id)
         self.destination_account = (destination_account if destination_account else config.active.id)
         self.product_id = product_id
+        self.concurrency = concurrency
         self.destination_product = None
         self.wb = None
 
@@ -42,16 +54,25 @@ class ProductCloner:
         try:
             self.config.activate(self.destination_account)
             input_file = f'{self.fs.root_path}/{self.product_id}/{self.product_id}.xlsx'
-            client = ConnectClient(
-                api_key=self.config.active.api_key,
-                endpoint=self.config.active.endpoint,
-                use_specs=False,
-                max_retries=3,
-                logger=RequestLogger() if self.config.verbose else None,
+            client = create_client(
+                self.config.active.api_key,
+                self.config.active.endpoint,
+                verbose=self.config.verbose,
             )
+            session = WorkbookSession(input_file)
+            executor = None
+            if self.concurrency:
+                executor = AsyncMutationExecutor(
+                    self.config.active.api_key,
+                    self.config.active.endpoint,
+                    self.concurrency,
+                    logger=RequestLogger() if self.config.verbose else None,
+                )
             synchronizer = GeneralSynchronizer(
                 client,
                 self.config.silent,
+                session,
+                get_category_index(client),
             )
 
             synchronizer.open(input_file, 'General Information')
@@ -60,6 +81,8 @@ class ProductCloner:
             synchronizer = ItemSynchronizer(
                 client,
                 self.config.silent,
+                session,
+                executor,
             )
             product_id = synchronizer.open(input_file, 'Items')
             items = client.products[product_id].items.all()
@@ -70,6 +93,7 @@ class ProductCloner:
             synchronizer = CapabilitiesSynchronizer(
                 client,
                 self.config.silent,
+                session,
             )
             synchronizer.open(input_file, 'Capabilities')
             synchronizer.sync()
@@ -82,6 +106,8 @@ class ProductCloner:
             synchronizer = TemplatesSynchronizer(
                 client,
                 self.config.silent,
+                session,
+                executor,
             )
 
             synchronizer.open(input_file, 'Templates')
@@ -98,6 +124,8 @@ class ProductCloner:
             synchronizer = ParamsSynchronizer(
                 client,
                 self.config.silent,
+                session,
+                executor,
             )
 
             synchronizer.open(input_file, "Ordering Parameters")
@@ -113,6 +141,8 @@ class ProductCloner:
             synchronizer = ActionsSynchronizer(
                 client,
                 self.config.silent,
+                session,
+                executor,
             )
 
             synchronizer.open(input_file, 'Actions')
@@ -122,11 +152,13 @@ class ProductCloner:
             synchronizer = MediaSynchronizer(
                 client,
                 self.config.silent,
+                session,
             )
 
             synchronizer.open(input_file, 'Media')
             synchronizer.sync()
             clickecho('\n')
+            session.close()
 
             self.config.activate(self.source_account)
         except ClientError as e:
@@ -147,14 +179,12 @@ class ProductCloner:
         self.config.activate(self.destination_account)
 
         try:
-            client = ConnectClient(
-                api_key=self.config.active.api_key,
-                endpoint=self.config.active.endpoint,
-                use_specs=False,
-                max_retries=3,
-                logger=RequestLogger() if self.config.verbose else None,
+            client = create_client(
+                self.config.active.api_key,
+                self.config.active.endpoint,
+                verbose=self.config.verbose,
             )
-            category = self._get_cat_id(client, ws['B8'].value)
+            category = get_category_index(client).get_id(ws['B8'].value)
             product = client.products.create(
                 {
                     "name": name,
@@ -215,10 +245,3 @@ class ProductCloner:
             ws[f'A{row}'].value = ''
             ws[f'C{row}'].value = 'create'
         self.wb.save(f'{self.fs.root_path}/{self.product_id}/{self.product_id}.xlsx')
-
-    @staticmethod
-    def _get_cat_id(client, category_name):
-        categories = client.categories.all()
-        for category in categories:
-            if category['name'] == category_name:
-                return category['id']
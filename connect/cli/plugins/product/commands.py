@@ -3,26 +3,49 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
+import copy
+import json
+import os
+import time
+from concurrent.futures import as_completed, ThreadPoolExecutor
+
 import click
 from cmr import render
 
 from connect.cli.core.config import pass_config
+from connect.cli.core.scheduler import create_client
 from connect.cli.core.utils import continue_or_quit
 from connect.cli.plugins.exceptions import SheetNotFoundError
+from connect.cli.plugins.product.batch import ClientPool, export_products, get_sync_inputs
+from connect.cli.plugins.product.categories import get_category_index
 from connect.cli.plugins.product.clone import ProductCloner
+from connect.cli.plugins.product.constants import (
+    ASYNC_DEFAULT_HOST_LIMIT,
+    BATCH_DEFAULT_WORKERS,
+    DIFF_REPORT_VALUE_WIDTH,
+    MEDIA_CACHE_DIR,
+    MEDIA_DEFAULT_WORKERS,
+    SYNC_DEFAULT_WORKERS,
+    SYNC_ENDPOINT_LIMITS,
+)
 from connect.cli.plugins.product.export import dump_product
 from connect.cli.plugins.product.sync import (
     ActionsSynchronizer,
+    AsyncMutationExecutor,
     CapabilitiesSynchronizer,
     ConfigurationValuesSynchronizer,
     GeneralSynchronizer,
     ItemSynchronizer,
     MediaSynchronizer,
+    MutationExecutor,
+    open_session,
     ParamsSynchronizer,
     StaticResourcesSynchronizer,
+    SyncDiff,
     TemplatesSynchronizer,
 )
-from connect.client import ClientError, ConnectClient, R, RequestLogger
+from connect.cli.plugins.tables import get_table_format, TABLE_FORMATS
+from connect.client import ClientError, R, RequestLogger
 
 
 @click.group(name='product', short_help='Manage product definitions.')
@@ -66,12 +89,10 @@ def cmd_list_products(config, query, page_size, always_continue):
                 fg='blue',
             ),
         )
-    client = ConnectClient(
-        api_key=config.active.api_key,
-        endpoint=config.active.endpoint,
-        use_specs=False,
-        max_retries=3,
-        logger=RequestLogger() if config.verbose else None,
+    client = create_client(
+        config.active.api_key,
+        config.active.endpoint,
+        verbose=config.verbose,
     )
 
     if acc_id.startswith('VA'):
@@ -104,7 +125,7 @@ def cmd_list_products(config, query, page_size, always_continue):
     '-o',
     'output_file',
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
-    help='Output Excel file name.',
+    help='Output Excel file or table directory name.',
 )
 @click.option(
     '--output_path',
@@ -113,8 +134,54 @@ def cmd_list_products(config, query, page_size, always_continue):
     type=click.Path(exists=True, file_okay=False, dir_okay=True),
     help='Directory where to store the export.',
 )
+@click.option(
+    '--workers',
+    '-w',
+    'workers',
+    type=click.IntRange(1, 16),
+    default=1,
+    help='Number of product collections to fetch concurrently.',
+)
+@click.option(
+    '--media-workers',
+    '-m',
+    'media_workers',
+    type=click.IntRange(1, 16),
+    default=MEDIA_DEFAULT_WORKERS,
+    help='Number of media files to download concurrently.',
+)
+@click.option(
+    '--media-cache',
+    'media_cache',
+    is_flag=True,
+    help='Reuse media files downloaded by previous exports when they have not changed.',
+)
+@click.option(
+    '--incremental',
+    'incremental',
+    is_flag=True,
+    help='Update a previous export with the resources changed since it was made.',
+)
+@click.option(
+    '--format',
+    '-f',
+    'output_format',
+    type=click.Choice(('xlsx',) + TABLE_FORMATS),
+    default='xlsx',
+    help='Write an excel file or a directory with a table file per sheet.',
+)
 @pass_config
-def cmd_dump_products(config, product_id, output_file, output_path):
+def cmd_dump_products(
+    config,
+    product_id,
+    output_file,
+    output_path,
+    workers,
+    media_workers,
+    media_cache,
+    incremental,
+    output_format,
+):
     config.validate()
     acc_id = config.active.id
     acc_name = config.active.name
@@ -133,6 +200,11 @@ def cmd_dump_products(config, product_id, output_file, output_path):
         config.silent,
         config.verbose,
         output_path,
+        workers,
+        media_workers,
+        os.path.join(config.config_dir, MEDIA_CACHE_DIR) if media_cache else None,
+        incremental,
+        output_format,
     )
     if not config.silent:
         click.echo(
@@ -143,6 +215,122 @@ def cmd_dump_products(config, product_id, output_file, output_path):
         )
 
 
+@grp_product.command(
+    name='export-batch',
+    short_help='Export many products concurrently.',
+)
+@click.argument('product_ids', metavar='[product_id]...', nargs=-1)  # noqa: E304
+@click.option(
+    '--query',
+    '-q',
+    'query',
+    help='RQL query expression to select the products to export.',
+)
+@click.option(
+    '--output_path',
+    '-p',
+    'output_path',
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    help='Directory where to store the exports.',
+)
+@click.option(
+    '--workers',
+    '-w',
+    'workers',
+    type=click.IntRange(1, 32),
+    default=BATCH_DEFAULT_WORKERS,
+    help='Number of products to export concurrently.',
+)
+@click.option(
+    '--collection-workers',
+    'collection_workers',
+    type=click.IntRange(1, 16),
+    default=1,
+    help='Number of collections of each product to fetch concurrently.',
+)
+@click.option(
+    '--media-workers',
+    '-m',
+    'media_workers',
+    type=click.IntRange(1, 16),
+    default=MEDIA_DEFAULT_WORKERS,
+    help='Number of media files of each product to download concurrently.',
+)
+@click.option(
+    '--media-cache',
+    'media_cache',
+    is_flag=True,
+    help='Reuse media files downloaded by previous exports when they have not changed.',
+)
+@click.option(
+    '--format',
+    '-f',
+    'output_format',
+    type=click.Choice(('xlsx',) + TABLE_FORMATS),
+    default='xlsx',
+    help='Write an excel file or a directory with a table file per sheet.',
+)
+@click.option(
+    '--summary',
+    '-s',
+    'summary_file',
+    type=click.File('w'),
+    help='Write a JSON summary of the exports to this file (- for the standard output).',
+)
+@pass_config
+def cmd_dump_products_batch(
+    config,
+    product_ids,
+    query,
+    output_path,
+    workers,
+    collection_workers,
+    media_workers,
+    media_cache,
+    output_format,
+    summary_file,
+):
+    config.validate()
+    if not product_ids and not query:
+        raise click.UsageError('Provide at least one product id or a query.')
+    acc_id = config.active.id
+    acc_name = config.active.name
+    if not config.silent:
+        click.echo(
+            click.style(
+                f'Current active account: {acc_id} - {acc_name}\n',
+                fg='blue',
+            ),
+        )
+    summary = export_products(
+        config.active.endpoint,
+        config.active.api_key,
+        product_ids,
+        config.silent,
+        verbose=config.verbose,
+        query=query,
+        output_path=output_path,
+        workers=workers,
+        collection_workers=collection_workers,
+        media_workers=media_workers,
+        media_cache_dir=os.path.join(config.config_dir, MEDIA_CACHE_DIR) if media_cache else None,
+        output_format=output_format,
+    )
+    if summary_file:
+        json.dump(summary, summary_file, indent=4)
+        summary_file.write('\n')
+    if not config.silent:
+        click.echo(
+            click.style(
+                f"\n{summary['exported']} of {summary['total']} products exported "
+                f"in {summary['duration']} seconds.",
+                fg='green' if not summary['failed'] else 'yellow',
+            ),
+        )
+    if summary['failed']:
+        raise click.ClickException(f"{summary['failed']} products could not be exported.")
+
+
 @grp_product.command(
     name='sync',
     short_help='Synchronize a product from an excel file.',
@@ -155,13 +343,56 @@ def cmd_dump_products(config, product_id, output_file, output_path):
     is_flag=True,
     help='Answer yes to all questions.',
 )
+@click.option(
+    '--workers',
+    '-w',
+    'workers',
+    type=click.IntRange(1, 16),
+    default=SYNC_DEFAULT_WORKERS,
+    help='Number of create, update and delete requests to send concurrently.',
+)
+@click.option(
+    '--concurrency',
+    '-c',
+    'concurrency',
+    type=click.IntRange(1, 256),
+    help='Use the asyncio engine with up to this number of requests in flight.',
+)
+@click.option(
+    '--host-concurrency',
+    'host_concurrency',
+    type=click.IntRange(1, 256),
+    default=ASYNC_DEFAULT_HOST_LIMIT,
+    help='Maximum number of requests in flight to the same host with the asyncio engine.',
+)
+@click.option(
+    '--diff',
+    'diff',
+    is_flag=True,
+    help='Skip the rows to update whose values already match the ones in Connect.',
+)
+@click.option(
+    '--dry-run',
+    'dry_run',
+    is_flag=True,
+    help='Report the changes the synchronization would make without applying them.',
+)
 @pass_config
-def cmd_sync_products(config, input_file, yes):  # noqa: CCR001
+def cmd_sync_products(  # noqa: CCR001
+    config,
+    input_file,
+    yes,
+    workers,
+    concurrency,
+    host_concurrency,
+    diff,
+    dry_run,
+):
     config.validate()
     acc_id = config.active.id
     acc_name = config.active.name
 
-    if '.xlsx' not in input_file:
+    if '.xlsx' not in input_file and not get_table_format(input_file):
         input_file = f'{input_file}/{input_file}.xlsx'
 
     if not config.silent:
@@ -171,21 +402,33 @@ def cmd_sync_products(config, input_file, yes):  # noqa: CCR001
                 fg='blue',
             ),
         )
-    client = ConnectClient(
-        api_key=config.active.api_key,
-        endpoint=config.active.endpoint,
-        use_specs=False,
-        max_retries=3,
-        logger=RequestLogger() if config.verbose else None,
+    client = create_client(
+        config.active.api_key,
+        config.active.endpoint,
+        verbose=config.verbose,
     )
 
+    session = open_session(input_file)
+    if concurrency:
+        executor = AsyncMutationExecutor(
+            config.active.api_key,
+            config.active.endpoint,
+            concurrency,
+            host_limit=host_concurrency,
+            logger=RequestLogger() if config.verbose else None,
+        )
+    else:
+        executor = MutationExecutor(client, workers, SYNC_ENDPOINT_LIMITS)
+    sync_diff = SyncDiff(dry_run) if diff or dry_run else None
     synchronizer = GeneralSynchronizer(
         client,
         config.silent,
+        session,
+        get_category_index(client),
     )
     product_id = synchronizer.open(input_file, 'General Information')
 
-    if not yes:
+    if not (yes or dry_run):
         click.confirm(
             'Are you sure you want to synchronize '
             f'the product {product_id} ?',
@@ -193,143 +436,177 @@ def cmd_sync_products(config, input_file, yes):  # noqa: CCR001
         )
         click.echo('')
 
-    general_errors = synchronizer.sync()
-    if general_errors and not config.silent:
-        click.echo(
-            click.style(
-                f'\nError synchronizing general product information: {".".join(general_errors)}\n',
-                fg='magenta',
-            ),
-        )
-    results_tracker = []
-
-    try:
-        results_tracker.append(item_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
     try:
-        results_tracker.append(capabilities_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
+        general_errors = synchronizer.sync() if not dry_run else []
+        if general_errors and not config.silent:
             click.echo(
                 click.style(
-                    str(e),
-                    fg='blue',
+                    f'\nError synchronizing general product information: {".".join(general_errors)}\n',
+                    fg='magenta',
                 ),
             )
+        results_tracker = sync_sheets(client, config, session, executor, product_id, sync_diff, dry_run)
+    finally:
+        executor.close()
+        # the ids of the rows already synchronized are kept even if the command fails or is interrupted
+        if dry_run:
+            session.close()
+        else:
+            session.save()
+
+    if dry_run:
+        print_diff_report(
+            product_id=product_id,
+            silent=config.silent,
+            changes=sync_diff.changes,
+        )
+        return
 
-    try:
-        results_tracker.append(static_resources_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
+    print_results(
+        product_id=product_id,
+        silent=config.silent,
+        results_tracker=results_tracker,
+    )
 
-    try:
-        results_tracker.append(templates_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
 
-    results_tracker.append(
-        param_task(
-            client,
-            config,
-            input_file,
-            product_id,
-            'Ordering Parameters',
-        ),
-    )
-    results_tracker.append(
-        param_task(
-            client,
-            config,
-            input_file,
-            product_id,
-            'Fulfillment Parameters',
-        ),
-    )
-    results_tracker.append(
-        param_task(
-            client,
-            config,
-            input_file,
-            product_id,
-            'Configuration Parameters',
-        ),
-    )
+@grp_product.command(
+    name='sync-batch',
+    short_help='Synchronize many products concurrently.',
+)
+@click.argument(  # noqa: E304
+    'input_dir',
+    metavar='input_dir',
+    nargs=1,
+    required=True,
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+)
+@click.option(
+    '--yes',
+    '-y',
+    'yes',
+    is_flag=True,
+    help='Answer yes to all questions.',
+)
+@click.option(
+    '--workers',
+    '-w',
+    'workers',
+    type=click.IntRange(1, 32),
+    default=BATCH_DEFAULT_WORKERS,
+    help='Number of products to synchronize concurrently.',
+)
+@click.option(
+    '--request-workers',
+    'request_workers',
+    type=click.IntRange(1, 16),
+    default=SYNC_DEFAULT_WORKERS,
+    help='Number of create, update and delete requests of each product to send concurrently.',
+)
+@click.option(
+    '--diff',
+    'diff',
+    is_flag=True,
+    help='Skip the rows to update whose values already match the ones in Connect.',
+)
+@click.option(
+    '--dry-run',
+    'dry_run',
+    is_flag=True,
+    help='Report the changes the synchronization would make without applying them.',
+)
+@click.option(
+    '--report',
+    '-r',
+    'report_file',
+    type=click.File('w'),
+    help='Write a JSON report of the synchronizations to this file (- for the standard output).',
+)
+@pass_config
+def cmd_sync_products_batch(  # noqa: CCR001
+    config,
+    input_dir,
+    yes,
+    workers,
+    request_workers,
+    diff,
+    dry_run,
+    report_file,
+):
+    config.validate()
+    acc_id = config.active.id
+    acc_name = config.active.name
+    inputs = get_sync_inputs(input_dir)
+    if not inputs:
+        raise click.ClickException(f'No product workbooks or table directories found in {input_dir}.')
 
-    try:
-        results_tracker.append(
-            actions_sync(
-                client,
-                config,
-                input_file,
+    if not config.silent:
+        click.echo(
+            click.style(
+                f'Current active account: {acc_id} - {acc_name}\n',
+                fg='blue',
             ),
         )
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
-
-    try:
-        results_tracker.append(
-            media_sync(
-                client,
-                config,
-                input_file,
-            ),
+    if not (yes or dry_run):
+        click.confirm(
+            f'Are you sure you want to synchronize {len(inputs)} products ?',
+            abort=True,
         )
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
+        click.echo('')
 
-    try:
-        results_tracker.append(
-            config_values_sync(
-                client,
-                config,
-                input_file,
+    worker_config = copy.copy(config)
+    worker_config.silent = True
+    started_at = time.monotonic()
+    results = {}
+    with ClientPool(
+        config.active.endpoint,
+        config.active.api_key,
+        workers * request_workers,
+        config.verbose,
+    ) as pool:
+        with ThreadPoolExecutor(max_workers=workers) as pool_executor:
+            futures = [
+                pool_executor.submit(
+                    sync_batch_input,
+                    pool.get_client(),
+                    worker_config,
+                    input_file,
+                    request_workers,
+                    diff,
+                    dry_run,
+                )
+                for input_file in inputs
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result['input']] = result
+                if not config.silent:
+                    print_batch_result(result, len(results), len(inputs), dry_run)
+
+    products = [results[input_file] for input_file in inputs]
+    failed = sum(1 for result in products if result['status'] == 'failed')
+    errors = sum(result['errors'] for result in products)
+    report = {
+        'total': len(products),
+        'synchronized': len(products) - failed,
+        'failed': failed,
+        'errors': errors,
+        'dry_run': dry_run,
+        'duration': round(time.monotonic() - started_at, 3),
+        'products': products,
+    }
+    if report_file:
+        json.dump(report, report_file, indent=4, default=str)
+        report_file.write('\n')
+    if not config.silent:
+        click.echo(
+            click.style(
+                f"\n{report['synchronized']} of {report['total']} products synchronized "
+                f"with {errors} errors in {report['duration']} seconds.",
+                fg='green' if not (failed or errors) else 'yellow',
             ),
         )
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
-
-    print_results(
-        product_id=product_id,
-        silent=config.silent,
-        results_tracker=results_tracker,
-    )
+    if failed or errors:
+        raise click.ClickException(f'{failed} products failed and {errors} rows could not be synchronized.')
 
 
 @grp_product.command(
@@ -363,8 +640,23 @@ def cmd_sync_products(config, input_file, yes):  # noqa: CCR001
     is_flag=True,
     help='Answer yes to all questions.',
 )
+@click.option(
+    '--concurrency',
+    '-c',
+    'concurrency',
+    type=click.IntRange(1, 256),
+    help='Use the asyncio engine with up to this number of requests in flight.',
+)
 @pass_config
-def cmd_clone_products(config, source_product_id, source_account, destination_account, name, yes):
+def cmd_clone_products(
+    config,
+    source_product_id,
+    source_account,
+    destination_account,
+    name,
+    yes,
+    concurrency,
+):
     if name and len(name) > 32:
         click.echo(
             click.style(
@@ -398,12 +690,10 @@ def cmd_clone_products(config, source_product_id, source_account, destination_ac
             ),
         )
 
-    client = ConnectClient(
-        api_key=config.active.api_key,
-        endpoint=config.active.endpoint,
-        use_specs=False,
-        max_retries=3,
-        logger=RequestLogger() if config.verbose else None,
+    client = create_client(
+        config.active.api_key,
+        config.active.endpoint,
+        verbose=config.verbose,
     )
 
     if not yes:
@@ -430,7 +720,7 @@ def cmd_clone_products(config, source_product_id, source_account, destination_ac
         source_account=source_account,
         destination_account=destination_account,
         product_id=source_product_id,
-
+        concurrency=concurrency,
     )
 
     if not config.silent:
@@ -483,9 +773,221 @@ def cmd_clone_products(config, source_product_id, source_account, destination_ac
         )
 
 
-def param_task(client, config, input_file, product_id, param_type):
+def sync_batch_input(client, config, input_file, workers, diff, dry_run):
+    started_at = time.monotonic()
+    result = {
+        'input': input_file,
+        'product_id': None,
+        'status': 'synchronized',
+        'error': None,
+        'errors': 0,
+        'general_errors': [],
+        'modules': [],
+        'changes': [],
+    }
+    session = open_session(input_file)
     try:
-        result = params_sync(client, config, input_file, param_type)
+        sync_diff = SyncDiff(dry_run) if diff or dry_run else None
+        synchronizer = GeneralSynchronizer(
+            client,
+            config.silent,
+            session,
+            get_category_index(client),
+        )
+        result['product_id'] = synchronizer.open(input_file, 'General Information')
+        if not dry_run:
+            result['general_errors'] = synchronizer.sync()
+        with MutationExecutor(client, workers, SYNC_ENDPOINT_LIMITS) as executor:
+            result['modules'] = sync_sheets(
+                client,
+                config,
+                session,
+                executor,
+                result['product_id'],
+                sync_diff,
+                dry_run,
+            )
+        if dry_run:
+            result['changes'] = sync_diff.changes
+    except click.ClickException as error:
+        result.update(status='failed', error=error.format_message())
+    except Exception as error:
+        result.update(status='failed', error=f'{error.__class__.__name__}: {error}')
+    finally:
+        if dry_run:
+            session.close()
+        else:
+            try:
+                session.save()
+            except Exception as error:
+                result.update(status='failed', error=f'{error.__class__.__name__}: {error}')
+    result['errors'] = len(result['general_errors']) + sum(
+        len(module['errors']) for module in result['modules']
+    )
+    result['duration'] = round(time.monotonic() - started_at, 3)
+    return result
+
+
+def print_batch_result(result, done, total, dry_run=False):
+    name = result['product_id'] or result['input']
+    if result['status'] == 'failed':
+        click.echo(click.style(f'\n[{done}/{total}] {name} failed: {result["error"]}', fg='red'))
+        return
+    click.echo(click.style(f'\n[{done}/{total}] {name} ({result["input"]})', fg='blue'))
+    if result['general_errors']:
+        click.echo(
+            click.style(
+                f'\nError synchronizing general product information: {".".join(result["general_errors"])}\n',
+                fg='magenta',
+            ),
+        )
+    if dry_run:
+        print_diff_report(silent=False, product_id=name, changes=result['changes'])
+    else:
+        print_results(silent=False, product_id=name, results_tracker=result['modules'], interactive=False)
+
+
+def sync_sheets(client, config, session, executor, product_id, sync_diff=None, dry_run=False):  # noqa: CCR001
+    results_tracker = []
+
+    try:
+        results_tracker.append(item_sync(client, config, session, executor, sync_diff))
+    except SheetNotFoundError as e:
+        if not config.silent:
+            click.echo(
+                click.style(
+                    str(e),
+                    fg='blue',
+                ),
+            )
+    if not dry_run:
+        try:
+            results_tracker.append(capabilities_sync(client, config, session))
+        except SheetNotFoundError as e:
+            if not config.silent:
+                click.echo(
+                    click.style(
+                        str(e),
+                        fg='blue',
+                    ),
+                )
+
+        try:
+            results_tracker.append(static_resources_sync(client, config, session))
+        except SheetNotFoundError as e:
+            if not config.silent:
+                click.echo(
+                    click.style(
+                        str(e),
+                        fg='blue',
+                    ),
+                )
+
+    try:
+        results_tracker.append(templates_sync(client, config, session, executor, sync_diff))
+    except SheetNotFoundError as e:
+        if not config.silent:
+            click.echo(
+                click.style(
+                    str(e),
+                    fg='blue',
+                ),
+            )
+
+    results_tracker.append(
+        param_task(
+            client,
+            config,
+            session,
+            executor,
+            product_id,
+            'Ordering Parameters',
+            sync_diff,
+        ),
+    )
+    results_tracker.append(
+        param_task(
+            client,
+            config,
+            session,
+            executor,
+            product_id,
+            'Fulfillment Parameters',
+            sync_diff,
+        ),
+    )
+    results_tracker.append(
+        param_task(
+            client,
+            config,
+            session,
+            executor,
+            product_id,
+            'Configuration Parameters',
+            sync_diff,
+        ),
+    )
+
+    try:
+        results_tracker.append(
+            actions_sync(
+                client,
+                config,
+                session,
+                executor,
+                sync_diff,
+            ),
+        )
+    except SheetNotFoundError as e:
+        if not config.silent:
+            click.echo(
+                click.style(
+                    str(e),
+                    fg='blue',
+                ),
+            )
+
+    if not dry_run:
+        try:
+            results_tracker.append(
+                media_sync(
+                    client,
+                    config,
+                    session,
+                ),
+            )
+        except SheetNotFoundError as e:
+            if not config.silent:
+                click.echo(
+                    click.style(
+                        str(e),
+                        fg='blue',
+                    ),
+                )
+
+        try:
+            results_tracker.append(
+                config_values_sync(
+                    client,
+                    config,
+                    session,
+                ),
+            )
+        except SheetNotFoundError as e:
+            if not config.silent:
+                click.echo(
+                    click.style(
+                        str(e),
+                        fg='blue',
+                    ),
+                )
+
+    return results_tracker
+
+
+def param_task(client, config, session, executor, product_id, param_type, diff=None):
+    try:
+        result = params_sync(client, config, session, executor, param_type, diff)
     except SheetNotFoundError as e:
         if not config.silent:
             click.echo(
@@ -497,18 +999,17 @@ def param_task(client, config, input_file, product_id, param_type):
     return result
 
 
-def media_sync(client, config, input_file):
+def media_sync(client, config, session):
     synchronizer = MediaSynchronizer(
         client,
         config.silent,
+        session,
     )
 
-    synchronizer.open(input_file, 'Media')
+    synchronizer.open(session.input_file, 'Media')
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
-
     return {
         "module": "Media",
         "created": created,
@@ -519,13 +1020,16 @@ def media_sync(client, config, input_file):
     }
 
 
-def actions_sync(client, config, input_file):
+def actions_sync(client, config, session, executor, diff=None):
     synchronizer = ActionsSynchronizer(
         client,
         config.silent,
+        session,
+        executor,
+        diff,
     )
 
-    synchronizer.open(input_file, 'Actions')
+    synchronizer.open(session.input_file, 'Actions')
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
@@ -539,17 +1043,19 @@ def actions_sync(client, config, input_file):
     }
 
 
-def templates_sync(client, config, input_file):
+def templates_sync(client, config, session, executor, diff=None):
     synchronizer = TemplatesSynchronizer(
         client,
         config.silent,
+        session,
+        executor,
+        diff,
     )
 
-    synchronizer.open(input_file, 'Templates')
+    synchronizer.open(session.input_file, 'Templates')
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
     return {
         "module": "Templates",
         "created": created,
@@ -560,18 +1066,19 @@ def templates_sync(client, config, input_file):
     }
 
 
-def params_sync(client, config, input_file, param_type):
+def params_sync(client, config, session, executor, param_type, diff=None):
     synchronizer = ParamsSynchronizer(
         client,
         config.silent,
+        session,
+        executor,
+        diff,
     )
 
-    synchronizer.open(input_file, param_type)
+    synchronizer.open(session.input_file, param_type)
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
-
     return {
         "module": param_type,
         "created": created,
@@ -582,12 +1089,13 @@ def params_sync(client, config, input_file, param_type):
     }
 
 
-def static_resources_sync(client, config, input_file):
+def static_resources_sync(client, config, session):
     synchronizer = StaticResourcesSynchronizer(
         client,
         config.silent,
+        session,
     )
-    synchronizer.open(input_file, 'Embedding Static Resources')
+    synchronizer.open(session.input_file, 'Embedding Static Resources')
 
     skipped, created, deleted, errors = synchronizer.sync()
 
@@ -601,13 +1109,14 @@ def static_resources_sync(client, config, input_file):
     }
 
 
-def capabilities_sync(client, config, input_file):
+def capabilities_sync(client, config, session):
 
     synchronizer = CapabilitiesSynchronizer(
         client,
         config.silent,
+        session,
     )
-    synchronizer.open(input_file, 'Capabilities')
+    synchronizer.open(session.input_file, 'Capabilities')
 
     skipped, updated, errors = synchronizer.sync()
 
@@ -621,12 +1130,13 @@ def capabilities_sync(client, config, input_file):
     }
 
 
-def config_values_sync(client, config, input_file):
+def config_values_sync(client, config, session):
     synchronizer = ConfigurationValuesSynchronizer(
         client,
         config.silent,
+        session,
     )
-    synchronizer.open(input_file, 'Configuration')
+    synchronizer.open(session.input_file, 'Configuration')
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
@@ -640,16 +1150,18 @@ def config_values_sync(client, config, input_file):
     }
 
 
-def item_sync(client, config, input_file):
+def item_sync(client, config, session, executor, diff=None):
     synchronizer = ItemSynchronizer(
         client,
         config.silent,
+        session,
+        executor,
+        diff,
     )
-    synchronizer.open(input_file, 'Items')
+    synchronizer.open(session.input_file, 'Items')
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
     return {
         "module": "Items",
         "created": created,
@@ -664,6 +1176,7 @@ def print_results(  # noqa: CCR001
         silent,
         product_id,
         results_tracker,
+        interactive=True,
 ):
     if not silent:
         msg = f'''
@@ -695,12 +1208,14 @@ def print_results(  # noqa: CCR001
         )
 
         if errors > 0:
-            msg = f'\nSync operation had {errors} errors, do you want to see them?'
-            fg = 'yellow'
+            print_errors = True
+            if interactive:
+                msg = f'\nSync operation had {errors} errors, do you want to see them?'
+                fg = 'yellow'
 
-            click.echo(click.style(msg, fg=fg))
+                click.echo(click.style(msg, fg=fg))
 
-            print_errors = continue_or_quit()
+                print_errors = continue_or_quit()
 
             if print_errors:
                 for result in results_tracker:
@@ -715,5 +1230,49 @@ def print_results(  # noqa: CCR001
                             click.echo(' ')
 
 
+def _format_diff_value(value):
+    if value is None:
+        return '-'
+    value = str(value).replace('\n', ' ').replace('|', '\\|')
+    if len(value) > DIFF_REPORT_VALUE_WIDTH:
+        value = f'{value[:DIFF_REPORT_VALUE_WIDTH - 3]}...'
+    return value
+
+
+def print_diff_report(
+        silent,
+        product_id,
+        changes,
+):
+    if silent:
+        return
+    if not changes:
+        click.echo(
+            click.style(f'\nProduct {product_id} is up to date, nothing to synchronize.\n', fg='green'),
+        )
+        return
+    msg = f'''
+# Changes to synchronize {product_id}
+
+
+| Module | Row | Action | ID | Field | Current | New |
+|:--------|--------:|:--------|:--------|:--------|:--------|:--------|
+    '''
+    row = '|{worksheet}|{row}|{action}|{id}|{field}|{current}|{new}|\n'
+    for change in changes:
+        msg += row.format(
+            worksheet=change['worksheet'],
+            row=change['row'],
+            action=change['action'],
+            id=_format_diff_value(change['id']),
+            field=_format_diff_value(change['field']),
+            current=_format_diff_value(change['current']),
+            new=_format_diff_value(change['new']),
+        )
+    click.echo(
+        f'\n{render(msg)}\n',
+    )
+
+
 def get_group():
     return grp_product
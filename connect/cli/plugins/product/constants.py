@@ -133,3 +133,28 @@ CAPABILITIES = (
     'Tier Accounts Sync',
     'Administrative Hold',
 )
+
+MEDIA_CHUNK_SIZE = 64 * 1024
+MEDIA_DEFAULT_WORKERS = 4
+MEDIA_CACHE_DIR = 'media_cache'
+
+BATCH_DEFAULT_WORKERS = 4
+
+EXPORT_MANIFEST_VERSION = 1
+
+CATEGORIES_CACHE_TTL = 24 * 60 * 60
+UNITS_CACHE_TTL = 24 * 60 * 60
+
+SYNC_DEFAULT_WORKERS = 1
+SYNC_ENDPOINT_LIMITS = {
+    'items': 8,
+    'parameters': 8,
+    'templates': 4,
+    'actions': 4,
+}
+ASYNC_DEFAULT_HOST_LIMIT = 16
+ASYNC_MAX_RETRIES = 5
+ASYNC_BACKOFF_BASE = 1
+ASYNC_PERMIT_POLL_INTERVAL = 0.01
+
+DIFF_REPORT_VALUE_WIDTH = 40
@@ -5,15 +5,17 @@
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from urllib import parse
 
-import requests
 from click import ClickException
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.styles.colors import Color, WHITE
-from openpyxl.utils import quote_sheetname
+from openpyxl.utils import get_column_letter, quote_sheetname
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
 from openpyxl.worksheet.datavalidation import DataValidation
 from tqdm import trange
 
@@ -22,131 +24,120 @@ from connect.cli.core.http import (
     format_http_status,
     handle_http_error,
 )
-from connect.cli.plugins.product.constants import PARAM_TYPES
+from connect.cli.core.scheduler import create_client
+from connect.cli.plugins.product.categories import get_category_index
+from connect.cli.plugins.product.constants import MEDIA_DEFAULT_WORKERS, PARAM_TYPES
+from connect.cli.plugins.product.manifest import ExportManifest, get_manifest_path
+from connect.cli.plugins.product.media import MediaCache, MediaFetcher
 from connect.cli.plugins.product.utils import (
     get_col_headers_by_ws_type,
-    get_col_limit_by_ws_type,
     get_json_object_for_param,
 )
-from connect.client import ClientError, ConnectClient, R, RequestLogger
-
-
-def _setup_cover_sheet(ws, product, location, client, media_path):
-    ws.title = 'General Information'
-    ws.column_dimensions['A'].width = 50
-    ws.column_dimensions['B'].width = 180
-    ws.merge_cells('A1:B1')
-    cell = ws['A1']
-    cell.fill = PatternFill('solid', start_color=Color('1565C0'))
-    cell.font = Font(sz=24, color=WHITE)
-    cell.alignment = Alignment(horizontal='center', vertical='center')
-    cell.value = 'Product information'
-    for i in range(3, 13):
-        ws[f'A{i}'].font = Font(sz=12)
-        ws[f'B{i}'].font = Font(sz=12)
-    ws['A3'].value = 'Account ID'
-    ws['B3'].value = product['owner']['id']
-    ws['A4'].value = 'Account Name'
-    ws['B4'].value = product['owner']['name']
-    ws['A5'].value = 'Product ID'
-    ws['B5'].value = product['id']
-    ws['A6'].value = 'Product Name'
-    ws['B6'].value = product['name']
-    ws['A7'].value = 'Export datetime'
-    ws['B7'].value = datetime.now().isoformat()
-    ws['A8'].value = 'Product Category'
-    ws['B8'].value = product['category']['name']
-    ws['A9'].value = 'Product Icon file name'
-    ws['A9'].font = Font(sz=14)
-    ws['B9'].value = f'{product["id"]}.{product["icon"].split(".")[-1]}'
-    _dump_image(
+from connect.cli.plugins.sheets import (
+    add_named_styles,
+    get_sheet_writer,
+    open_workbook,
+    TOP_LEFT_STYLE,
+    WRAP_TEXT_STYLE,
+    write_row,
+)
+from connect.cli.plugins.tables import TableBook
+from connect.client import ClientError, R
+
+
+def _setup_cover_sheet(ws, product, location, categories, media_path, fetcher):
+    writer = get_sheet_writer(ws)
+    writer.set_widths({'A': 50, 'B': 180})
+    icon_file_name = f'{product["id"]}.{product["icon"].split(".")[-1]}'
+    fetcher.fetch(
         f'{location}{product["icon"]}',
-        f'{product["id"]}.{product["icon"].split(".")[-1]}',
-        media_path,
-    )
-    ws['A10'].value = 'Product Short Description'
-    ws['A10'].alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws['B10'].value = product['short_description']
-    ws['B10'].alignment = Alignment(
-        wrap_text=True,
-    )
-    ws['A11'].value = 'Product Detailed Description'
-    ws['A11'].alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws['B11'].value = product['detailed_description']
-    ws['B11'].alignment = Alignment(
-        wrap_text=True,
-    )
-    ws['A12'].value = 'Embedding description'
-    ws['B12'].value = product['customer_ui_settings']['description']
-    ws['B12'].alignment = Alignment(
-        wrap_text=True,
-    )
-    ws['A13'].value = 'Embedding getting started'
-    ws['B13'].value = product['customer_ui_settings']['getting_started']
-    ws['B13'].alignment = Alignment(
-        wrap_text=True,
-    )
+        os.path.join(media_path, icon_file_name),
+    )
+    font = Font(sz=12)
+    top_left = Alignment(horizontal='left', vertical='top')
+    wrap_text = Alignment(wrap_text=True)
+    rows = [
+        [
+            writer.cell(
+                'Product information',
+                fill=PatternFill('solid', start_color=Color('1565C0')),
+                font=Font(sz=24, color=WHITE),
+                alignment=Alignment(horizontal='center', vertical='center'),
+            ),
+        ],
+        [],
+    ]
+    for label, value in (
+        ('Account ID', product['owner']['id']),
+        ('Account Name', product['owner']['name']),
+        ('Product ID', product['id']),
+        ('Product Name', product['name']),
+        ('Export datetime', datetime.now().isoformat()),
+        ('Product Category', product['category']['name']),
+    ):
+        rows.append([writer.cell(label, font=font), writer.cell(value, font=font)])
+    rows.append([
+        writer.cell('Product Icon file name', font=Font(sz=14)),
+        writer.cell(icon_file_name, font=font),
+    ])
+    rows.append([
+        writer.cell('Product Short Description', font=font, alignment=top_left),
+        writer.cell(product['short_description'], font=font, alignment=wrap_text),
+    ])
+    rows.append([
+        writer.cell('Product Detailed Description', font=font, alignment=top_left),
+        writer.cell(product['detailed_description'], font=font, alignment=wrap_text),
+    ])
+    rows.append([
+        writer.cell('Embedding description', font=font),
+        writer.cell(product['customer_ui_settings']['description'], font=font, alignment=wrap_text),
+    ])
+    rows.append([
+        'Embedding getting started',
+        writer.cell(product['customer_ui_settings']['getting_started'], alignment=wrap_text),
+    ])
 
-    categories = client.categories.all()
     unassignable_cat = ['Cloud Services', 'All Categories']
-    categories_list = [
-        cat['name'] for cat in categories if cat['name'] not in unassignable_cat
+    categories_list = ['Categories'] + [
+        cat['name'] for cat in categories.categories if cat['name'] not in unassignable_cat
     ]
-    ws['AA1'].value = 'Categories'
-    cat_row_idx = 2
-    for cat in categories_list:
-        ws[f'AA{cat_row_idx}'].value = cat
-        cat_row_idx += 1
+    for row_idx in range(max(len(rows), len(categories_list))):
+        values = rows[row_idx] if row_idx < len(rows) else []
+        if row_idx < len(categories_list):
+            values = values + [None] * (26 - len(values)) + [categories_list[row_idx]]
+        writer.append(values)
+    writer.merge('A1:B1')
     categories_validation = DataValidation(
         type='list',
-        formula1=f'{quote_sheetname("General Information")}!$AA$2:$AA${len(categories_list)}',
+        formula1=f'{quote_sheetname("General Information")}!$AA$2:$AA${len(categories_list) - 1}',
         allow_blank=False,
     )
-    ws.add_data_validation(categories_validation)
-    categories_validation.add('B8')
-
-
-def _dump_image(image_location, image_name, media_path):
-    image = requests.get(image_location)
-    if image.status_code == 200:
-        with open(os.path.join(media_path, image_name), 'wb') as f:
-            f.write(image.content)
-    else:
-        raise ClickException(f"Error obtaining image from {image_location}")
+    writer.validate('B', categories_validation, 8)
+    writer.close()
 
 
 def _setup_ws_header(ws, ws_type=None):  # noqa: CCR001
     if not ws_type:
         ws_type = 'items'
 
-    color = Color('d3d3d3')
-    fill = PatternFill('solid', color)
-    cels = ws['A1': '{cell}1'.format(
-        cell=get_col_limit_by_ws_type(ws_type),
-    )]
     col_headers = get_col_headers_by_ws_type(ws_type)
-    for cel in cels[0]:
-        ws.column_dimensions[cel.column_letter].width = 25
-        ws.column_dimensions[cel.column_letter].auto_size = True
-        cel.fill = fill
-        cel.value = col_headers[cel.column_letter]
-        if ws_type == 'params' and cel.value == 'JSON Properties':
-            ws.column_dimensions[cel.column_letter].width = 100
-        elif ws_type == 'capabilities' and cel.value == 'Capability':
-            ws.column_dimensions[cel.column_letter].width = 50
-        elif ws_type == 'static_links' and cel.value == 'Url':
-            ws.column_dimensions[cel.column_letter].width = 100
+    widths = {}
+    for letter, header in col_headers.items():
+        widths[letter] = 25
+        if ws_type == 'params' and header == 'JSON Properties':
+            widths[letter] = 100
+        elif ws_type == 'capabilities' and header == 'Capability':
+            widths[letter] = 50
+        elif ws_type == 'static_links' and header == 'Url':
+            widths[letter] = 100
         elif ws_type == 'templates':
-            if cel.value == 'Content':
-                ws.column_dimensions[cel.column_letter].width = 100
-            if cel.value == 'Title':
-                ws.column_dimensions[cel.column_letter].width = 50
+            if header == 'Content':
+                widths[letter] = 100
+            if header == 'Title':
+                widths[letter] = 50
+    writer = get_sheet_writer(ws)
+    writer.write_header(list(col_headers.values()), widths)
+    return writer
 
 
 def _calculate_commitment(item):
@@ -178,181 +169,143 @@ def _calculate_commitment(item):
     return '-'
 
 
+_PARAM_STYLES = (TOP_LEFT_STYLE,) * 11 + (WRAP_TEXT_STYLE, TOP_LEFT_STYLE, TOP_LEFT_STYLE)
+_TEMPLATE_STYLES = (TOP_LEFT_STYLE,) * 5 + (WRAP_TEXT_STYLE, TOP_LEFT_STYLE, TOP_LEFT_STYLE)
+_STRUCTURED_CONFIGURATION_STYLES = (None,) * 8 + (WRAP_TEXT_STYLE,)
+
+
+def _get_param_row(param):
+    return [
+        param['id'],
+        param['name'],
+        '-',
+        param['title'],
+        param['description'],
+        param['phase'],
+        param['scope'],
+        param['type'],
+        param['constraints']['required'] if param['constraints']['required'] else '-',
+        param['constraints']['unique'] if param['constraints']['unique'] else '-',
+        param['constraints']['hidden'] if param['constraints']['hidden'] else '-',
+        get_json_object_for_param(param),
+        param['events']['created']['at'],
+        param['events'].get('updated', {}).get('at'),
+    ]
+
+
 def _fill_param_row(ws, row_idx, param):
-    ws.cell(row_idx, 1, value=param['id']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 2, value=param['name']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 3, value='-').alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 4, value=param['title']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 5, value=param['description']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 6, value=param['phase']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 7, value=param['scope']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 8, value=param['type']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 9,
-        value=param['constraints']['required'] if param['constraints']['required'] else '-',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 10,
-        value=param['constraints']['unique'] if param['constraints']['unique'] else '-',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 11,
-        value=param['constraints']['hidden'] if param['constraints']['hidden'] else '-',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 12,
-        value=get_json_object_for_param(param),
-    ).alignment = Alignment(
-        wrap_text=True,
-    )
-    ws.cell(
-        row_idx, 13, value=param['events']['created']['at'],
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 14, value=param['events'].get('updated', {}).get('at'),
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
+    write_row(ws, row_idx, _get_param_row(param), _PARAM_STYLES)
 
 
-def _fill_media_row(ws, row_idx, media, location, product, media_path):
-    ws.cell(row_idx, 1, value=media['position'])
-    ws.cell(row_idx, 2, value=media['id'])
-    ws.cell(row_idx, 3, value='-')
-    ws.cell(row_idx, 4, value=media['type'])
-    ws.cell(row_idx, 5, value=f'{media["id"]}.{media["thumbnail"].split(".")[-1]}')
-    _dump_image(
+def _get_media_row(media, location, media_path, fetcher):
+    file_name = f'{media["id"]}.{media["thumbnail"].split(".")[-1]}'
+    fetcher.fetch(
         f'{location}{media["thumbnail"]}',
-        f'{media["id"]}.{media["thumbnail"].split(".")[-1]}',
-        media_path,
-    )
-    ws.cell(row_idx, 6, value='-' if media['type'] == 'image' else media['url'])
+        os.path.join(media_path, file_name),
+    )
+    return [
+        media['position'],
+        media['id'],
+        '-',
+        media['type'],
+        file_name,
+        '-' if media['type'] == 'image' else media['url'],
+    ]
+
+
+def _get_template_row(template):
+    return [
+        template['id'],
+        template['title'],
+        '-',
+        template['scope'],
+        template['type'] if 'type' in template else 'fulfillment',
+        template['body'],
+        template['events']['created']['at'],
+        template['events'].get('updated', {}).get('at'),
+    ]
 
 
 def _fill_template_row(ws, row_idx, template):
-    ws.cell(row_idx, 1, value=template['id']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 2, value=template['title']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 3, value='-').alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 4, value=template['scope']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 5, value=template['type'] if 'type' in template else 'fulfillment',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 6, value=template['body']).alignment = Alignment(
-        wrap_text=True,
-    )
-    ws.cell(row_idx, 7, value=template['events']['created']['at']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 8, value=template['events'].get('updated', {}).get('at'),
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
+    write_row(ws, row_idx, _get_template_row(template), _TEMPLATE_STYLES)
+
+
+def _get_action_row(action):
+    return [
+        action['id'],
+        action['action'],
+        '-',
+        action['name'],
+        action['title'],
+        action['description'],
+        action['scope'],
+        action['events']['created']['at'],
+        action['events'].get('updated', {}).get('at'),
+    ]
 
 
 def _fill_action_row(ws, row_idx, action):
-    ws.cell(row_idx, 1, value=action['id'])
-    ws.cell(row_idx, 2, value=action['action'])
-    ws.cell(row_idx, 3, value='-')
-    ws.cell(row_idx, 4, value=action['name'])
-    ws.cell(row_idx, 5, value=action['title'])
-    ws.cell(row_idx, 6, value=action['description'])
-    ws.cell(row_idx, 7, value=action['scope'])
-    ws.cell(row_idx, 8, value=action['events']['created']['at'])
-    ws.cell(row_idx, 9, value=action['events'].get('updated', {}).get('at'))
+    write_row(ws, row_idx, _get_action_row(action))
 
 
-def _fill_configuration_row(ws, row_idx, configuration, conf_id):
-    ws.cell(row_idx, 1, value=conf_id)
-    ws.cell(row_idx, 2, value=configuration['parameter']['id'])
-    ws.cell(row_idx, 3, value=configuration['parameter']['scope'])
-    ws.cell(row_idx, 4, value='-')
-    ws.cell(row_idx, 5, value=configuration['item']['id'] if 'item' in configuration else '-')
-    ws.cell(row_idx, 6, value=configuration['item']['name'] if 'item' in configuration else '-')
-    ws.cell(row_idx, 7, value=configuration['marketplace']['id'] if 'marketplace' in configuration else '-')
-    ws.cell(row_idx, 8,
-            value=configuration['marketplace']['name'] if 'marketplace' in configuration else '-')
+def _get_configuration_row(configuration, conf_id):
     if 'structured_value' in configuration:
-        value = configuration['structured_value']
-        value = json.dumps(value, indent=4, sort_keys=True)
-        ws.cell(row_idx, 9, value=value).alignment = Alignment(wrap_text=True)
+        value = json.dumps(configuration['structured_value'], indent=4, sort_keys=True)
     elif 'value' in configuration:
-        ws.cell(row_idx, 9, value=configuration['value'])
+        value = configuration['value']
     else:
-        ws.cell(row_idx, 9, value='-')
+        value = '-'
+    return [
+        conf_id,
+        configuration['parameter']['id'],
+        configuration['parameter']['scope'],
+        '-',
+        configuration['item']['id'] if 'item' in configuration else '-',
+        configuration['item']['name'] if 'item' in configuration else '-',
+        configuration['marketplace']['id'] if 'marketplace' in configuration else '-',
+        configuration['marketplace']['name'] if 'marketplace' in configuration else '-',
+        value,
+    ]
 
 
-def _fill_item_row(ws, row_idx, item):
-    ws.cell(row_idx, 1, value=item['id'])
-    ws.cell(row_idx, 2, value=item['mpn'])
-    ws.cell(row_idx, 3, value='-')
-    ws.cell(row_idx, 4, value=item['display_name'])
-    ws.cell(row_idx, 5, value=item['description'])
-    ws.cell(row_idx, 6, value=item['type'])
-    ws.cell(row_idx, 7, value=item['precision'])
-    ws.cell(row_idx, 8, value=item['unit']['unit'])
+def _get_configuration_styles(configuration):
+    if 'structured_value' in configuration:
+        return _STRUCTURED_CONFIGURATION_STYLES
+    return None
+
+
+def _fill_configuration_row(ws, row_idx, configuration, conf_id):
+    write_row(
+        ws,
+        row_idx,
+        _get_configuration_row(configuration, conf_id),
+        _get_configuration_styles(configuration),
+    )
+
+
+def _get_item_row(item):
     period = item.get('period', 'monthly')
     if period.startswith('years_'):
         period = f'{period.rsplit("_")[-1]} years'
-    ws.cell(row_idx, 9, value=period)
-    ws.cell(row_idx, 10, value=_calculate_commitment(item))
-    ws.cell(row_idx, 11, value=item['status'])
-    ws.cell(row_idx, 12, value=item['events']['created']['at'])
-    ws.cell(row_idx, 13, value=item['events'].get('updated', {}).get('at'))
+    return [
+        item['id'],
+        item['mpn'],
+        '-',
+        item['display_name'],
+        item['description'],
+        item['type'],
+        item['precision'],
+        item['unit']['unit'],
+        period,
+        _calculate_commitment(item),
+        item['status'],
+        item['events']['created']['at'],
+        item['events'].get('updated', {}).get('at'),
+    ]
+
+
+def _fill_item_row(ws, row_idx, item):
+    write_row(ws, row_idx, _get_item_row(item))
 
 
 def _calculate_configuration_id(configuration):
@@ -369,13 +322,39 @@ def _calculate_configuration_id(configuration):
     return conf_id
 
 
-def _dump_actions(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'actions')
+def _get_collections(client, product_id):
+    product = client.products[product_id]
+    return {
+        'media': product.media.all(),
+        'templates': product.templates.all(),
+        'items': product.items.all(),
+        'ordering': product.parameters.filter(R().phase.eq('ordering')),
+        'fulfillment': product.parameters.filter(R().phase.eq('fulfillment')),
+        'configuration': product.parameters.filter(R().phase.eq('configuration')),
+        'actions': product.actions.all(),
+        'configurations': product.configurations.all(),
+    }
+
+
+def _fetch_collections(collections, workers):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            name: executor.submit(list, resources)
+            for name, resources in collections.items()
+        }
+    return {name: future.result() for name, future in futures.items()}
+
 
-    row_idx = 2
+def _count(resources):
+    if isinstance(resources, list):
+        return len(resources)
+    return resources.count()
 
-    actions = client.products[product_id].actions.all()
-    count = actions.count()
+
+def _dump_actions(ws, actions, silent):
+    writer = _setup_ws_header(ws, 'actions')
+
+    count = _count(actions)
 
     action_validation = DataValidation(
         type='list',
@@ -389,31 +368,25 @@ def _dump_actions(ws, client, product_id, silent):
         allow_blank=False,
     )
 
-    if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(scope_validation)
-
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
     for action in actions:
         progress.set_description(f'Processing action {action["id"]}')
         progress.update(1)
-        _fill_action_row(ws, row_idx, action)
-        action_validation.add(f'C{row_idx}')
-        scope_validation.add(f'G{row_idx}')
-        row_idx += 1
+        writer.append(
+            _get_action_row(action),
+            validations={'C': action_validation, 'G': scope_validation},
+        )
 
+    writer.close()
     progress.close()
     print()
 
 
-def _dump_configuration(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'configurations')
+def _dump_configuration(ws, configurations, silent):
+    writer = _setup_ws_header(ws, 'configurations')
 
-    row_idx = 2
-
-    configurations = client.products[product_id].configurations.all()
-    count = configurations.count()
+    count = _count(configurations)
 
     action_validation = DataValidation(
         type='list',
@@ -424,31 +397,27 @@ def _dump_configuration(ws, client, product_id, silent):
     if count == 0:
         return
 
-    ws.add_data_validation(action_validation)
-
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
     for configuration in configurations:
         conf_id = _calculate_configuration_id(configuration)
         progress.set_description(f'Processing parameter configuration {conf_id}')
         progress.update(1)
-        _fill_configuration_row(ws, row_idx, configuration, conf_id)
-        action_validation.add(f'D{row_idx}')
-        row_idx += 1
+        writer.append(
+            _get_configuration_row(configuration, conf_id),
+            _get_configuration_styles(configuration),
+            {'D': action_validation},
+        )
 
+    writer.close()
     progress.close()
     print()
 
 
-def _dump_parameters(ws, client, product_id, param_type, silent):
-    _setup_ws_header(ws, 'params')
-
-    rql = R().phase.eq(param_type)
-
-    row_idx = 2
+def _dump_parameters(ws, params, param_type, silent):
+    writer = _setup_ws_header(ws, 'params')
 
-    params = client.products[product_id].parameters.filter(rql)
-    count = params.count()
+    count = _count(params)
 
     if count == 0:
         # Product without params is strange, but may exist
@@ -480,39 +449,37 @@ def _dump_parameters(ws, client, product_id, param_type, silent):
         formula1='"True,-"',
         allow_blank=False,
     )
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(type_validation)
-    ws.add_data_validation(ordering_fulfillment_scope_validation)
-    ws.add_data_validation(configuration_scope_validation)
-    ws.add_data_validation(bool_validation)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
     for param in params:
         progress.set_description(f'Processing {param_type} parameter {param["id"]}')
         progress.update(1)
-        _fill_param_row(ws, row_idx, param)
-        action_validation.add(f'C{row_idx}')
         if param['phase'] == 'configuration':
-            configuration_scope_validation.add(f'G{row_idx}')
+            scope_validation = configuration_scope_validation
         else:
-            ordering_fulfillment_scope_validation.add(f'G{row_idx}')
-        type_validation.add(f'H{row_idx}')
-        bool_validation.add(f'I{row_idx}')
-        bool_validation.add(f'J{row_idx}')
-        bool_validation.add(f'K{row_idx}')
-        row_idx += 1
+            scope_validation = ordering_fulfillment_scope_validation
+        writer.append(
+            _get_param_row(param),
+            _PARAM_STYLES,
+            {
+                'C': action_validation,
+                'G': scope_validation,
+                'H': type_validation,
+                'I': bool_validation,
+                'J': bool_validation,
+                'K': bool_validation,
+            },
+        )
 
+    writer.close()
     progress.close()
     print()
 
 
-def _dump_media(ws, client, product_id, silent, media_location, media_path):
-    _setup_ws_header(ws, 'media')
-    row_idx = 2
-
-    medias = client.products[product_id].media.all()
-    count = medias.count()
+def _dump_media(ws, medias, silent, media_location, media_path, fetcher):
+    writer = _setup_ws_header(ws, 'media')
+    count = _count(medias)
     action_validation = DataValidation(
         type='list',
         formula1='"-,create,update,delete"',
@@ -523,26 +490,22 @@ def _dump_media(ws, client, product_id, silent, media_location, media_path):
         formula1='"image,video"',
         allow_blank=False,
     )
-    if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(type_validation)
-
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
     for media in medias:
         progress.set_description(f'Processing media {media["id"]}')
         progress.update(1)
-        _fill_media_row(ws, row_idx, media, media_location, product_id, media_path)
-        action_validation.add(f'C{row_idx}')
-        type_validation.add(f'D{row_idx}')
-        row_idx += 1
+        writer.append(
+            _get_media_row(media, media_location, media_path, fetcher),
+            validations={'C': action_validation, 'D': type_validation},
+        )
 
+    writer.close()
     progress.close()
     print()
 
 
 def _dump_external_static_links(ws, product, silent):
-    _setup_ws_header(ws, 'static_links')
-    row_idx = 2
+    writer = _setup_ws_header(ws, 'static_links')
     count = len(product['customer_ui_settings']['download_links'])
     count = count + len(product['customer_ui_settings']['documents'])
 
@@ -556,40 +519,31 @@ def _dump_external_static_links(ws, product, silent):
         formula1='"Download,Documentation"',
         allow_blank=False,
     )
-    if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(link_type)
-
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
     progress.set_description("Processing static links")
 
     for link in product['customer_ui_settings']['download_links']:
         progress.update(1)
-        ws.cell(row_idx, 1, value='Download')
-        ws.cell(row_idx, 2, value=link['title'])
-        ws.cell(row_idx, 3, value='-')
-        ws.cell(row_idx, 4, value=link['url'])
-        action_validation.add(f'C{row_idx}')
-        link_type.add(f'A{row_idx}')
-        row_idx += 1
+        writer.append(
+            ['Download', link['title'], '-', link['url']],
+            validations={'A': link_type, 'C': action_validation},
+        )
 
     for link in product['customer_ui_settings']['documents']:
         progress.update(1)
-        ws.cell(row_idx, 1, value='Documentation')
-        ws.cell(row_idx, 2, value=link['title'])
-        ws.cell(row_idx, 3, value='-')
-        ws.cell(row_idx, 4, value=link['url'])
-        action_validation.add(f'C{row_idx}')
-        link_type.add(f'A{row_idx}')
-        row_idx += 1
+        writer.append(
+            ['Documentation', link['title'], '-', link['url']],
+            validations={'A': link_type, 'C': action_validation},
+        )
 
+    writer.close()
     progress.close()
     print()
 
 
 def _dump_capabilities(ws, product, silent):  # noqa: CCR001
-    _setup_ws_header(ws, 'capabilities')
+    writer = _setup_ws_header(ws, 'capabilities')
     progress = trange(0, 1, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
     progress.set_description("Processing product capabilities")
     ppu = product['capabilities']['ppu']
@@ -618,126 +572,71 @@ def _dump_capabilities(ws, product, silent):  # noqa: CCR001
         formula1='"Disabled,1,2"',
         allow_blank=False,
     )
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(ppu_validation)
-    ws.add_data_validation(disabled_enabled)
-    ws.add_data_validation(tier_validation)
-
-    ws['A2'].value = 'Pay-as-you-go support and schema'
-    ws['B2'].value = '-'
-    ws['C2'].value = (ppu['schema'] if ppu else 'Disabled')
-    ppu_validation.add(ws['C2'])
-    ws['A3'].value = 'Pay-as-you-go dynamic items support'
-    ws['B3'].value = '-'
-    ws['C3'].value = (
-        'Enabled' if ppu and 'dynamic' in ppu and ppu['dynamic'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C3'])
-    ws['A4'].value = 'Pay-as-you-go future charges support'
-    ws['B4'].value = '-'
-    ws['C4'].value = (
-        'Enabled' if ppu and 'future' in ppu and ppu['future'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C4'])
-    ws['A5'].value = 'Consumption reporting for Reservation Items'
-    ws['B5'].value = '-'
-    ws['C5'].value = (
-        'Enabled' if capabilities['reservation']['consumption'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C5'])
 
-    progress.update(1)
-    progress.close()
-    print()
-
-    def _get_reporting_consumption(reservation_cap):
-        if 'consumption' in reservation_cap and reservation_cap['consumption']:
-            return 'Enabled'
-        return 'Disabled'
-
-    ws['C5'].value = _get_reporting_consumption(capabilities['reservation'])
-    disabled_enabled.add(ws['C5'])
-    ws['A6'].value = 'Dynamic Validation of the Draft Requests'
-    ws['B6'].value = '-'
-
-    def _get_dynamic_validation_draft(capabilities_cart):
-        if 'validation' in capabilities_cart and capabilities['cart']['validation']:
-            return 'Enabled'
-        return 'Disabled'
-    ws['C6'].value = _get_dynamic_validation_draft(capabilities['cart'])
-    disabled_enabled.add(ws['C6'])
-    ws['A7'].value = 'Dynamic Validation of the Inquiring Form'
-    ws['B7'].value = '-'
-
-    def _get_validation_inquiring(capabilities_inquiring):
-        if 'validation' in capabilities_inquiring and capabilities_inquiring['validation']:
-            return 'Enabled'
-        return 'Disabled'
-
-    ws['C7'].value = _get_validation_inquiring(capabilities['inquiring'])
-    disabled_enabled.add(ws['C7'])
-    ws['A8'].value = 'Reseller Authorization Level'
-    ws['B8'].value = '-'
+    def _is_enabled(value):
+        return 'Enabled' if value else 'Disabled'
 
     def _get_reseller_authorization_level(tiers):
         if tiers and 'configs' in tiers and tiers['configs']:
             return tiers['configs']['level']
         return 'Disabled'
 
-    ws['C8'].value = _get_reseller_authorization_level(tiers)
-    tier_validation.add(ws['C8'])
-    ws['A9'].value = 'Tier Accounts Sync'
-    ws['B9'].value = '-'
-    ws['C9'].value = (
-        'Enabled' if tiers and 'updates' in tiers and tiers['updates'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C9'])
-    ws['A10'].value = 'Administrative Hold'
-    ws['B10'].value = '-'
-
-    ws['A11'].value = 'Dynamic Validation of Tier Requests'
-    ws['B11'].value = '-'
-    ws['C11'].value = (
-        'Enabled' if capabilities['tiers']['validation'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C11'])
-    ws['A12'].value = 'Editable Ordering Parameters in Change Request'
-    ws['B12'].value = '-'
-    ws['C12'].value = (
-        'Enabled' if subscription['change']['editable_ordering_parameters'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C12'])
-    ws['A13'].value = 'Validation of Draft Change Request'
-    ws['B13'].value = '-'
-    ws['C13'].value = (
-        'Enabled' if 'validation' in change and change['validation'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C13'])
-    ws['A14'].value = 'Validation of inquiring form for Change Requests'
-    ws['B14'].value = '-'
-    ws['C14'].value = (
-        'Enabled' if 'inquiring_validation' in change and change['inquiring_validation'] else 'Disabled'
+    rows = (
+        ('Pay-as-you-go support and schema', ppu['schema'] if ppu else 'Disabled', ppu_validation),
+        (
+            'Pay-as-you-go dynamic items support',
+            _is_enabled(ppu and 'dynamic' in ppu and ppu['dynamic']),
+            disabled_enabled,
+        ),
+        (
+            'Pay-as-you-go future charges support',
+            _is_enabled(ppu and 'future' in ppu and ppu['future']),
+            disabled_enabled,
+        ),
+        (
+            'Consumption reporting for Reservation Items',
+            _is_enabled(capabilities['reservation'].get('consumption')),
+            disabled_enabled,
+        ),
+        (
+            'Dynamic Validation of the Draft Requests',
+            _is_enabled(capabilities['cart'].get('validation')),
+            disabled_enabled,
+        ),
+        (
+            'Dynamic Validation of the Inquiring Form',
+            _is_enabled(capabilities['inquiring'].get('validation')),
+            disabled_enabled,
+        ),
+        ('Reseller Authorization Level', _get_reseller_authorization_level(tiers), tier_validation),
+        ('Tier Accounts Sync', _is_enabled(tiers and 'updates' in tiers and tiers['updates']), disabled_enabled),
+        ('Administrative Hold', _is_enabled(subscription.get('hold')), disabled_enabled),
+        ('Dynamic Validation of Tier Requests', _is_enabled(tiers['validation']), disabled_enabled),
+        (
+            'Editable Ordering Parameters in Change Request',
+            _is_enabled(change['editable_ordering_parameters']),
+            disabled_enabled,
+        ),
+        ('Validation of Draft Change Request', _is_enabled(change.get('validation')), disabled_enabled),
+        (
+            'Validation of inquiring form for Change Requests',
+            _is_enabled(change.get('inquiring_validation')),
+            disabled_enabled,
+        ),
     )
-    disabled_enabled.add(ws['C14'])
-
-    def _get_administrative_hold(capabilities):
-        if 'hold' in capabilities['subscription'] and capabilities['subscription']['hold']:
-            return 'Enabled'
-        return 'Disabled'
+    for capability, value, value_validation in rows:
+        writer.append([capability, '-', value], validations={'C': value_validation})
+        if writer.row_idx < 11:
+            writer.validate('B', action_validation)
 
-    ws['C10'].value = _get_administrative_hold(capabilities)
-    disabled_enabled.add(ws['C10'])
-    idx = 2
-    while idx < 11:
-        action_validation.add(f'B{idx}')
-        idx = idx + 1
+    writer.close()
     progress.update(1)
+    progress.close()
+    print()
 
 
-def _dump_templates(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'templates')
-
-    row_idx = 2
+def _dump_templates(ws, templates, silent):
+    writer = _setup_ws_header(ws, 'templates')
 
     action_validation = DataValidation(
         type='list',
@@ -755,13 +654,7 @@ def _dump_templates(ws, client, product_id, silent):
         allow_blank=False,
     )
 
-    templates = client.products[product_id].templates.all()
-    count = templates.count()
-
-    if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(scope_validation)
-        ws.add_data_validation(type_validation)
+    count = _count(templates)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
@@ -769,23 +662,21 @@ def _dump_templates(ws, client, product_id, silent):
         progress.set_description(f'Processing template {template["id"]}')
         progress.update(1)
 
-        _fill_template_row(ws, row_idx, template)
-        action_validation.add(f'C{row_idx}')
-        scope_validation.add(f'D{row_idx}')
-        type_validation.add(f'E{row_idx}')
-        row_idx += 1
+        writer.append(
+            _get_template_row(template),
+            _TEMPLATE_STYLES,
+            {'C': action_validation, 'D': scope_validation, 'E': type_validation},
+        )
 
+    writer.close()
     progress.close()
     print()
 
 
-def _dump_items(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'items')
-
-    row_idx = 2
+def _dump_items(ws, items, product_id, silent):
+    writer = _setup_ws_header(ws, 'items')
 
-    items = client.products[product_id].items.all()
-    count = items.count()
+    count = _count(items)
 
     if count == 0:
         raise ClickException(f'The product {product_id} doesn\'t have items.')
@@ -818,30 +709,173 @@ def _dump_items(ws, client, product_id, silent):
         allow_blank=False,
     )
 
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(type_validation)
-    ws.add_data_validation(period_validation)
-    ws.add_data_validation(precision_validation)
-    ws.add_data_validation(commitment_validation)
-
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
     for item in items:
         progress.set_description(f'Processing item {item["id"]}')
         progress.update(1)
-        _fill_item_row(ws, row_idx, item)
-        action_validation.add(f'C{row_idx}')
-        type_validation.add(f'F{row_idx}')
-        precision_validation.add(f'G{row_idx}')
-        period_validation.add(f'I{row_idx}')
-        commitment_validation.add(f'J{row_idx}')
-        row_idx += 1
+        writer.append(
+            _get_item_row(item),
+            validations={
+                'C': action_validation,
+                'F': type_validation,
+                'G': precision_validation,
+                'I': period_validation,
+                'J': commitment_validation,
+            },
+        )
 
+    writer.close()
     progress.close()
     print()
 
 
-def dump_product(api_url, api_key, product_id, output_file, silent, verbose=False, output_path=None):  # noqa: CCR001
+def _fill_configuration_resource_row(ws, row_idx, configuration):
+    _fill_configuration_row(ws, row_idx, configuration, _calculate_configuration_id(configuration))
+
+
+def _get_resource_id(name, resource):
+    if name == 'configurations':
+        return _calculate_configuration_id(resource)
+    return resource['id']
+
+
+_INCREMENTAL_COLLECTIONS = {
+    'templates': ('Templates', _fill_template_row),
+    'items': ('Items', _fill_item_row),
+    'ordering': ('Ordering Parameters', _fill_param_row),
+    'fulfillment': ('Fulfillment Parameters', _fill_param_row),
+    'configuration': ('Configuration Parameters', _fill_param_row),
+    'actions': ('Actions', _fill_action_row),
+    'configurations': ('Configuration', _fill_configuration_resource_row),
+}
+
+
+def _replace_sheet(wb, title):
+    idx = wb.sheetnames.index(title)
+    wb.remove(wb[title])
+    return wb.create_sheet(title, idx)
+
+
+def _copy_validations(ws, src_row, dst_row):
+    for validation in ws.data_validations.dataValidation:
+        for col_idx in range(1, ws.max_column + 1):
+            letter = get_column_letter(col_idx)
+            if f'{letter}{src_row}' in validation.sqref:
+                validation.add(f'{letter}{dst_row}')
+
+
+def _delete_row(ws, row_idx):
+    ws.delete_rows(row_idx)
+    for validation in list(ws.data_validations.dataValidation):
+        ranges = []
+        for cell_range in validation.sqref.ranges:
+            min_row = cell_range.min_row - 1 if cell_range.min_row > row_idx else cell_range.min_row
+            max_row = cell_range.max_row - 1 if cell_range.max_row >= row_idx else cell_range.max_row
+            if min_row <= max_row:
+                ranges.append(
+                    CellRange(
+                        min_col=cell_range.min_col,
+                        min_row=min_row,
+                        max_col=cell_range.max_col,
+                        max_row=max_row,
+                    ),
+                )
+        if ranges:
+            validation.sqref = MultiCellRange(ranges)
+        else:
+            ws.data_validations.dataValidation.remove(validation)
+
+
+def _track_collections(manifest, collections):
+    for name in _INCREMENTAL_COLLECTIONS.keys():
+        manifest.reset(name)
+        for row_idx, resource in enumerate(collections[name], start=2):
+            manifest.track(name, _get_resource_id(name, resource), row_idx, resource)
+
+
+def _get_changed_collections(collections, manifest, workers):
+    changed = {}
+    for name in _INCREMENTAL_COLLECTIONS.keys():
+        mark = manifest.get_mark(name)
+        changed[name] = collections[name]
+        if mark:
+            changed[name] = changed[name].filter(
+                R().events.updated.at.ge(mark) | R().events.created.at.ge(mark),
+            )
+    return _fetch_collections(changed, workers)
+
+
+def _patch_collection(ws, name, resources, changed, manifest):
+    _, fill_row = _INCREMENTAL_COLLECTIONS[name]
+    rows = manifest.get_rows(name)
+    updated = added = deleted = 0
+    for resource in changed:
+        resource_id = _get_resource_id(name, resource)
+        row_idx = rows.get(resource_id)
+        if row_idx is None:
+            row_idx = len(rows) + 2
+            _copy_validations(ws, row_idx - 1, row_idx)
+            added += 1
+        else:
+            updated += 1
+        fill_row(ws, row_idx, resource)
+        manifest.track(name, resource_id, row_idx, resource)
+
+    if _count(resources) != len(rows):
+        remote_ids = {_get_resource_id(name, resource) for resource in resources}
+        for resource_id in sorted(set(rows) - remote_ids, key=rows.get, reverse=True):
+            _delete_row(ws, manifest.remove(name, resource_id))
+            deleted += 1
+    return updated, added, deleted
+
+
+def _patch_collections(wb, collections, manifest, workers, silent):
+    changed = _get_changed_collections(collections, manifest, workers)
+    for name, (title, _) in _INCREMENTAL_COLLECTIONS.items():
+        updated, added, deleted = _patch_collection(
+            wb[title],
+            name,
+            collections[name],
+            changed[name],
+            manifest,
+        )
+        if not silent:
+            print(f'{title}: {updated} updated, {added} added, {deleted} deleted.')
+
+
+def _open_incremental_workbook(output_file, product_id):
+    manifest_path = get_manifest_path(output_file)
+    manifest = ExportManifest.load(manifest_path, product_id)
+    if not (manifest and os.path.isfile(output_file)):
+        return None, ExportManifest(manifest_path, product_id)
+    wb = open_workbook(output_file)
+    titles = [title for title, _ in _INCREMENTAL_COLLECTIONS.values()]
+    titles += ['General Information', 'Capabilities', 'Embedding Static Resources', 'Media']
+    if not all(title in wb.sheetnames for title in titles):
+        return None, ExportManifest(manifest_path, product_id)
+    return wb, manifest
+
+
+def dump_product(  # noqa: CCR001
+    api_url,
+    api_key,
+    product_id,
+    output_file,
+    silent,
+    verbose=False,
+    output_path=None,
+    workers=1,
+    media_workers=MEDIA_DEFAULT_WORKERS,
+    media_cache_dir=None,
+    incremental=False,
+    output_format='xlsx',
+    client=None,
+    media_cache=None,
+):
+    if incremental and output_format != 'xlsx':
+        raise ClickException('Incremental exports are only supported for xlsx files.')
+
     if not output_path:
         output_path = os.path.join(os.getcwd(), product_id)
     else:
@@ -854,7 +888,10 @@ def dump_product(api_url, api_key, product_id, output_file, silent, verbose=Fals
     media_path = os.path.join(output_path, 'media')
 
     if not output_file:
-        output_file = os.path.join(output_path, f'{product_id}.xlsx')
+        if output_format == 'xlsx':
+            output_file = os.path.join(output_path, f'{product_id}.xlsx')
+        else:
+            output_file = os.path.join(output_path, f'{product_id}_{output_format}')
     else:
         output_file = os.path.join(output_path, output_file)
 
@@ -868,62 +905,92 @@ def dump_product(api_url, api_key, product_id, output_file, silent, verbose=Fals
     if not os.path.exists(media_path):
         os.mkdir(media_path)
     try:
-        client = ConnectClient(
-            api_key=api_key,
-            endpoint=api_url,
-            use_specs=False,
-            max_retries=3,
-            logger=RequestLogger() if verbose else None,
-        )
+        if client is None:
+            client = create_client(
+                api_key,
+                api_url,
+                verbose=verbose,
+            )
         product = client.products[product_id].get()
-        wb = Workbook()
-        connect_api_location = parse.urlparse(api_url)
-        media_location = f'{connect_api_location.scheme}://{connect_api_location.netloc}'
-        _setup_cover_sheet(
-            wb.active,
-            product,
-            media_location,
-            client,
-            media_path,
-        )
-
-        _dump_capabilities(wb.create_sheet('Capabilities'), product, silent)
-        _dump_external_static_links(wb.create_sheet('Embedding Static Resources'), product, silent)
-        _dump_media(
-            wb.create_sheet('Media'),
-            client,
-            product_id,
-            silent,
-            media_location,
-            media_path,
-        )
-        _dump_templates(wb.create_sheet('Templates'), client, product_id, silent)
-        _dump_items(wb.create_sheet('Items'), client, product_id, silent)
-        _dump_parameters(
-            wb.create_sheet('Ordering Parameters'),
-            client,
-            product_id,
-            'ordering',
-            silent,
-        )
-        _dump_parameters(
-            wb.create_sheet('Fulfillment Parameters'),
-            client,
-            product_id,
-            'fulfillment',
-            silent,
-        )
-        _dump_parameters(
-            wb.create_sheet('Configuration Parameters'),
-            client,
-            product_id,
-            'configuration',
-            silent,
-        )
-        _dump_actions(wb.create_sheet('Actions'), client, product_id, silent)
-        _dump_configuration(wb.create_sheet('Configuration'), client, product_id, silent)
+        wb = manifest = None
+        if incremental:
+            wb, manifest = _open_incremental_workbook(output_file, product_id)
+        cache = media_cache
+        if cache is None and media_cache_dir:
+            cache = MediaCache(media_cache_dir)
+        with MediaFetcher(workers=media_workers, cache=cache) as fetcher:
+            patch = wb is not None
+            if patch:
+                add_named_styles(wb)
+                create_sheet = partial(_replace_sheet, wb)
+            else:
+                if output_format == 'xlsx':
+                    wb = Workbook(write_only=True)
+                else:
+                    wb = TableBook(output_file, output_format)
+                create_sheet = wb.create_sheet
+            connect_api_location = parse.urlparse(api_url)
+            media_location = f'{connect_api_location.scheme}://{connect_api_location.netloc}'
+            _setup_cover_sheet(
+                create_sheet('General Information'),
+                product,
+                media_location,
+                get_category_index(client),
+                media_path,
+                fetcher,
+            )
 
-        wb.save(output_file)
+            _dump_capabilities(create_sheet('Capabilities'), product, silent)
+            _dump_external_static_links(create_sheet('Embedding Static Resources'), product, silent)
+            collections = _get_collections(client, product_id)
+            if patch:
+                collections['media'] = list(collections['media'])
+            elif workers > 1 or incremental:
+                collections = _fetch_collections(collections, workers)
+
+            _dump_media(
+                create_sheet('Media'),
+                collections['media'],
+                silent,
+                media_location,
+                media_path,
+                fetcher,
+            )
+            if patch:
+                _patch_collections(wb, collections, manifest, workers, silent)
+            else:
+                _dump_templates(wb.create_sheet('Templates'), collections['templates'], silent)
+                _dump_items(wb.create_sheet('Items'), collections['items'], product_id, silent)
+                _dump_parameters(
+                    wb.create_sheet('Ordering Parameters'),
+                    collections['ordering'],
+                    'ordering',
+                    silent,
+                )
+                _dump_parameters(
+                    wb.create_sheet('Fulfillment Parameters'),
+                    collections['fulfillment'],
+                    'fulfillment',
+                    silent,
+                )
+                _dump_parameters(
+                    wb.create_sheet('Configuration Parameters'),
+                    collections['configuration'],
+                    'configuration',
+                    silent,
+                )
+                _dump_actions(wb.create_sheet('Actions'), collections['actions'], silent)
+                _dump_configuration(wb.create_sheet('Configuration'), collections['configurations'], silent)
+
+            fetcher.wait()
+            wb.save(output_file)
+            if incremental:
+                if not patch:
+                    _track_collections(manifest, collections)
+                manifest.save()
+
+        if cache and not silent:
+            print(f'Media cache: {cache.hits} hits, {cache.misses} misses.')
 
     except ClientError as error:
         status = format_http_status(error.status_code)
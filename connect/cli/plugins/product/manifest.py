@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import json
+import os
+
+from connect.cli.plugins.product.constants import EXPORT_MANIFEST_VERSION
+
+
+def get_manifest_path(output_file):
+    return f'{os.path.splitext(output_file)[0]}.manifest.json'
+
+
+def get_resource_mark(resource):
+    events = resource.get('events', {})
+    return events.get('updated', {}).get('at') or events.get('created', {}).get('at')
+
+
+class ExportManifest:
+    def __init__(self, path, product_id, collections=None):
+        self.path = path
+        self.product_id = product_id
+        self.collections = collections or {}
+
+    @classmethod
+    def load(cls, path, product_id):
+        if not os.path.isfile(path):
+            return
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data['version'] != EXPORT_MANIFEST_VERSION or data['product_id'] != product_id:
+                return
+            return cls(path, product_id, data['collections'])
+        except (ValueError, KeyError, TypeError):
+            return
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump(
+                {
+                    'version': EXPORT_MANIFEST_VERSION,
+                    'product_id': self.product_id,
+                    'collections': self.collections,
+                },
+                f,
+                sort_keys=True,
+                indent=4,
+            )
+
+    def get_mark(self, name):
+        return self.collections.get(name, {}).get('updated_at')
+
+    def get_rows(self, name):
+        return self.collections.setdefault(name, {'updated_at': None, 'rows': {}})['rows']
+
+    def reset(self, name):
+        self.collections[name] = {'updated_at': None, 'rows': {}}
+
+    def track(self, name, resource_id, row_idx, resource):
+        collection = self.collections.setdefault(name, {'updated_at': None, 'rows': {}})
+        collection['rows'][resource_id] = row_idx
+        mark = get_resource_mark(resource)
+        if mark and (not collection['updated_at'] or mark > collection['updated_at']):
+            collection['updated_at'] = mark
+
+    def remove(self, name, resource_id):
+        rows = self.collections[name]['rows']
+        removed_idx = rows.pop(resource_id)
+        for other_id, row_idx in rows.items():
+            if row_idx > removed_idx:
+                rows[other_id] = row_idx - 1
+        return removed_idx
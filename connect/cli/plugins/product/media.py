@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from click import ClickException
+from requests.adapters import HTTPAdapter
+
+from connect.cli.plugins.product.constants import MEDIA_CHUNK_SIZE, MEDIA_DEFAULT_WORKERS
+
+
+class MediaCache:
+    def __init__(self, cache_dir):
+        self._blobs_path = os.path.join(cache_dir, 'blobs')
+        self._index_path = os.path.join(cache_dir, 'index.json')
+        self._lock = threading.Lock()
+        self._index = {}
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self._blobs_path, exist_ok=True)
+        if os.path.isfile(self._index_path):
+            try:
+                with open(self._index_path, 'r') as f:
+                    self._index = json.load(f)
+            except ValueError:
+                self._index = {}
+
+    def get_validators(self, url):
+        entry = self._index.get(url)
+        if not entry or not self._is_valid(entry):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def restore(self, url, path):
+        entry = self._index[url]
+        if os.path.exists(path):
+            os.remove(path)
+        try:
+            os.link(self._get_blob_path(entry['digest']), path)
+        except OSError:
+            shutil.copyfile(self._get_blob_path(entry['digest']), path)
+        with self._lock:
+            self.hits += 1
+
+    def store(self, url, headers, path, digest):
+        blob_path = self._get_blob_path(digest)
+        if not os.path.isfile(blob_path):
+            try:
+                os.link(path, blob_path)
+            except OSError:
+                shutil.copyfile(path, blob_path)
+        with self._lock:
+            self.misses += 1
+            self._index[url] = {
+                'digest': digest,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'size': os.path.getsize(path),
+            }
+
+    def save(self):
+        with self._lock:
+            with open(self._index_path, 'w') as f:
+                json.dump(self._index, f, sort_keys=True, indent=4)
+
+    def _is_valid(self, entry):
+        blob_path = self._get_blob_path(entry['digest'])
+        if not os.path.isfile(blob_path) or os.path.getsize(blob_path) != entry['size']:
+            return False
+        digest = hashlib.sha256()
+        with open(blob_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(MEDIA_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest() == entry['digest']
+
+    def _get_blob_path(self, digest):
+        return os.path.join(self._blobs_path, digest)
+
+
+class MediaFetcher:
+    def __init__(self, workers=MEDIA_DEFAULT_WORKERS, session=None, cache=None):
+        self._session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures = []
+        self._cache = cache
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type:
+            for future in self._futures:
+                future.cancel()
+        self.close()
+
+    def fetch(self, url, path):
+        self._futures.append(self._executor.submit(self._download, url, path))
+
+    def wait(self):
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+        if self._cache:
+            self._cache.save()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def _download(self, url, path):
+        headers = self._cache.get_validators(url) if self._cache else {}
+        with self._session.get(url, headers=headers, stream=True) as response:
+            if headers and response.status_code == 304:
+                self._cache.restore(url, path)
+                return
+            if response.status_code != 200:
+                raise ClickException(f'Error obtaining image from {url}')
+            if os.path.exists(path):
+                # the file may be hard-linked to a cached copy
+                os.remove(path)
+            digest = hashlib.sha256()
+            with open(path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=MEDIA_CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+            if self._cache:
+                self._cache.store(url, response.headers, path, digest.hexdigest())
@@ -7,3 +7,7 @@ from connect.cli.plugins.product.sync.media import MediaSynchronizer  # noqa: F4
 from connect.cli.plugins.product.sync.params import ParamsSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.static_resources import StaticResourcesSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.templates import TemplatesSynchronizer  # noqa: F401
+from connect.cli.plugins.sheets import WorkbookSession  # noqa: F401
+from connect.cli.plugins.tables import open_session  # noqa: F401
+from connect.cli.plugins.product.sync.executor import AsyncMutationExecutor, MutationExecutor  # noqa: F401
+from connect.cli.plugins.product.sync.diff import SyncDiff  # noqa: F401
@@ -6,13 +6,10 @@
 import re
 from collections import namedtuple
 
-from tqdm import trange
-
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.cli.plugins.product.constants import (
     ACTIONS_HEADERS,
 )
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.client import ClientError
 
 fields = (v.replace(' ', '_').lower() for v in ACTIONS_HEADERS.values())
@@ -24,16 +21,12 @@ class ActionsSynchronizer(ProductSynchronizer):
 
     def sync(self):  # noqa: CCR001
         ws = self._wb["Actions"]
+        patch = self._get_patch("Actions")
         errors = {}
         skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 10)])
+        processed = {'create': [], 'update': [], 'delete': []}
+        row_indexes = self._iter_rows(ws, _RowData)
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing action {data.verbose_id or data.id}')
             if data.action == '-':
                 skipped_count += 1
@@ -45,15 +38,8 @@ class ActionsSynchronizer(ProductSynchronizer):
                 continue
 
             if data.action == 'delete':
-                try:
-                    self._client.products[self._product_id].actions[data.verbose_id].delete()
-                    deleted_items.append(data)
-                except ClientError as e:
-                    if e.status_code == 404:
-                        deleted_items.append(data)
-                        continue
-                    errors[row_idx] = [str(e)]
-                    continue
+                self._submit(row_idx, 'delete', data, 'actions', self._delete_action, data.verbose_id)
+                continue
 
             payload = {
                 "action": data.id,
@@ -65,35 +51,58 @@ class ActionsSynchronizer(ProductSynchronizer):
             }
 
             if data.action == 'update':
-                try:
-                    action = self._client.products[self._product_id].actions[
-                        data.verbose_id
-                    ].update(payload)
-                    updated_items.append(action)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
+                if self._is_unchanged(
+                    row_idx,
+                    data.verbose_id,
+                    payload,
+                    collection=self._client.products[self._product_id].actions,
+                ):
+                    skipped_count += 1
+                    continue
+                self._submit(
+                    row_idx,
+                    'update',
+                    data,
+                    'actions',
+                    self._update_action,
+                    data.verbose_id,
+                    payload,
+                )
 
             if data.action == 'create':
-                try:
-                    action = self._client.products[self._product_id].actions.create(payload)
-                    self._update_sheet_row(ws, row_idx, action)
-                    created_items.append(action)
-                except ClientError as e:
-                    errors[row_idx] = [str(e)]
+                self._submit(row_idx, 'create', data, 'actions', self._create_action, payload)
 
+        self._collect_results(patch, processed, errors)
         return (
             skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            len(processed['create']),
+            len(processed['update']),
+            len(processed['delete']),
             errors,
         )
 
+    def _apply_result(self, patch, row_idx, action, result, original):
+        if action == 'create':
+            self._update_sheet_row(patch, row_idx, result)
+
+    def _create_action(self, client, payload):
+        return client.products[self._product_id].actions.create(payload)
+
+    def _update_action(self, client, action_id, payload):
+        return client.products[self._product_id].actions[action_id].update(payload)
+
+    def _delete_action(self, client, action_id):
+        try:
+            yield client.products[self._product_id].actions[action_id].delete()
+        except ClientError as e:
+            if e.status_code != 404:
+                raise
+
     @staticmethod
-    def _update_sheet_row(ws, row_idx, action):
-        ws.cell(row_idx, 1, value=action['id'])
-        ws.cell(row_idx, 8, value=action['events']['created']['at'])
-        ws.cell(row_idx, 9, value=action['events'].get('updated', {}).get('at'))
+    def _update_sheet_row(patch, row_idx, action):
+        patch.cell(row_idx, 1, value=action['id'])
+        patch.cell(row_idx, 8, value=action['events']['created']['at'])
+        patch.cell(row_idx, 9, value=action['events'].get('updated', {}).get('at'))
 
     @staticmethod
     def _validate_row(data):
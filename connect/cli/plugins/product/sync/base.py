@@ -3,26 +3,34 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
-from zipfile import BadZipFile
-
 from click import ClickException
-from openpyxl import load_workbook
-from openpyxl.utils.exceptions import InvalidFileException
 
 from connect.cli.plugins.exceptions import SheetNotFoundError
+from connect.cli.plugins.product.sync.executor import MutationExecutor
 from connect.cli.plugins.product.utils import (
     get_col_headers_by_ws_type,
     get_col_limit_by_ws_type,
     get_ws_type_by_worksheet_name,
 )
+from connect.cli.plugins.sheets import get_header_row, iter_rows
+from connect.cli.plugins.tables import open_session
 
 
 class ProductSynchronizer:
-    def __init__(self, client, silent):
+    def __init__(self, client, silent, session=None, executor=None, diff=None):
         self._client = client
         self._silent = silent
+        self._executor = executor or MutationExecutor(client)
+        self._diff = diff
+        self._dry_run = diff is not None and diff.dry_run
+        self._remote = None
+        self._planned = []
+        self._session = session
+        self._shared_session = session is not None
         self._product_id = None
+        self._worksheet = None
         self._wb = None
+        self._pending_rows = {}
 
     def open(self, input_file, worksheet):
         self._open_workbook(input_file)
@@ -36,34 +44,82 @@ class ProductSynchronizer:
         self._validate_worksheet_sheet(ws, worksheet)
 
         self._product_id = product_id
+        self._worksheet = worksheet
         return self._product_id
 
     def sync(self):
         raise NotImplementedError("Not implemented")
 
     def save(self, output_file):
-        self._wb.save(output_file)
+        self._session.save(output_file)
 
     def _open_workbook(self, input_file):
-        try:
-            self._wb = load_workbook(
-                input_file,
-                data_only=True,
-            )
-        except InvalidFileException as ife:
-            raise ClickException(str(ife))
-        except BadZipFile:
-            raise ClickException(f'{input_file} is not a valid xlsx file.')
+        if not self._shared_session:
+            self._session = open_session(input_file)
+        self._wb = self._session.workbook
+
+    def _iter_rows(self, ws, row_type):
+        return iter_rows(ws, row_type, self._silent)
+
+    def _get_patch(self, worksheet):
+        return self._session.get_patch(worksheet)
+
+    def _get_remote(self, collection, object_id):
+        if self._remote is None:
+            self._remote = {obj['id']: obj for obj in collection.all()}
+        return self._remote.get(object_id)
+
+    def _is_unchanged(self, row_idx, object_id, payload, current=None, collection=None):
+        if self._diff is None:
+            return False
+        if current is None and collection is not None:
+            current = self._get_remote(collection, object_id)
+        if current is None:
+            self._diff.add(self._worksheet, row_idx, 'update', object_id)
+            return False
+        return not self._diff.compare(self._worksheet, row_idx, object_id, current, payload)
+
+    def _submit(self, row_idx, action, original, endpoint, fn, *args):
+        if self._dry_run:
+            if action != 'update':
+                object_id = self._get_object_id(original) if action == 'delete' else None
+                self._diff.add(self._worksheet, row_idx, action, object_id)
+            self._planned.append((action, original))
+            return
+        self._pending_rows[row_idx] = (action, original)
+        self._executor.submit(row_idx, endpoint, fn, *args)
+
+    @staticmethod
+    def _get_object_id(original):
+        if isinstance(original, dict):
+            return original['id']
+        return getattr(original, 'verbose_id', original.id)
+
+    def _collect_results(self, patch, processed, errors):
+        planned, self._planned = self._planned, []
+        for action, original in planned:
+            processed[action].append(original)
+        for row_idx, result, error in self._executor.results():
+            action, original = self._pending_rows.pop(row_idx)
+            if error:
+                errors[row_idx] = [str(error)]
+                continue
+            processed[action].append(original if action == 'delete' else result)
+            self._apply_result(patch, row_idx, action, result, original)
+
+    def _apply_result(self, patch, row_idx, action, result, original):
+        if action != 'delete':
+            self._update_sheet_row(patch, row_idx, result)
 
     @staticmethod
     def _validate_worksheet_sheet(ws, worksheet):
         ws_type = get_ws_type_by_worksheet_name(worksheet)
         max_letter = get_col_limit_by_ws_type(ws_type)
         col_headers = get_col_headers_by_ws_type(ws_type)
-        cels = ws['A1': f'{max_letter}1']
-        for cel in cels[0]:
-            if cel.value != col_headers[cel.column_letter]:
+        letters = [letter for letter in col_headers.keys() if letter <= max_letter]
+        for letter, value in zip(letters, get_header_row(ws, len(letters))):
+            if value != col_headers[letter]:
                 raise ClickException(
-                    f'Invalid input file: column {cel.column_letter} '
-                    f'must be {col_headers[cel.column_letter]}',
+                    f'Invalid input file: column {letter} '
+                    f'must be {col_headers[letter]}',
                 )
@@ -1,6 +1,5 @@
 from collections import namedtuple
-
-from tqdm import trange
+from copy import deepcopy
 
 from connect.cli.plugins.product.constants import (
     CAPABILITIES,
@@ -8,7 +7,6 @@ from connect.cli.plugins.product.constants import (
 )
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.cli.plugins.product.utils import cleanup_product_for_update
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 
 
 fields = (v.replace(' ', '_').lower() for v in CAPABILITIES_COLS_HEADERS.values())
@@ -21,13 +19,12 @@ class CapabilitiesSynchronizer(ProductSynchronizer):
         ws = self._wb['Capabilities']
         errors = {}
         skipped_count = 0
-        updated_items = []
+        updated_items = {}
+        original = None
+        product = None
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 4)])
+        row_indexes = self._iter_rows(ws, _RowData)
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing Product capabilities {data.capability}')
             if data.action == '-':
                 skipped_count += 1
@@ -38,166 +35,178 @@ class CapabilitiesSynchronizer(ProductSynchronizer):
                 errors[row_idx] = row_errors
                 continue
 
-            product = cleanup_product_for_update(self._client.products[self._product_id].get())
+            if product is None:
+                original = cleanup_product_for_update(self._client.products[self._product_id].get())
+                product = deepcopy(original)
 
             if data.action == 'update':
-                update = True
                 try:
-                    if data.capability == 'Pay-as-you-go support and schema':
-                        if data.value != 'Disabled':
-                            if not product['capabilities']['ppu']:
-                                product['capabilities']['ppu'] = {
-                                    'schema': data.value,
-                                    'dynamic': False,
-                                    'future': False,
-                                }
-                            else:
-                                product['capabilities']['ppu']['schema'] = data.value
-                        else:
-                            product['capabilities']['ppu'] = None
-                    if data.capability == 'Pay-as-you-go dynamic items support':
-                        if not product['capabilities']['ppu']:
-                            if data.value == 'Enabled':
-                                raise Exception(
-                                    "Dynamic items support can't be enabled without Pay-as-you-go "
-                                    "support",
-                                )
-                            update = False
-                        else:
-                            if data.value == 'Enabled':
-                                product['capabilities']['ppu']['dynamic'] = True
-                            else:
-                                product['capabilities']['ppu']['dynamic'] = False
-                    if data.capability == "Pay-as-you-go future charges support":
-                        if not product['capabilities']['ppu']:
-                            if data.value == 'Enabled':
-                                raise Exception(
-                                    "Report of future charges can't be enabled without Pay-as-you-go "
-                                    "support",
-                                )
-                            update = False
-
-                        else:
-                            if data.value == 'Enabled':
-                                product['capabilities']['ppu']['future'] = True
-                            else:
-                                product['capabilities']['ppu']['future'] = False
-                    if data.capability == 'Consumption reporting for Reservation Items':
-                        if data.value == 'Enabled':
-                            product['capabilities']['reservation']['consumption'] = True
-                        else:
-                            product['capabilities']['reservation']['consumption'] = False
-
-                    if data.capability == 'Dynamic Validation of the Draft Requests':
-                        if data.value == 'Enabled':
-                            product['capabilities']['cart']['validation'] = True
-                        else:
-                            product['capabilities']['cart']['validation'] = False
-
-                    if data.capability == 'Dynamic Validation of the Inquiring Form':
-                        if data.value == 'Enabled':
-                            product['capabilities']['inquiring']['validation'] = True
-                        else:
-                            product['capabilities']['inquiring']['validation'] = False
-
-                    if data.capability == 'Reseller Authorization Level':
-                        if data.value == 'Disabled':
-                            product['capabilities']['tiers']['configs'] = None
-                        else:
-                            product['capabilities']['tiers']['configs'] = {
-                                'level': data.value,
-                            }
-                    if data.capability == 'Tier Accounts Sync':
-                        if data.value == 'Enabled':
-                            product['capabilities']['tiers']['updates'] = True
-                        else:
-                            product['capabilities']['tiers']['updates'] = False
-                    if data.capability == 'Administrative Hold':
-                        if data.value == 'Enabled':
-                            product['capabilities']['subscription']['hold'] = True
-                        else:
-                            product['capabilities']['subscription']['hold'] = False
-                    if data.capability == 'Dynamic Validation of Tier Requests':
-                        if data.value == 'Enabled':
-                            product['capabilities']['tiers']['validation'] = True
-                        else:
-                            product['capabilities']['tiers']['validation'] = False
-                    if data.capability == 'Editable Ordering Parameters in Change Request':
-                        if data.value == 'Enabled':
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'editable_ordering_parameters'
-                            ] = True
-                        else:
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'editable_ordering_parameters'
-                            ] = False
-                    if data.capability == 'Validation of Draft Change Request':
-                        if data.value == 'Enabled':
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'validation'
-                            ] = True
-                        else:
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'validation'
-                            ] = False
-                    if data.capability == 'Validation of inquiring form for Change Requests':
-                        if data.value == 'Enabled':
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'inquiring_validation'
-                            ] = True
-                        else:
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'inquiring_validation'
-                            ] = False
-                    if update:
-                        self._client.products[self._product_id].update(product)
-                    updated_items.append(data.capability)
-
+                    updated = deepcopy(product)
+                    self._apply_row(updated, data)
+                    product = updated
+                    updated_items[row_idx] = data.capability
                 except Exception as e:
                     errors[row_idx] = [str(e)]
 
+        if product != original:
+            try:
+                self._client.products[self._product_id].update(product)
+            except Exception as e:
+                for row_idx in updated_items:
+                    errors[row_idx] = [str(e)]
+                updated_items = {}
+
         return (
             skipped_count,
             len(updated_items),
             errors,
         )
 
+    @staticmethod
+    def _apply_row(product, data):  # noqa: CCR001
+        if data.capability == 'Pay-as-you-go support and schema':
+            if data.value != 'Disabled':
+                if not product['capabilities']['ppu']:
+                    product['capabilities']['ppu'] = {
+                        'schema': data.value,
+                        'dynamic': False,
+                        'future': False,
+                    }
+                else:
+                    product['capabilities']['ppu']['schema'] = data.value
+            else:
+                product['capabilities']['ppu'] = None
+        if data.capability == 'Pay-as-you-go dynamic items support':
+            if not product['capabilities']['ppu']:
+                if data.value == 'Enabled':
+                    raise Exception(
+                        "Dynamic items support can't be enabled without Pay-as-you-go "
+                        "support",
+                    )
+                return
+            else:
+                if data.value == 'Enabled':
+                    product['capabilities']['ppu']['dynamic'] = True
+                else:
+                    product['capabilities']['ppu']['dynamic'] = False
+        if data.capability == "Pay-as-you-go future charges support":
+            if not product['capabilities']['ppu']:
+                if data.value == 'Enabled':
+                    raise Exception(
+                        "Report of future charges can't be enabled without Pay-as-you-go "
+                        "support",
+                    )
+                return
+
+            else:
+                if data.value == 'Enabled':
+                    product['capabilities']['ppu']['future'] = True
+                else:
+                    product['capabilities']['ppu']['future'] = False
+        if data.capability == 'Consumption reporting for Reservation Items':
+            if data.value == 'Enabled':
+                product['capabilities']['reservation']['consumption'] = True
+            else:
+                product['capabilities']['reservation']['consumption'] = False
+
+        if data.capability == 'Dynamic Validation of the Draft Requests':
+            if data.value == 'Enabled':
+                product['capabilities']['cart']['validation'] = True
+            else:
+                product['capabilities']['cart']['validation'] = False
+
+        if data.capability == 'Dynamic Validation of the Inquiring Form':
+            if data.value == 'Enabled':
+                product['capabilities']['inquiring']['validation'] = True
+            else:
+                product['capabilities']['inquiring']['validation'] = False
+
+        if data.capability == 'Reseller Authorization Level':
+            if data.value == 'Disabled':
+                product['capabilities']['tiers']['configs'] = None
+            else:
+                product['capabilities']['tiers']['configs'] = {
+                    'level': int(data.value),
+                }
+        if data.capability == 'Tier Accounts Sync':
+            if data.value == 'Enabled':
+                product['capabilities']['tiers']['updates'] = True
+            else:
+                product['capabilities']['tiers']['updates'] = False
+        if data.capability == 'Administrative Hold':
+            if data.value == 'Enabled':
+                product['capabilities']['subscription']['hold'] = True
+            else:
+                product['capabilities']['subscription']['hold'] = False
+        if data.capability == 'Dynamic Validation of Tier Requests':
+            if data.value == 'Enabled':
+                product['capabilities']['tiers']['validation'] = True
+            else:
+                product['capabilities']['tiers']['validation'] = False
+        if data.capability == 'Editable Ordering Parameters in Change Request':
+            if data.value == 'Enabled':
+                product[
+                    'capabilities'
+                ][
+                    'subscription'
+                ][
+                    'change'
+                ][
+                    'editable_ordering_parameters'
+                ] = True
+            else:
+                product[
+                    'capabilities'
+                ][
+                    'subscription'
+                ][
+                    'change'
+                ][
+                    'editable_ordering_parameters'
+                ] = False
+        if data.capability == 'Validation of Draft Change Request':
+            if data.value == 'Enabled':
+                product[
+                    'capabilities'
+                ][
+                    'subscription'
+                ][
+                    'change'
+                ][
+                    'validation'
+                ] = True
+            else:
+                product[
+                    'capabilities'
+                ][
+                    'subscription'
+                ][
+                    'change'
+                ][
+                    'validation'
+                ] = False
+        if data.capability == 'Validation of inquiring form for Change Requests':
+            if data.value == 'Enabled':
+                product[
+                    'capabilities'
+                ][
+                    'subscription'
+                ][
+                    'change'
+                ][
+                    'inquiring_validation'
+                ] = True
+            else:
+                product[
+                    'capabilities'
+                ][
+                    'subscription'
+                ][
+                    'change'
+                ][
+                    'inquiring_validation'
+                ] = False
+
     @staticmethod
     def _validate_row(data):
         errors = []
@@ -211,8 +220,8 @@ class CapabilitiesSynchronizer(ProductSynchronizer):
             ):
                 errors.append(f'Schema {data.value} is not supported')
             return errors
-        if data.capability == 'Reseller Authorization Level' and data.value not in (
-            'Disabled', 1, 2,
+        if data.capability == 'Reseller Authorization Level' and str(data.value) not in (
+            'Disabled', '1', '2',
         ):
             errors.append(f'{data.value } is not valid for Reseller Authorization level capability')
             return errors
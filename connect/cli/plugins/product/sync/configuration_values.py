@@ -2,13 +2,10 @@ import json
 import re
 from collections import namedtuple
 
-from tqdm import trange
-
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.cli.plugins.product.constants import (
     CONFIGURATION_HEADERS,
 )
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 
 
 fields = (v.replace(' ', '_').lower() for v in CONFIGURATION_HEADERS.values())
@@ -26,11 +23,8 @@ class ConfigurationValuesSynchronizer(ProductSynchronizer):
         updated_items = []
         deleted_items = []
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 10)])
+        row_indexes = self._iter_rows(ws, _RowData)
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing Configuration value {data.id}')
             if data.action == '-':
                 skipped_count += 1
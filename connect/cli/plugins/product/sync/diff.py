@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+
+def get_payload_changes(current, payload, prefix=''):
+    changes = []
+    for key, value in payload.items():
+        field = f'{prefix}{key}'
+        current_value = current.get(key) if isinstance(current, dict) else None
+        if isinstance(value, dict) and isinstance(current_value, dict):
+            changes.extend(get_payload_changes(current_value, value, f'{field}.'))
+            continue
+        if current_value in (None, '') and value in (None, ''):
+            continue
+        if current_value != value:
+            changes.append((field, current_value, value))
+    return changes
+
+
+class SyncDiff:
+    def __init__(self, dry_run=False):
+        self.dry_run = dry_run
+        self.changes = []
+
+    def compare(self, worksheet, row_idx, object_id, current, payload):
+        changes = get_payload_changes(current, payload)
+        for field, current_value, value in changes:
+            self.add(worksheet, row_idx, 'update', object_id, field, current_value, value)
+        return changes
+
+    def add(self, worksheet, row_idx, action, object_id, field=None, current=None, new=None):
+        self.changes.append(
+            {
+                'worksheet': worksheet,
+                'row': row_idx,
+                'action': action,
+                'id': object_id,
+                'field': field,
+                'current': current,
+                'new': new,
+            },
+        )
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import httpx
+
+from connect.cli.core.constants import SCHEDULER_RETRY_STATUSES, SCHEDULER_THROTTLE_STATUSES
+from connect.cli.core.metrics import get_endpoint_template, get_metrics
+from connect.cli.core.scheduler import get_backoff, get_retry_after, get_scheduler, RequestScheduler
+from connect.cli.plugins.product.constants import (
+    ASYNC_BACKOFF_BASE,
+    ASYNC_DEFAULT_HOST_LIMIT,
+    ASYNC_MAX_RETRIES,
+    ASYNC_PERMIT_POLL_INTERVAL,
+    SYNC_DEFAULT_WORKERS,
+)
+from connect.client import AsyncConnectClient
+
+
+def run_mutation(result):
+    if not inspect.isgenerator(result):
+        return result
+    try:
+        value = next(result)
+        while True:
+            value = result.send(value)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_mutation_async(result):
+    if inspect.isawaitable(result):
+        return await result
+    if not inspect.isgenerator(result):
+        return result
+    try:
+        step = next(result)
+        while True:
+            try:
+                value = await step
+            except Exception as e:
+                step = result.throw(e)
+            else:
+                step = result.send(value)
+    except StopIteration as stop:
+        return stop.value
+
+
+class MutationExecutor:
+    def __init__(self, client, workers=SYNC_DEFAULT_WORKERS, endpoint_limits=None):
+        self._client = client
+        self._workers = workers
+        self._endpoint_limits = endpoint_limits or {}
+        self._semaphores = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type:
+            for _, future in self._pending:
+                future.cancel()
+            self._pending = []
+        self.close()
+
+    def submit(self, row_idx, endpoint, fn, *args):
+        if self._workers == 1:
+            future = Future()
+            try:
+                future.set_result(run_mutation(fn(self._client, *args)))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._workers)
+            future = self._executor.submit(self._call, endpoint, fn, *args)
+        self._pending.append((row_idx, future))
+
+    def results(self):
+        pending, self._pending = self._pending, []
+        for row_idx, future in pending:
+            try:
+                yield row_idx, future.result(), None
+            except Exception as e:
+                yield row_idx, None, e
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _call(self, endpoint, fn, *args):
+        with self._get_semaphore(endpoint):
+            return run_mutation(fn(self._client, *args))
+
+    def _get_semaphore(self, endpoint):
+        with self._lock:
+            if endpoint not in self._semaphores:
+                self._semaphores[endpoint] = threading.BoundedSemaphore(
+                    self._endpoint_limits.get(endpoint, self._workers),
+                )
+            return self._semaphores[endpoint]
+
+
+class AsyncTransport:
+    def __init__(
+        self,
+        concurrency,
+        host_limit=ASYNC_DEFAULT_HOST_LIMIT,
+        max_retries=ASYNC_MAX_RETRIES,
+        transport=None,
+        scheduler=None,
+    ):
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=concurrency),
+            timeout=None,
+            transport=transport,
+        )
+        self._limit = asyncio.Semaphore(concurrency)
+        self._host_limit = host_limit
+        self._host_limits = {}
+        self._max_retries = max_retries
+        self._scheduler = scheduler or RequestScheduler()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._client.aclose()
+
+    async def request(self, method, url, kwargs):
+        host = urlparse(url).netloc
+        endpoint = get_endpoint_template(url)
+        requested_at = time.time()
+        first_attempt_at = time.monotonic()
+        retries = 0
+        async with self._limit, self._get_host_limit(host):
+            while True:
+                await self._acquire()
+                started_at = time.monotonic()
+                try:
+                    response = await self._client.request(method, url, **kwargs)
+                except BaseException as error:
+                    self._scheduler.complete(
+                        endpoint,
+                        time.monotonic() - started_at,
+                        isinstance(error, httpx.TransportError),
+                    )
+                    get_metrics().record(
+                        method,
+                        url,
+                        requested_at,
+                        time.monotonic() - first_attempt_at,
+                        retries=retries,
+                        error=error.__class__.__name__,
+                    )
+                    raise
+                throttled = response.status_code in SCHEDULER_THROTTLE_STATUSES
+                self._scheduler.complete(endpoint, time.monotonic() - started_at, throttled)
+                if response.status_code not in SCHEDULER_RETRY_STATUSES or retries >= self._max_retries:
+                    get_metrics().record(
+                        method,
+                        url,
+                        requested_at,
+                        time.monotonic() - first_attempt_at,
+                        response,
+                        retries,
+                    )
+                    return response
+                retries += 1
+                delay = get_backoff(retries, ASYNC_BACKOFF_BASE)
+                if throttled:
+                    # the pause is shared with every request made to the account, threaded ones included
+                    retry_after = get_retry_after(response)
+                    self._scheduler.pause(delay if retry_after is None else retry_after)
+                else:
+                    await asyncio.sleep(delay)
+
+    def _get_host_limit(self, host):
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self._host_limit)
+        return self._host_limits[host]
+
+    async def _acquire(self):
+        # the account scheduler is thread based, so its permits are polled instead of awaited
+        while True:
+            delay = self._scheduler.get_pause() or self._scheduler.bucket.try_acquire()
+            if not delay:
+                break
+            await asyncio.sleep(delay)
+        while not self._scheduler.concurrency.try_acquire():
+            await asyncio.sleep(ASYNC_PERMIT_POLL_INTERVAL)
+
+
+class _AsyncClient(AsyncConnectClient):
+    def __init__(self, transport, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._transport = transport
+
+    async def _execute_http_call(self, method, url, kwargs):
+        if self.logger:
+            self.logger.log_request(method, url, kwargs)
+
+        self.response = await self._transport.request(method, url, kwargs)
+
+        if self.logger:
+            self.logger.log_response(self.response)
+
+        if self.response.status_code >= 400:
+            self.response.raise_for_status()
+
+
+class AsyncMutationExecutor:
+    def __init__(
+        self,
+        api_key,
+        endpoint,
+        concurrency,
+        host_limit=ASYNC_DEFAULT_HOST_LIMIT,
+        endpoint_limits=None,
+        logger=None,
+        transport=None,
+    ):
+        self._api_key = api_key
+        self._endpoint = endpoint
+        self._concurrency = concurrency
+        self._host_limit = host_limit
+        self._endpoint_limits = endpoint_limits or {}
+        self._logger = logger
+        self._transport = transport
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, row_idx, endpoint, fn, *args):
+        self._pending.append((row_idx, endpoint, fn, args))
+
+    def results(self):
+        pending, self._pending = self._pending, []
+        if pending:
+            yield from asyncio.run(self._run(pending))
+
+    def close(self):
+        self._pending = []
+
+    async def _run(self, pending):
+        semaphores = {
+            endpoint: asyncio.Semaphore(self._endpoint_limits.get(endpoint, self._concurrency))
+            for _, endpoint, _, _ in pending
+        }
+        async with AsyncTransport(
+            self._concurrency,
+            host_limit=self._host_limit,
+            transport=self._transport,
+            scheduler=get_scheduler(self._endpoint, self._api_key),
+        ) as transport:
+            return await asyncio.gather(
+                *(
+                    self._call(transport, semaphores[endpoint], row_idx, fn, args)
+                    for row_idx, endpoint, fn, args in pending
+                ),
+            )
+
+    async def _call(self, transport, semaphore, row_idx, fn, args):
+        client = _AsyncClient(
+            transport,
+            self._api_key,
+            endpoint=self._endpoint,
+            use_specs=False,
+            logger=self._logger,
+        )
+        async with semaphore:
+            try:
+                return row_idx, await run_mutation_async(fn(client, *args)), None
+            except Exception as e:
+                return row_idx, None, e
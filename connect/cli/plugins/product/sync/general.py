@@ -3,16 +3,18 @@ import os
 from click import ClickException
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
+from connect.cli.plugins.product.categories import get_category_index
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.cli.plugins.product.utils import cleanup_product_for_update
 from connect.client import ClientError
 
 
 class GeneralSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
+    def __init__(self, client, silent, session=None, categories=None):
         self._category = None
         self._media_path = None
-        super(GeneralSynchronizer, self).__init__(client, silent)
+        self._categories = categories or get_category_index(client)
+        super(GeneralSynchronizer, self).__init__(client, silent, session)
 
     def open(self, input_file, worksheet):
         self._open_workbook(input_file)
@@ -83,11 +85,8 @@ class GeneralSynchronizer(ProductSynchronizer):
         return errors
 
     def _assign_cat_id(self, category_name):
-        categories = self._client.categories.all()
-        for category in categories:
-            if category['name'] == category_name:
-                self._category = category['id']
-                return category['id']
+        self._category = self._categories.get_id(category_name)
+        return self._category
 
     def sync(self):
         errors = []
@@ -5,25 +5,21 @@
 
 from collections import namedtuple
 
-from tqdm import trange
-
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.product.constants import (
     BILLING_PERIOD,
     COMMITMENT,
     ITEMS_COLS_HEADERS,
     PRECISIONS,
 )
+from connect.cli.core.http import handle_http_error
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
+from connect.cli.plugins.product.units import get_unit_index
 from connect.cli.plugins.product.api import (
-    create_item,
-    create_unit,
-    delete_item,
     get_item,
     get_item_by_mpn,
-    update_item,
+    get_items,
 )
-from connect.client.rql import R
+from connect.client import ClientError
 
 fields = (v.replace(' ', '_').lower() for v in ITEMS_COLS_HEADERS.values())
 
@@ -31,23 +27,25 @@ _RowData = namedtuple('RowData', fields)
 
 
 class ItemSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
-        self._units = list(client.ns('settings').units.all())
-        super().__init__(client, silent)
+    def __init__(self, client, silent, session=None, executor=None, diff=None):
+        self._units = get_unit_index(client)
+        self._units.load()
+        self._items_by_id = None
+        self._items_by_mpn = None
+        super().__init__(client, silent, session, executor, diff)
 
     def sync(self):  # noqa: CCR001
         ws = self._wb["Items"]
+        patch = self._get_patch("Items")
         errors = {}
         skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
+        processed = {'create': [], 'update': [], 'delete': []}
+        pending_keys = set()
+        self._items_by_id = None
+        self._items_by_mpn = None
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 14)])
+        row_indexes = self._iter_rows(ws, _RowData)
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing item {data.id or data.mpn}')
             if data.action == '-':
                 skipped_count += 1
@@ -57,14 +55,14 @@ class ItemSynchronizer(ProductSynchronizer):
                 errors[row_idx] = row_errors
                 continue
 
+            if pending_keys.intersection((data.id, data.mpn)):
+                # the row depends on the outcome of a previous one
+                self._collect_results(patch, processed, errors)
+                pending_keys.clear()
+
             if data.action == 'create':
-                rql = R().mpn.eq(data.mpn)
-                item = (
-                    self._client.products[self._product_id]
-                    .items
-                    .filter(rql)
-                    .first()
-                )
+                self._load_items()
+                item = self._items_by_mpn.get(data.mpn)
                 if item:
                     errors[row_idx] = [
                         f'Cannot create item: item with MPN `{data.mpn}`'
@@ -73,15 +71,19 @@ class ItemSynchronizer(ProductSynchronizer):
                     continue
                 row_indexes.set_description(f"Creating item {data[1]}")
                 try:
-                    item = create_item(
-                        self._client,
-                        self._product_id,
-                        self._get_item_payload(data),
-                    )
-                    created_items.append(item)
-                    self._update_sheet_row(ws, row_idx, item)
+                    payload = self._get_item_payload(data)
                 except Exception as e:
                     errors[row_idx] = [str(e)]
+                    continue
+                self._submit(
+                    row_idx,
+                    'create',
+                    None,
+                    'items',
+                    self._create_item,
+                    payload,
+                )
+                pending_keys.add(data.mpn)
 
             if data.action == 'update':
                 item = self._get_item(data)
@@ -104,20 +106,26 @@ class ItemSynchronizer(ProductSynchronizer):
                         'ui': {'visibility': True},
                     }
                 else:
-                    payload = self._get_item_payload(data)
+                    try:
+                        payload = self._get_item_payload(data)
+                    except Exception as e:
+                        errors[row_idx] = [str(e)]
+                        continue
                     if item['type'] == 'ppu':
                         del payload['period']
-                try:
-                    item = update_item(
-                        self._client,
-                        self._product_id,
-                        item['id'],
-                        payload,
-                    )
-                    updated_items.append(item)
-                    self._update_sheet_row(ws, row_idx, item)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
+                if self._is_unchanged(row_idx, item['id'], payload, current=item):
+                    skipped_count += 1
+                    continue
+                self._submit(
+                    row_idx,
+                    'update',
+                    item,
+                    'items',
+                    self._update_item,
+                    item['id'],
+                    payload,
+                )
+                pending_keys.update((item['id'], item['mpn'], data.mpn))
 
             if data.action == 'delete':
                 item = self._get_item(data)
@@ -130,23 +138,50 @@ class ItemSynchronizer(ProductSynchronizer):
                         f'the item does not exist.',
                     ]
                     continue
-                try:
-                    delete_item(
-                        self._client,
-                        self._product_id,
-                        item['id'],
-                    )
-                    deleted_items.append(item)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
+                self._submit(
+                    row_idx,
+                    'delete',
+                    item,
+                    'items',
+                    self._delete_item,
+                    item['id'],
+                )
+                pending_keys.update((item['id'], item['mpn']))
+
+        self._collect_results(patch, processed, errors)
         return (
             skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            len(processed['create']),
+            len(processed['update']),
+            len(processed['delete']),
             errors,
         )
 
+    def _create_item(self, client, payload):
+        try:
+            return (yield client.products[self._product_id].items.create(payload))
+        except ClientError as error:
+            handle_http_error(error)
+
+    def _update_item(self, client, item_id, payload):
+        try:
+            return (yield client.products[self._product_id].items[item_id].update(payload))
+        except ClientError as error:
+            handle_http_error(error)
+
+    def _delete_item(self, client, item_id):
+        try:
+            yield client.products[self._product_id].items[item_id].delete()
+        except ClientError as error:
+            handle_http_error(error)
+
+    def _apply_result(self, patch, row_idx, action, result, original):
+        if action == 'delete':
+            self._unindex_item(original)
+            return
+        self._index_item(result)
+        self._update_sheet_row(patch, row_idx, result)
+
     @staticmethod
     def _validate_commitment(row):
         if row.commitment not in COMMITMENT:
@@ -283,27 +318,43 @@ class ItemSynchronizer(ProductSynchronizer):
         return f'years_{count}'
 
     def _get_or_create_unit(self, data):
-        for unit in self._units:
-            if unit['id'] == data.unit:
-                return unit['id']
-            if unit['type'] == data.type and unit['description'] == data.unit:
-                return unit['id']
-
-        created = create_unit(
-            self._client,
-            {
-                'description': data.unit,
-                'type': data.type,
-                'unit': 'unit' if data.type == 'reservation' else 'unit-h',
-            },
-        )
-        return created['id']
+        if self._dry_run:
+            unit = self._units.get(data.type, data.unit)
+            return unit['id'] if unit else data.unit
+        return self._units.get_or_create(data.type, data.unit)['id']
+
+    def _load_items(self):
+        if self._items_by_id is not None:
+            return
+        self._items_by_id = {}
+        self._items_by_mpn = {}
+        for item in get_items(self._client, self._product_id):
+            self._index_item(item)
+
+    def _index_item(self, item):
+        if item['id'] in self._items_by_id:
+            self._unindex_item(self._items_by_id[item['id']])
+        self._items_by_id[item['id']] = item
+        if item.get('mpn'):
+            self._items_by_mpn[item['mpn']] = item
+
+    def _unindex_item(self, item):
+        self._items_by_id.pop(item['id'], None)
+        if self._items_by_mpn.get(item.get('mpn')) is item:
+            del self._items_by_mpn[item['mpn']]
 
     def _get_item(self, data):
+        self._load_items()
         if data.id:
-            return get_item(self._client, self._product_id, data.id)
+            return (
+                self._items_by_id.get(data.id)
+                or get_item(self._client, self._product_id, data.id)
+            )
         elif data.mpn:
-            return get_item_by_mpn(self._client, self._product_id, data.mpn)
+            return (
+                self._items_by_mpn.get(data.mpn)
+                or get_item_by_mpn(self._client, self._product_id, data.mpn)
+            )
 
     def _get_item_payload(self, data):
         commitment = {
@@ -327,8 +378,8 @@ class ItemSynchronizer(ProductSynchronizer):
         return payload
 
     @staticmethod
-    def _update_sheet_row(ws, row_idx, item):
-        ws.cell(row_idx, 1, value=item['id'])
-        ws.cell(row_idx, 11, value=item['status'])
-        ws.cell(row_idx, 12, value=item['events']['created']['at'])
-        ws.cell(row_idx, 13, value=item['events'].get('updated', {}).get('at'))
+    def _update_sheet_row(patch, row_idx, item):
+        patch.cell(row_idx, 1, value=item['id'])
+        patch.cell(row_idx, 11, value=item['status'])
+        patch.cell(row_idx, 12, value=item['events']['created']['at'])
+        patch.cell(row_idx, 13, value=item['events'].get('updated', {}).get('at'))
@@ -6,10 +6,8 @@ import os
 from collections import namedtuple
 from urllib.parse import urlparse
 
-from tqdm import trange
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.product.constants import MEDIA_COLS_HEADERS
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.client import ClientError
@@ -21,9 +19,9 @@ _RowData = namedtuple('RowData', fields)
 
 
 class MediaSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
+    def __init__(self, client, silent, session=None):
         self._media_path = None
-        super(MediaSynchronizer, self).__init__(client, silent)
+        super(MediaSynchronizer, self).__init__(client, silent, session)
 
     def open(self, input_file, worksheet):
         self._media_path = input_file.rsplit('/', 1)[0]
@@ -31,17 +29,15 @@ class MediaSynchronizer(ProductSynchronizer):
 
     def sync(self):  # noqa: CCR001
         ws = self._wb['Media']
+        patch = self._get_patch('Media')
         errors = {}
         skipped_count = 0
         created_items = []
         updated_items = []
         deleted_items = []
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 7)])
+        row_indexes = self._iter_rows(ws, _RowData)
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing Media {data.id or data.position or "New"}')
 
             if data.action == '-':
@@ -106,14 +102,14 @@ class MediaSynchronizer(ProductSynchronizer):
                         data=payload,
                         headers={'Content-Type': payload.content_type},
                     )
-                    self._update_sheet_row(ws, row_idx, media)
+                    self._update_sheet_row(patch, row_idx, media)
                     updated_items.append(media)
                 else:
                     media = self._client.products[self._product_id].media.create(
                         data=payload,
                         headers={'Content-Type': payload.content_type},
                     )
-                    self._update_sheet_row(ws, row_idx, media)
+                    self._update_sheet_row(patch, row_idx, media)
                     created_items.append(media)
             except Exception as e:
                 errors[row_idx] = [str(e)]
@@ -127,9 +123,9 @@ class MediaSynchronizer(ProductSynchronizer):
         )
 
     @staticmethod
-    def _update_sheet_row(ws, row_idx, media):
-        ws.cell(row_idx, 1, value=media['position'])
-        ws.cell(row_idx, 2, value=media['id'])
+    def _update_sheet_row(patch, row_idx, media):
+        patch.cell(row_idx, 1, value=media['position'])
+        patch.cell(row_idx, 2, value=media['id'])
 
     def _validate_row(self, data):
         errors = []
@@ -7,10 +7,8 @@ import re
 from collections import namedtuple
 from json.decoder import JSONDecodeError
 
-from tqdm import trange
 from openpyxl.styles import Alignment
 
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.product.constants import (
     PARAM_TYPES,
     PARAMS_COLS_HEADERS,
@@ -26,10 +24,10 @@ _RowData = namedtuple('RowData', fields)
 
 
 class ParamsSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
+    def __init__(self, client, silent, session=None, executor=None, diff=None):
         self._param_type = None
         self._worksheet_name = None
-        super(ParamsSynchronizer, self).__init__(client, silent)
+        super(ParamsSynchronizer, self).__init__(client, silent, session, executor, diff)
 
     def open(self, input_file, worksheet):
         if worksheet == "Ordering Parameters":
@@ -43,17 +41,13 @@ class ParamsSynchronizer(ProductSynchronizer):
 
     def sync(self):  # noqa: CCR001
         ws = self._wb[self._worksheet_name]
+        patch = self._get_patch(self._worksheet_name)
         errors = {}
         skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
+        processed = {'create': [], 'update': [], 'delete': []}
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 15)])
+        row_indexes = self._iter_rows(ws, _RowData)
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing param {data.id}')
             if data.action == '-':
                 skipped_count += 1
@@ -65,11 +59,7 @@ class ParamsSynchronizer(ProductSynchronizer):
                 continue
 
             if data.action == 'delete':
-                try:
-                    self._client.products[self._product_id].parameters[data.verbose_id].delete()
-                except ClientError:
-                    pass
-                deleted_items.append(data)
+                self._submit(row_idx, 'delete', data, 'parameters', self._delete_param, data.verbose_id)
                 continue
 
             param_payload = {}
@@ -88,53 +78,74 @@ class ParamsSynchronizer(ProductSynchronizer):
             param_payload['constraints']['hidden'] = False if data.hidden == '-' else True
 
             if data.action == 'update':
-                try:
-                    original_param = self._client.products[self._product_id].parameters[
-                        data.verbose_id
-                    ].get()
-
-                    self._compare_param(original_param, data)
-
-                    param = self._client.products[self._product_id].parameters[
-                        data.verbose_id
-                    ].update(
-                        param_payload,
-                    )
-                    self._update_sheet_row(ws, row_idx, param)
-                    updated_items.append(param)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
+                if self._is_unchanged(
+                    row_idx,
+                    data.verbose_id,
+                    param_payload,
+                    collection=self._client.products[self._product_id].parameters,
+                ):
+                    skipped_count += 1
+                    continue
+                self._submit(
+                    row_idx,
+                    'update',
+                    data,
+                    'parameters',
+                    self._update_param,
+                    data,
+                    param_payload,
+                )
 
             if data.action == 'create':
-                try:
-                    param = self._client.products[self._product_id].parameters.create(
-                        param_payload,
-                    )
-                    self._update_sheet_row(ws, row_idx, param)
-                    created_items.append(param)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
+                self._submit(row_idx, 'create', data, 'parameters', self._create_param, param_payload)
 
+        self._collect_results(patch, processed, errors)
         return (
             skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            len(processed['create']),
+            len(processed['update']),
+            len(processed['delete']),
             errors,
         )
 
+    def _create_param(self, client, param_payload):
+        return client.products[self._product_id].parameters.create(
+            param_payload,
+        )
+
+    def _update_param(self, client, data, param_payload):
+        original_param = yield client.products[self._product_id].parameters[
+            data.verbose_id
+        ].get()
+
+        self._compare_param(original_param, data)
+
+        return (
+            yield client.products[self._product_id].parameters[
+                data.verbose_id
+            ].update(
+                param_payload,
+            )
+        )
+
+    def _delete_param(self, client, param_id):
+        try:
+            yield client.products[self._product_id].parameters[param_id].delete()
+        except ClientError:
+            pass
+
     @staticmethod
-    def _update_sheet_row(ws, row_idx, param):
-        ws.cell(row_idx, 1, value=param['id']).alignment = Alignment(
+    def _update_sheet_row(patch, row_idx, param):
+        patch.cell(row_idx, 1, value=param['id']).alignment = Alignment(
             horizontal='left',
             vertical='top',
         )
-        ws.cell(row_idx, 12, value=get_json_object_for_param(param))
-        ws.cell(row_idx, 13, value=param['events']['created']['at']).alignment = Alignment(
+        patch.cell(row_idx, 12, value=get_json_object_for_param(param))
+        patch.cell(row_idx, 13, value=param['events']['created']['at']).alignment = Alignment(
             horizontal='left',
             vertical='top',
         )
-        ws.cell(
+        patch.cell(
             row_idx,
             14,
             value=param['events'].get('updated', {}).get('at'),
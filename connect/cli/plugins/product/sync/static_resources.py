@@ -1,9 +1,6 @@
 from collections import namedtuple
 from urllib.parse import urlparse
 
-from tqdm import trange
-
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.product.constants import STATIC_LINK_HEADERS
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.cli.plugins.product.utils import cleanup_product_for_update
@@ -22,13 +19,10 @@ class StaticResourcesSynchronizer(ProductSynchronizer):
         created_items = []
         deleted_items = []
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
+        row_indexes = self._iter_rows(ws, _RowData)
         download = []
         documentation = []
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 5)])
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing item {data.title or data.type}')
             if data.action not in ('-', 'create', 'delete'):
                 skipped_count += 1
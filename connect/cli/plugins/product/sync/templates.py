@@ -5,11 +5,9 @@
 
 from collections import namedtuple
 
-from tqdm import trange
-
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.product.constants import TEMPLATES_HEADERS
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
+from connect.cli.plugins.product.utils import RowSyncError
 from connect.client import ClientError
 
 fields = (v.replace(' ', '_').lower() for v in TEMPLATES_HEADERS.values())
@@ -20,17 +18,13 @@ _RowData = namedtuple('RowData', fields)
 class TemplatesSynchronizer(ProductSynchronizer):
     def sync(self):  # noqa: CCR001
         ws = self._wb["Templates"]
+        patch = self._get_patch("Templates")
         errors = {}
         skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
+        processed = {'create': [], 'update': [], 'delete': []}
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 9)])
+        row_indexes = self._iter_rows(ws, _RowData)
+        for row_idx, data in row_indexes:
             row_indexes.set_description(f'Processing Template {data.id or data.title}')
             if data.action == '-':
                 skipped_count += 1
@@ -49,65 +43,60 @@ class TemplatesSynchronizer(ProductSynchronizer):
                 template_data['title'] = data.title
             if data.action == 'create':
                 row_indexes.set_description(f"Creating template {data[1]}")
-                try:
-                    template = self._create_template(template_data)
-                    created_items.append(template)
-                    self._update_sheet_row(ws, row_idx, template)
-                    continue
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
-                    continue
-            try:
-                current = self._client.products[self._product_id].templates[data.id].get()
-            except ClientError as e:
-                if data.action == 'delete':
-                    if e.status_code == 404:
-                        deleted_items.append(data)
-                        continue
-                    errors[row_idx] = [str(e)]
-                    continue
-                errors[row_idx] = [
-                    f'Cannot {data.action} template {data.id} since does not exist in the product.'
-                    'Create it instead',
-                ]
+                self._submit(row_idx, 'create', data, 'templates', self._create_template, template_data)
                 continue
-            if current['type'] != data.type or current['scope'] != data.scope:
-                errors[row_idx] = [
-                    f'Switching scope or type is not supported. '
-                    f'Original scope {current["scope"]}, requested scope {data.scope}. '
-                    f'Original type {current["type"]}, requested type {data.type}',
-                ]
+            if data.action == 'update' and self._is_unchanged(
+                row_idx,
+                data.id,
+                template_data,
+                collection=self._client.products[self._product_id].templates,
+            ):
+                skipped_count += 1
                 continue
-            try:
-                if data.action == 'update':
-                    template = self._update_template(data.id, template_data)
-                    updated_items.append(template)
-                    self._update_sheet_row(ws, row_idx, template)
-                if data.action == 'delete':
-                    self._client.products[self._product_id].templates[data.id].delete()
-                    deleted_items.append(data)
+            self._submit(row_idx, data.action, data, 'templates', self._sync_template, data, template_data)
 
-            except Exception as e:
-                errors[row_idx] = [str(e)]
+        self._collect_results(patch, processed, errors)
         return (
             skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            len(processed['create']),
+            len(processed['update']),
+            len(processed['delete']),
             errors,
         )
 
-    def _create_template(self, template_data):
-        return self._client.products[self._product_id].templates.create(template_data)
+    def _sync_template(self, client, data, template_data):
+        try:
+            current = yield client.products[self._product_id].templates[data.id].get()
+        except ClientError as e:
+            if data.action == 'delete':
+                if e.status_code == 404:
+                    return
+                raise
+            raise RowSyncError(
+                f'Cannot {data.action} template {data.id} since does not exist in the product.'
+                'Create it instead',
+            )
+        if current['type'] != data.type or current['scope'] != data.scope:
+            raise RowSyncError(
+                f'Switching scope or type is not supported. '
+                f'Original scope {current["scope"]}, requested scope {data.scope}. '
+                f'Original type {current["type"]}, requested type {data.type}',
+            )
+        if data.action == 'update':
+            return (yield self._update_template(client, data.id, template_data))
+        yield client.products[self._product_id].templates[data.id].delete()
+
+    def _create_template(self, client, template_data):
+        return client.products[self._product_id].templates.create(template_data)
 
-    def _update_template(self, tl_id, template_data):
-        return self._client.products[self._product_id].templates[tl_id].update(template_data)
+    def _update_template(self, client, tl_id, template_data):
+        return client.products[self._product_id].templates[tl_id].update(template_data)
 
     @staticmethod
-    def _update_sheet_row(ws, row_idx, template):
-        ws.cell(row_idx, 1, value=template['id'])
-        ws.cell(row_idx, 7, value=template['events']['created']['at'])
-        ws.cell(row_idx, 8, value=template['events'].get('updated', {}).get('at'))
+    def _update_sheet_row(patch, row_idx, template):
+        patch.cell(row_idx, 1, value=template['id'])
+        patch.cell(row_idx, 7, value=template['events']['created']['at'])
+        patch.cell(row_idx, 8, value=template['events'].get('updated', {}).get('at'))
 
     @staticmethod
     def _validate_row(data):
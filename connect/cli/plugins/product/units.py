@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import threading
+
+from connect.cli.core.cache.helpers import get_cached_collection
+from connect.cli.plugins.product.api import create_unit
+from connect.cli.plugins.product.constants import UNITS_CACHE_TTL
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+class UnitIndex:
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.RLock()
+        self._by_id = None
+        self._by_description = None
+
+    def load(self):
+        with self._lock:
+            if self._by_id is not None:
+                return
+            self._by_id = {}
+            self._by_description = {}
+            units = get_cached_collection(
+                self._client,
+                'settings/units',
+                UNITS_CACHE_TTL,
+                self._client.ns('settings').units.all,
+            )
+            for unit in units:
+                self._add(unit, unit.get('type'), unit.get('description'))
+
+    def get(self, unit_type, value):
+        self.load()
+        return self._by_id.get(value) or self._by_description.get((unit_type, value))
+
+    def get_or_create(self, unit_type, value):
+        with self._lock:
+            unit = self.get(unit_type, value)
+            if not unit:
+                unit = create_unit(
+                    self._client,
+                    {
+                        'description': value,
+                        'type': unit_type,
+                        'unit': 'unit' if unit_type == 'reservation' else 'unit-h',
+                    },
+                )
+                self._add(unit, unit_type, value)
+            return unit
+
+    def _add(self, unit, unit_type, description):
+        self._by_id.setdefault(unit['id'], unit)
+        self._by_description.setdefault((unit_type, description), unit)
+
+
+def get_unit_index(client):
+    key = (client.endpoint, client.api_key)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = UnitIndex(client)
+        return _indexes[key]
+
+
+def clear_unit_indexes():
+    with _indexes_lock:
+        _indexes.clear()
@@ -105,3 +105,7 @@ def get_json_object_for_param(original_param):
 
 class ParamSwitchNotSupported(Exception):
     pass
+
+
+class RowSyncError(Exception):
+    pass
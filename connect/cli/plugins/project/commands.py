@@ -5,15 +5,6 @@ import os
 import click
 
 from connect.cli.core.config import pass_config
-from connect.cli.plugins.project.extension_helpers import (
-    bootstrap_extension_project,
-    validate_extension_project,
-)
-from connect.cli.plugins.project.report_helpers import (
-    add_report,
-    bootstrap_report_project,
-    validate_report_project,
-)
 
 
 @click.group(name='project', short_help='Manage project definitions.')
@@ -42,6 +33,8 @@ def grp_project_report():
     help='Directory where the new report project will be created.',
 )
 def cmd_bootstrap_report_project(output_dir):
+    from connect.cli.plugins.project.report_helpers import bootstrap_report_project
+
     bootstrap_report_project(output_dir)
 
 
@@ -56,6 +49,8 @@ def cmd_bootstrap_report_project(output_dir):
     help='Project directory.',
 )
 def cmd_validate_report_project(project_dir):
+    from connect.cli.plugins.project.report_helpers import validate_report_project
+
     validate_report_project(project_dir)
 
 
@@ -75,6 +70,8 @@ def cmd_validate_report_project(project_dir):
     help='Package directory.',
 )
 def cmd_add_report(project_dir, package_name):
+    from connect.cli.plugins.project.report_helpers import add_report
+
     add_report(project_dir, package_name)
 
 
@@ -100,6 +97,8 @@ def grp_project_extension():
 )
 @pass_config
 def cmd_bootstrap_extension_project(config, output_dir):
+    from connect.cli.plugins.project.extension_helpers import bootstrap_extension_project
+
     bootstrap_extension_project(config, output_dir)
 
 
@@ -114,6 +113,8 @@ def cmd_bootstrap_extension_project(config, output_dir):
     help='Project directory.',
 )
 def cmd_validate_extension_project(project_dir):
+    from connect.cli.plugins.project.extension_helpers import validate_extension_project
+
     validate_extension_project(project_dir)
 
 
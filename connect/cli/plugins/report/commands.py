@@ -4,11 +4,6 @@ from datetime import datetime
 import click
 
 from connect.cli.core.config import pass_config
-from connect.cli.plugins.report.helpers import (
-    execute_report,
-    list_reports,
-    show_report_info,
-)
 
 
 DEFAULT_REPORT_DIR = os.path.normpath(
@@ -49,6 +44,8 @@ def grp_report():
 )
 @pass_config
 def cmd_execute_report(config, reports_dir, report_id, output_file, output_format):
+    from connect.cli.plugins.report.helpers import execute_report
+
     if not output_file:
         output_file = os.path.join(
             os.getcwd(),
@@ -70,6 +67,8 @@ def cmd_execute_report(config, reports_dir, report_id, output_file, output_forma
     help='Report project root directory. Do not specify for listing default reports.',
 )
 def cmd_list_reports(reports_dir):
+    from connect.cli.plugins.report.helpers import list_reports
+
     list_reports(reports_dir)
 
 
@@ -87,6 +86,8 @@ def cmd_list_reports(reports_dir):
     help='Report project root directory. Do not specify for listing default reports',
 )
 def get_report_info(reports_dir, report_id):
+    from connect.cli.plugins.report.helpers import show_report_info
+
     show_report_info(reports_dir, report_id)
 
 
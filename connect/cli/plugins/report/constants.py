@@ -13,3 +13,5 @@ AVAILABLE_RENDERERS = """
 | ID | Description | Default |
 |:--------|:--------|:-----:|
 """
+
+MARKETPLACES_CACHE_TTL = 60 * 60
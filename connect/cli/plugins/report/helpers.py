@@ -8,6 +8,7 @@ from click import ClickException
 from cmr import render
 
 from connect.cli.core.http import get_user_agent
+from connect.cli.core.scheduler import create_client
 from connect.cli.plugins.report.constants import AVAILABLE_RENDERERS, AVAILABLE_REPORTS
 from connect.cli.plugins.report.utils import (
     get_renderer_by_id,
@@ -17,7 +18,6 @@ from connect.cli.plugins.report.utils import (
     Progress,
 )
 from connect.cli.plugins.report.wizard import get_report_inputs
-from connect.client import ConnectClient, RequestLogger
 from connect.reports.constants import CLI_ENV
 from connect.reports.datamodels import Account, Report
 from connect.reports.parser import parse
@@ -103,14 +103,12 @@ def execute_report(config, reports_dir, report_id, output_file, output_format):
 
     entrypoint = get_report_entrypoint(report)
 
-    client = ConnectClient(
+    client = create_client(
         config.active.api_key,
-        endpoint=config.active.endpoint,
-        use_specs=False,
+        config.active.endpoint,
+        verbose=config.verbose,
         default_limit=500,
-        max_retries=3,
         default_headers=get_user_agent(),
-        logger=RequestLogger() if config.verbose else None,
     )
 
     inputs = get_report_inputs(config, client, report.get_parameters())
@@ -12,6 +12,8 @@ from interrogatio.validators import (
 )
 from interrogatio.core.exceptions import ValidationError
 
+from connect.cli.core.cache.helpers import get_cached_collection
+from connect.cli.plugins.report.constants import MARKETPLACES_CACHE_TTL
 from connect.cli.plugins.report.utils import convert_to_utc_input
 from connect.client import R
 
@@ -94,8 +96,12 @@ def date(param):
     }
 
 
+def _get_marketplaces(client):
+    return get_cached_collection(client, 'marketplaces', MARKETPLACES_CACHE_TTL, client.marketplaces.all)
+
+
 def marketplace_list(config, client, param):
-    marketplaces = client.marketplaces.all()
+    marketplaces = _get_marketplaces(client)
     return {
         'name': param['id'],
         'type': 'selectmany',
@@ -109,7 +115,7 @@ def marketplace_list(config, client, param):
 
 
 def hub_list(config, client, param):
-    marketplaces = client.marketplaces.all()
+    marketplaces = _get_marketplaces(client)
     hub_ids = []
     hubs = []
     for marketplace in marketplaces:
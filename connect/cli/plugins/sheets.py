@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+from zipfile import BadZipFile
+
+from click import ClickException
+from openpyxl import load_workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Alignment, NamedStyle, PatternFill
+from openpyxl.styles.colors import Color
+from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from tqdm import tqdm
+
+from connect.cli.core.constants import DEFAULT_BAR_FORMAT
+
+
+HEADER_STYLE = 'ccli_header'
+TOP_LEFT_STYLE = 'ccli_top_left'
+WRAP_TEXT_STYLE = 'ccli_wrap_text'
+
+
+def open_workbook(input_file, read_only=False):
+    try:
+        return load_workbook(
+            input_file,
+            read_only=read_only,
+            data_only=True,
+        )
+    except InvalidFileException as ife:
+        raise ClickException(str(ife))
+    except BadZipFile:
+        raise ClickException(f'{input_file} is not a valid xlsx file.')
+
+
+def get_header_row(ws, max_col):
+    for values in ws.iter_rows(min_row=1, max_row=1, max_col=max_col, values_only=True):
+        return values
+    return (None,) * max_col
+
+
+def iter_rows(ws, row_type, silent):
+    rows = ws.iter_rows(min_row=2, max_col=len(row_type._fields), values_only=True)
+    return tqdm(
+        (
+            (row_idx, row_type(*values))
+            for row_idx, values in enumerate(rows, start=2)
+        ),
+        total=ws.max_row - 1 if ws.max_row else None,
+        disable=silent,
+        leave=True,
+        bar_format=DEFAULT_BAR_FORMAT,
+    )
+
+
+def add_named_styles(wb):
+    named_styles = (
+        NamedStyle(HEADER_STYLE, fill=PatternFill('solid', Color('d3d3d3'))),
+        NamedStyle(TOP_LEFT_STYLE, alignment=Alignment(horizontal='left', vertical='top')),
+        NamedStyle(WRAP_TEXT_STYLE, alignment=Alignment(wrap_text=True)),
+    )
+    for style in named_styles:
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+
+def _get_style(styles, col_idx):
+    if isinstance(styles, (list, tuple)):
+        return styles[col_idx] if col_idx < len(styles) else None
+    return styles
+
+
+def write_row(ws, row_idx, values, styles=None):
+    for col_idx, value in enumerate(values):
+        cell = ws.cell(row_idx, col_idx + 1)
+        cell.value = value
+        style = _get_style(styles, col_idx)
+        if style:
+            cell.style = style
+
+
+class SheetWriter:
+    def __init__(self, ws):
+        self.ws = ws
+        self.row_idx = 0
+        add_named_styles(ws.parent)
+        self._runs = {}
+        self._validations = {}
+
+    def set_widths(self, widths, auto_size=False):
+        for letter, width in widths.items():
+            self.ws.column_dimensions[letter].width = width
+            if auto_size:
+                self.ws.column_dimensions[letter].auto_size = True
+
+    def write_header(self, headers, widths):
+        self.set_widths(widths, auto_size=True)
+        self.append(headers, styles=HEADER_STYLE)
+
+    def cell(self, value, **styles):
+        cell = WriteOnlyCell(self.ws, value=value)
+        for name, style in styles.items():
+            setattr(cell, name, style)
+        return cell
+
+    def append(self, values, styles=None, validations=None):
+        row = []
+        for col_idx, value in enumerate(values):
+            cell = value if isinstance(value, Cell) else WriteOnlyCell(self.ws, value=value)
+            style = _get_style(styles, col_idx)
+            if style:
+                cell.style = style
+            row.append(cell)
+        self.ws.append(row)
+        self.row_idx += 1
+        for letter, validation in (validations or {}).items():
+            self.validate(letter, validation)
+
+    def merge(self, cell_range):
+        if isinstance(self.ws, WriteOnlyWorksheet):
+            self.ws.merged_cells.add(cell_range)
+        else:
+            self.ws.merge_cells(cell_range)
+
+    def validate(self, letter, validation, row_idx=None):
+        row_idx = row_idx or self.row_idx
+        key = (letter, id(validation))
+        self._validations.setdefault(id(validation), validation)
+        run = self._runs.get(key)
+        if run and run[2] == row_idx - 1:
+            run[2] = row_idx
+            return
+        if run:
+            self._add_run(letter, *run)
+        self._runs[key] = [validation, row_idx, row_idx]
+
+    def close(self):
+        for (letter, _), run in self._runs.items():
+            self._add_run(letter, *run)
+        for validation in self._validations.values():
+            self.ws.data_validations.append(validation)
+        self._runs = {}
+        self._validations = {}
+
+    @staticmethod
+    def _add_run(letter, validation, start, end):
+        if start == end:
+            validation.add(f'{letter}{start}')
+        else:
+            validation.add(f'{letter}{start}:{letter}{end}')
+
+
+def get_sheet_writer(ws):
+    if isinstance(ws, SheetWriter):
+        return ws
+    return SheetWriter(ws)
+
+
+class _PatchedCell:
+    def __init__(self, value):
+        self.value = value
+        self.alignment = None
+
+
+class SheetPatch:
+    def __init__(self):
+        self._cells = {}
+
+    def __len__(self):
+        return len(self._cells)
+
+    def cell(self, row, column, value=None):
+        patched = _PatchedCell(value)
+        self._cells[(row, column)] = patched
+        return patched
+
+    def get_rows(self):
+        rows = {}
+        for (row, column), patched in self._cells.items():
+            rows.setdefault(row, {})[column] = patched.value
+        return rows
+
+    def apply(self, ws):
+        for (row, column), patched in self._cells.items():
+            cell = ws.cell(row, column, value=patched.value)
+            if patched.alignment is not None:
+                cell.alignment = patched.alignment
+
+
+class WorkbookSession:
+    def __init__(self, input_file):
+        self.input_file = input_file
+        self._wb = None
+        self._patches = {}
+
+    @property
+    def workbook(self):
+        if self._wb is None:
+            self._wb = open_workbook(self.input_file, read_only=True)
+        return self._wb
+
+    def get_patch(self, worksheet):
+        if worksheet not in self._patches:
+            self._patches[worksheet] = SheetPatch()
+        return self._patches[worksheet]
+
+    def close(self):
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+
+    def save(self, output_file=None):
+        output_file = output_file or self.input_file
+        self.close()
+        if output_file == self.input_file and not any(self._patches.values()):
+            return
+        wb = open_workbook(self.input_file)
+        for worksheet, patch in self._patches.items():
+            patch.apply(wb[worksheet])
+        wb.save(output_file)
+        self._patches = {}
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import csv
+import json
+import os
+
+from click import ClickException
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.utils.cell import coordinate_from_string
+
+from connect.cli.plugins.customer.constants import COL_HEADERS
+from connect.cli.plugins.product.utils import get_col_headers_by_ws_type, get_ws_type_by_worksheet_name
+from connect.cli.plugins.sheets import SheetWriter, WorkbookSession
+
+
+TABLE_FORMATS = ('csv', 'jsonl', 'parquet')
+PARQUET_BATCH_SIZE = 1000
+
+
+def get_table_name(title):
+    return title.lower().replace(' ', '_')
+
+
+def get_sheet_title(table_name):
+    return table_name.replace('_', ' ').title()
+
+
+def get_table_format(path):
+    if not os.path.isdir(path):
+        return None
+    file_names = os.listdir(path)
+    for table_format in TABLE_FORMATS:
+        if any(file_name.endswith(f'.{table_format}') for file_name in file_names):
+            return table_format
+    return None
+
+
+def open_session(input_file):
+    table_format = get_table_format(input_file)
+    if table_format:
+        return TableSession(input_file, table_format)
+    return WorkbookSession(input_file)
+
+
+def get_table_headers(table_name):
+    title = get_sheet_title(table_name)
+    if title == 'Customers':
+        return list(COL_HEADERS.values())
+    col_headers = get_col_headers_by_ws_type(get_ws_type_by_worksheet_name(title))
+    return list(col_headers.values()) if col_headers else []
+
+
+def _import_parquet():
+    try:
+        import pyarrow
+        from pyarrow import parquet
+    except ImportError:
+        raise ClickException('The parquet format requires the pyarrow package, please install it.')
+    return pyarrow, parquet
+
+
+class TableWriter(SheetWriter):
+    def __init__(self, path):
+        self.path = path
+        self.row_idx = 0
+        self.closed = False
+        self._headers = None
+        self._columns = 0
+
+    def set_widths(self, widths, auto_size=False):
+        self._columns = max(
+            [self._columns] + [column_index_from_string(letter) for letter in widths.keys()],
+        )
+
+    def cell(self, value, **styles):
+        return value
+
+    def merge(self, cell_range):
+        pass
+
+    def validate(self, letter, validation, row_idx=None):
+        pass
+
+    def append(self, values, styles=None, validations=None):
+        if self._headers is None:
+            values = list(values) + [None] * (self._columns - len(values))
+            self._headers = [
+                value if value is not None else get_column_letter(col_idx)
+                for col_idx, value in enumerate(values, start=1)
+            ]
+            self._open()
+        else:
+            values = list(values)[:len(self._headers)]
+            self._write(values + [None] * (len(self._headers) - len(values)))
+        self.row_idx += 1
+
+    def close(self):
+        if self.closed:
+            return
+        if self._headers is None:
+            self._headers = []
+            self._open()
+        self._close()
+        self.closed = True
+
+    def _open(self):
+        raise NotImplementedError()
+
+    def _write(self, values):
+        raise NotImplementedError()
+
+    def _close(self):
+        self._file.close()
+
+
+class CsvTableWriter(TableWriter):
+    def _open(self):
+        self._file = open(self.path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self._headers)
+
+    def _write(self, values):
+        self._writer.writerow(values)
+
+
+class JsonlTableWriter(TableWriter):
+    def _open(self):
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def _write(self, values):
+        self._file.write(f'{json.dumps(dict(zip(self._headers, values)), default=str)}\n')
+
+
+class ParquetTableWriter(TableWriter):
+    def _open(self):
+        self._pyarrow, parquet = _import_parquet()
+        self._schema = self._pyarrow.schema(
+            [(header, self._pyarrow.string()) for header in self._headers],
+        )
+        self._writer = parquet.ParquetWriter(self.path, self._schema)
+        self._batch = []
+
+    def _write(self, values):
+        self._batch.append([None if value is None else str(value) for value in values])
+        if len(self._batch) >= PARQUET_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        columns = [
+            self._pyarrow.array([values[col_idx] for values in self._batch], type=self._pyarrow.string())
+            for col_idx in range(len(self._headers))
+        ]
+        self._writer.write_table(self._pyarrow.Table.from_arrays(columns, schema=self._schema))
+        self._batch = []
+
+    def _close(self):
+        if self._batch:
+            self._flush()
+        self._writer.close()
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as table_file:
+        for values in csv.reader(table_file):
+            yield [value if value != '' else None for value in values]
+
+
+def _read_jsonl(path):
+    known_headers = get_table_headers(os.path.splitext(os.path.basename(path))[0])
+    headers = None
+    with open(path, encoding='utf-8') as table_file:
+        for line in table_file:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if headers is None:
+                headers = [header for header in known_headers if header in row]
+                headers += [header for header in row.keys() if header not in headers]
+                yield list(headers)
+            yield [row.get(header) for header in headers]
+    if headers is None and known_headers:
+        yield list(known_headers)
+
+
+def _read_parquet(path):
+    _, parquet = _import_parquet()
+    parquet_file = parquet.ParquetFile(path)
+    headers = parquet_file.schema_arrow.names
+    yield list(headers)
+    for batch in parquet_file.iter_batches(batch_size=PARQUET_BATCH_SIZE):
+        for row in batch.to_pylist():
+            yield [row[header] for header in headers]
+
+
+_TABLE_WRITERS = {
+    'csv': CsvTableWriter,
+    'jsonl': JsonlTableWriter,
+    'parquet': ParquetTableWriter,
+}
+
+_TABLE_READERS = {
+    'csv': _read_csv,
+    'jsonl': _read_jsonl,
+    'parquet': _read_parquet,
+}
+
+
+class _TableCell:
+    def __init__(self, value):
+        self.value = value
+
+
+class TableSheet:
+    def __init__(self, path, table_format):
+        self.path = path
+        self.table_format = table_format
+        self.max_row = None
+        self._rows = None
+
+    def iter_rows(self, min_row=1, max_row=None, max_col=None, values_only=True):
+        for row_idx, values in enumerate(_TABLE_READERS[self.table_format](self.path), start=1):
+            if max_row is not None and row_idx > max_row:
+                return
+            if row_idx < min_row:
+                continue
+            if max_col is not None:
+                values = values[:max_col] + [None] * (max_col - len(values))
+            yield tuple(values)
+
+    def __getitem__(self, coordinate):
+        if self._rows is None:
+            self._rows = list(self.iter_rows())
+        column, row = coordinate_from_string(coordinate)
+        col_idx = column_index_from_string(column)
+        values = self._rows[row - 1] if row <= len(self._rows) else ()
+        return _TableCell(values[col_idx - 1] if col_idx <= len(values) else None)
+
+
+class TableBook:
+    def __init__(self, path, table_format):
+        self.path = path
+        self.table_format = table_format
+        self._writers = []
+
+    @property
+    def sheetnames(self):
+        extension = f'.{self.table_format}'
+        return [
+            get_sheet_title(file_name[:-len(extension)])
+            for file_name in sorted(os.listdir(self.path))
+            if file_name.endswith(extension)
+        ]
+
+    def get_path(self, title):
+        return os.path.join(self.path, f'{get_table_name(title)}.{self.table_format}')
+
+    def __getitem__(self, title):
+        path = self.get_path(title)
+        if not os.path.isfile(path):
+            raise KeyError(f'Worksheet {title} does not exist.')
+        return TableSheet(path, self.table_format)
+
+    def create_sheet(self, title, path=None):
+        os.makedirs(self.path, exist_ok=True)
+        writer = _TABLE_WRITERS[self.table_format](path or self.get_path(title))
+        self._writers.append(writer)
+        return writer
+
+    def save(self, output_file=None):
+        for writer in self._writers:
+            writer.close()
+        self._writers = []
+
+    def close(self):
+        pass
+
+
+class TableSession(WorkbookSession):
+    def __init__(self, input_file, table_format):
+        super(TableSession, self).__init__(input_file)
+        self.table_format = table_format
+
+    @property
+    def workbook(self):
+        if self._wb is None:
+            self._wb = TableBook(self.input_file, self.table_format)
+        return self._wb
+
+    def save(self, output_file=None):
+        output_file = output_file or self.input_file
+        self.close()
+        source = TableBook(self.input_file, self.table_format)
+        target = TableBook(output_file, self.table_format)
+        for title in source.sheetnames:
+            patch = self._patches.get(title)
+            if output_file == self.input_file and not patch:
+                continue
+            path = target.get_path(title)
+            writer = target.create_sheet(title, f'{path}.tmp')
+            rows = patch.get_rows() if patch else {}
+            for row_idx, values in enumerate(source[title].iter_rows(), start=1):
+                values = list(values)
+                for col_idx, value in rows.get(row_idx, {}).items():
+                    values += [None] * (col_idx - len(values))
+                    values[col_idx - 1] = value
+                writer.append(values)
+            writer.close()
+            os.replace(f'{path}.tmp', path)
+        self._patches = {}
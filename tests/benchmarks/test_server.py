@@ -0,0 +1,79 @@
+import pytest
+
+from benchmarks.run import compare, run_scenario
+from benchmarks.server import MockConnectServer, PRODUCT_ID
+from connect.cli.core.scheduler import create_client
+from connect.client import ClientError, R
+
+
+@pytest.fixture
+def server():
+    with MockConnectServer(items=250, accounts=30) as server:
+        yield server
+
+
+def test_server_pages_collections(server):
+    client = create_client('ApiKey SU:123', server.api_url)
+
+    items = list(client.products[PRODUCT_ID].items.all())
+
+    assert len(items) == 250
+    assert len({item['id'] for item in items}) == 250
+    assert server.requests == 3
+    assert client.products[PRODUCT_ID].parameters.filter(R().phase.eq('fulfillment')).count() == 2
+    assert client.ns('tier').accounts.filter(R().type.eq('reseller')).count() == 3
+
+
+def test_server_mutations(server):
+    client = create_client('ApiKey SU:123', server.api_url)
+
+    item = client.products[PRODUCT_ID].items.create({'name': 'New item', 'mpn': 'NEW'})
+    client.products[PRODUCT_ID].items[item['id']].update({'name': 'Renamed'})
+    assert client.products[PRODUCT_ID].items.filter(R().mpn.eq('NEW')).first()['name'] == 'Renamed'
+    client.products[PRODUCT_ID].items[item['id']].delete()
+    assert client.products[PRODUCT_ID].items.all().count() == 250
+
+    product = client.products.create({'name': 'Clone'})
+    assert client.products[product['id']].items.all().count() == 0
+    assert server.requests_by_method == {'POST': 2, 'PUT': 1, 'GET': 3, 'DELETE': 1}
+
+    with pytest.raises(ClientError) as e:
+        client.products['PRD-000-000-000'].get()
+    assert e.value.status_code == 404
+
+
+def test_server_page_size():
+    with MockConnectServer(items=10, page_size=50) as server:
+        client = create_client('ApiKey SU:123', server.api_url)
+        with pytest.raises(ClientError) as e:
+            list(client.products[PRODUCT_ID].items.all())
+        assert e.value.status_code == 400
+
+
+def test_run_scenario():
+    result = run_scenario('customers-export', 20, latency=0.001)
+
+    assert result['scenario'] == 'customers-export'
+    assert result['requests'] == 2
+    assert result['peak_rss'] > 0
+    assert result['rows_per_sec'] == pytest.approx(20 / result['wall_time'])
+
+
+def test_compare():
+    baseline = {
+        'results': [
+            {'scenario': 'export', 'size': 100, 'wall_time': 1, 'requests': 20, 'peak_rss': 100},
+            {'scenario': 'sync', 'size': 100, 'wall_time': 1, 'requests': 20, 'peak_rss': 100},
+        ],
+    }
+    results = [
+        {'scenario': 'export', 'size': 100, 'wall_time': 1.1, 'requests': 20, 'peak_rss': 150},
+        {'scenario': 'sync', 'size': 100, 'wall_time': 2, 'requests': 21, 'peak_rss': 100},
+        {'scenario': 'clone', 'size': 100, 'wall_time': 5, 'requests': 50, 'peak_rss': 100},
+    ]
+
+    assert compare(results, baseline, threshold=0.2) == [
+        'export (100 rows): peak_rss went from 100.00 to 150.00',
+        'sync (100 rows): wall_time went from 1.00 to 2.00',
+        'sync (100 rows): requests went from 20 to 21',
+    ]
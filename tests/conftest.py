@@ -9,7 +9,11 @@ from fs.tempfs import TempFS
 from openpyxl import load_workbook
 
 from connect.cli.core.base import cli
+from connect.cli.core.cache.helpers import set_response_cache
 from connect.cli.core.plugins import load_plugins
+from connect.cli.core.scheduler import clear_schedulers
+from connect.cli.plugins.product.categories import clear_category_indexes
+from connect.cli.plugins.product.units import clear_unit_indexes
 
 from tests.data import CONFIG_DATA
 
@@ -19,6 +23,26 @@ def fs():
     return TempFS()
 
 
+@pytest.fixture(autouse=True)
+def catalog_indexes():
+    yield
+    clear_category_indexes()
+    clear_unit_indexes()
+
+
+@pytest.fixture(autouse=True)
+def response_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('CCLI_CACHE_DIR', str(tmp_path / 'cache'))
+    yield
+    set_response_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def schedulers():
+    yield
+    clear_schedulers()
+
+
 @pytest.fixture(scope='session')
 def ccli():
     load_plugins(cli)
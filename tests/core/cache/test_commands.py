@@ -0,0 +1,45 @@
+from click.testing import CliRunner
+
+from connect.cli.core.base import cli
+from connect.cli.core.cache.helpers import ResponseCache
+from connect.client import ConnectClient
+
+
+def _fill_cache(cache_dir):
+    client = ConnectClient('ApiKey SU:123', endpoint='https://localhost/public/v1', use_specs=False)
+    cache = ResponseCache(cache_dir)
+    cache.set(client, 'categories', [{'id': 'CAT-1', 'name': 'Category'}], 60 * 60)
+    cache.set(client, 'settings/units', [], 24 * 60 * 60)
+
+
+def test_cache_stats(fs, monkeypatch):
+    monkeypatch.delenv('CCLI_CACHE_DIR')
+    _fill_cache(f'{fs.root_path}/.ccli/cache')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['-c', f'{fs.root_path}/.ccli', 'cache', 'stats'])
+
+    assert result.exit_code == 0
+    assert 'categories' in result.output
+    assert 'settings/units' in result.output
+    assert '2 cached responses' in result.output
+
+
+def test_cache_stats_empty(fs):
+    runner = CliRunner()
+    result = runner.invoke(cli, ['-c', f'{fs.root_path}/.ccli', 'cache', 'stats'])
+
+    assert result.exit_code == 0
+    assert 'is empty' in result.output
+
+
+def test_cache_clear(fs, monkeypatch):
+    monkeypatch.setenv('CCLI_CACHE_DIR', f'{fs.root_path}/shared')
+    _fill_cache(f'{fs.root_path}/shared')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['-c', f'{fs.root_path}/.ccli', 'cache', 'clear'])
+
+    assert result.exit_code == 0
+    assert '2 cached responses removed.' in result.output
+    assert ResponseCache(f'{fs.root_path}/shared').get_entries() == []
@@ -0,0 +1,153 @@
+import os
+import time
+
+from connect.cli.core.cache.helpers import (
+    get_cache_dir,
+    get_cached_collection,
+    get_response_cache,
+    invalidate_cached_collection,
+    ResponseCache,
+    set_response_cache,
+)
+from connect.cli.plugins.product.api import create_unit
+from connect.cli.plugins.product.units import get_unit_index
+from connect.client import ConnectClient
+
+
+def _get_client(api_key='ApiKey SU:123'):
+    return ConnectClient(
+        use_specs=False,
+        api_key=api_key,
+        endpoint='https://localhost/public/v1',
+    )
+
+
+def test_get_cache_dir(monkeypatch):
+    monkeypatch.delenv('CCLI_CACHE_DIR')
+    assert get_cache_dir('/home/user/.ccli') == os.path.join('/home/user/.ccli', 'cache')
+
+    monkeypatch.setenv('CCLI_CACHE_DIR', '/var/cache/ccli')
+    assert get_cache_dir('/home/user/.ccli') == '/var/cache/ccli'
+
+
+def test_cache_per_account(fs):
+    cache = ResponseCache(fs.root_path)
+
+    cache.set(_get_client(), 'categories', [{'id': 'CAT-1'}], 60)
+
+    assert cache.get(_get_client(), 'categories') == [{'id': 'CAT-1'}]
+    assert cache.get(_get_client('ApiKey SU:456'), 'categories') is None
+    assert cache.get(_get_client(), 'hubs') is None
+    assert ResponseCache(fs.root_path).get(_get_client(), 'categories') == [{'id': 'CAT-1'}]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    entries = cache.get_entries()
+    assert len(entries) == 1
+    assert entries[0]['resource'] == 'categories'
+    assert entries[0]['endpoint'] == 'https://localhost/public/v1'
+
+
+def test_cache_expired(fs, mocker):
+    cache = ResponseCache(fs.root_path)
+    cache.set(_get_client(), 'categories', [], 60)
+
+    mocker.patch('connect.cli.core.cache.helpers.time.time', return_value=time.time() + 61)
+
+    assert cache.get(_get_client(), 'categories') is None
+
+
+def test_cache_evicts_least_recently_used(fs, mocker):
+    clock = mocker.patch('connect.cli.core.cache.helpers.time.time', return_value=1000)
+    cache = ResponseCache(fs.root_path, max_entries=2)
+    client = _get_client()
+
+    cache.set(client, 'categories', [], 60)
+    clock.return_value += 1
+    cache.set(client, 'hubs', [], 60)
+    clock.return_value += 1
+    cache.get(client, 'categories')
+    clock.return_value += 1
+    cache.set(client, 'marketplaces', [], 60)
+
+    assert [entry['resource'] for entry in cache.get_entries()] == ['categories', 'marketplaces']
+    assert len([name for name in os.listdir(fs.root_path) if name.endswith('.json')]) == 2
+
+
+def test_cache_shared_by_processes(fs):
+    first, second = ResponseCache(fs.root_path), ResponseCache(fs.root_path)
+
+    first.set(_get_client(), 'categories', [], 60)
+    second.set(_get_client(), 'hubs', [], 60)
+    first.get(_get_client(), 'categories')
+
+    assert [entry['resource'] for entry in second.get_entries()] == ['categories', 'hubs']
+
+
+def test_cache_evicts_orphaned_files(fs):
+    with open(os.path.join(fs.root_path, f'{"0" * 64}.json'), 'w') as f:
+        f.write('a' * 100)
+    cache = ResponseCache(fs.root_path, max_size=100)
+
+    cache.set(_get_client(), 'categories', [], 60)
+
+    assert not os.path.exists(os.path.join(fs.root_path, f'{"0" * 64}.json'))
+    assert [entry['resource'] for entry in cache.get_entries()] == ['categories']
+
+
+def test_cache_evicts_by_size(fs):
+    cache = ResponseCache(fs.root_path, max_size=100)
+    client = _get_client()
+
+    cache.set(client, 'categories', ['a' * 60], 60)
+    cache.set(client, 'hubs', ['b' * 60], 60)
+
+    assert [entry['resource'] for entry in cache.get_entries()] == ['hubs']
+
+
+def test_cache_clear(fs):
+    cache = ResponseCache(fs.root_path)
+    cache.set(_get_client(), 'categories', [], 60)
+    cache.set(_get_client(), 'hubs', [], 60)
+
+    assert cache.clear() == 2
+    assert cache.get_entries() == []
+    assert os.listdir(fs.root_path) == []
+
+
+def test_get_cached_collection(fs):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return iter([{'id': 'HB-1'}])
+
+    assert get_cached_collection(_get_client(), 'hubs', 60, fetch) == [{'id': 'HB-1'}]
+    set_response_cache(ResponseCache(fs.root_path))
+    assert get_cached_collection(_get_client(), 'hubs', 60, fetch) == [{'id': 'HB-1'}]
+    assert get_cached_collection(_get_client(), 'hubs', 60, fetch) == [{'id': 'HB-1'}]
+    assert len(calls) == 2
+
+    invalidate_cached_collection(_get_client(), 'hubs')
+    assert get_response_cache().get(_get_client(), 'hubs') is None
+
+
+def test_create_unit_invalidates_units(fs, mocked_responses):
+    set_response_cache(ResponseCache(fs.root_path))
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/settings/units',
+        json=[{'id': 'unit', 'type': 'reservation', 'description': 'Units'}],
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/settings/units',
+        json={'id': 'seat', 'type': 'reservation', 'description': 'Seats'},
+    )
+    client = _get_client()
+
+    get_unit_index(client).load()
+    assert get_response_cache().get(client, 'settings/units') is not None
+
+    create_unit(client, {'description': 'Seats', 'type': 'reservation', 'unit': 'unit'})
+
+    assert get_response_cache().get(client, 'settings/units') is None
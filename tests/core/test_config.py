@@ -14,6 +14,7 @@ def test_load(config_mocker, mocker):
     assert config.active is not None
     assert config.active.id == 'VA-000'
     assert len(config.accounts) == 2
+    assert config.config_dir == '/tmp'
 
 
 def test_store(mocker):
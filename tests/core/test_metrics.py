@@ -0,0 +1,121 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from connect.cli.core.base import cli
+from connect.cli.core.metrics import (
+    get_endpoint_template,
+    get_metrics,
+    get_percentile,
+    print_metrics,
+    RequestMetrics,
+)
+from connect.cli.core.scheduler import AdaptiveConcurrency, RequestScheduler, TokenBucket
+
+
+class _Response:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+@pytest.mark.parametrize(
+    ('url', 'template'),
+    (
+        ('https://localhost/public/v1/products', 'products'),
+        ('https://localhost/public/v1/products/PRD-276-377-545/items?limit=100', 'products/{id}/items'),
+        ('https://localhost/public/v1/products/PRD-276-377-545/items/PRD-276-377-545-0001', 'products/{id}/items/{id}'),
+        ('https://localhost/products/PRD-1/parameters/PRM-1', 'products/{id}/parameters/{id}'),
+    ),
+)
+def test_get_endpoint_template(url, template):
+    assert get_endpoint_template(url) == template
+
+
+def test_get_percentile():
+    values = [0.5, 0.1, 0.4, 0.2, 0.3]
+
+    assert get_percentile(values, 50) == 0.3
+    assert get_percentile(values, 95) == 0.5
+    assert get_percentile([0.1], 99) == 0.1
+
+
+def test_metrics_summary_and_spans(capsys):
+    metrics = RequestMetrics()
+    metrics.record('get', 'https://localhost/public/v1/products', 10, 0.1, _Response(200))
+    assert metrics.requests == []
+
+    metrics.start('ccli product')
+    metrics.record('get', 'https://localhost/public/v1/products/PRD-1/items', 10, 0.1, _Response(200, b'[]'))
+    metrics.record(
+        'get',
+        'https://localhost/public/v1/products/PRD-2/items',
+        11,
+        0.3,
+        _Response(200, headers={'Content-Length': '2048'}),
+        retries=2,
+    )
+    metrics.record('post', 'https://localhost/public/v1/products/PRD-2/items', 12, 0.2, _Response(400))
+    metrics.record('get', 'https://localhost/public/v1/products/PRD-3', 13, 0.5, error='ConnectionError')
+    metrics.stop()
+
+    summary = {(endpoint['endpoint'], endpoint['method']): endpoint for endpoint in metrics.get_summary()}
+    items = summary[('products/{id}/items', 'GET')]
+    assert items['count'] == 2
+    assert items['retries'] == 2
+    assert items['bytes'] == 2050
+    assert items['p50'] == 0.1
+    assert items['p99'] == 0.3
+    assert items['total'] == pytest.approx(0.4)
+    assert summary[('products/{id}/items', 'POST')]['errors'] == 1
+    assert summary[('products/{id}', 'GET')]['errors'] == 1
+
+    spans = metrics.to_spans()['resourceSpans'][0]['scopeSpans'][0]['spans']
+    assert spans[0]['name'] == 'ccli product'
+    assert len(spans) == 5
+    assert {span['traceId'] for span in spans} == {spans[0]['traceId']}
+    assert all(span['parentSpanId'] == spans[0]['spanId'] for span in spans[1:])
+    assert spans[1]['name'] == 'GET products/{id}/items'
+    assert spans[1]['startTimeUnixNano'] == '10000000000'
+    assert spans[1]['endTimeUnixNano'] == '10100000000'
+    assert spans[3]['status'] == {'code': 2}
+    assert {'key': 'error.type', 'value': {'stringValue': 'ConnectionError'}} in spans[4]['attributes']
+
+    print_metrics(metrics)
+    assert 'products/{id}/items' in capsys.readouterr().err
+
+
+def test_scheduler_records_requests():
+    metrics = get_metrics()
+    metrics.start('test')
+    responses = [_Response(429), _Response(200)]
+    scheduler = RequestScheduler(
+        bucket=TokenBucket(rate=1000, burst=1000),
+        concurrency=AdaptiveConcurrency(),
+        backoff_base=0,
+    )
+
+    scheduler.request(lambda *args, **kwargs: responses.pop(0), 'get', 'https://localhost/public/v1/products', {})
+    metrics.stop()
+
+    assert len(metrics.requests) == 1
+    assert metrics.requests[0]['status'] == 200
+    assert metrics.requests[0]['retries'] == 1
+    assert metrics.requests[0]['endpoint'] == 'products'
+
+
+def test_cli_writes_trace(fs):
+    trace_file = f'{fs.root_path}/trace.json'
+    runner = CliRunner()
+    runner.invoke(
+        cli,
+        ['-c', f'{fs.root_path}/.ccli', '--metrics', '--trace', trace_file, 'account', 'list'],
+    )
+
+    with open(trace_file) as f:
+        trace = json.load(f)
+    assert trace['command'].endswith(' account')
+    assert trace['requests'] == []
+    assert get_metrics().enabled is False
@@ -1,18 +1,18 @@
-import click
+from importlib.metadata import EntryPoint
 
-from pkg_resources import EntryPoint
+import click
 
-from connect.cli.core.plugins import load_plugins
+from connect.cli.core.plugins import get_entry_points, LazyGroup, load_plugins
 
 
 def test_load_plugins(mocker):
 
-    cli = click.Group()
+    cli = LazyGroup()
 
     grp_internal = click.MultiCommand('internal')
     grp_external = click.MultiCommand('external')
 
-    mocker.patch.object(
+    mocked_load = mocker.patch.object(
         EntryPoint,
         'load',
         side_effect=[
@@ -21,22 +21,28 @@ def test_load_plugins(mocker):
         ],
     )
     mocker.patch(
-        'connect.cli.core.plugins.pkg_resources.iter_entry_points',
-        return_value=iter([
-            EntryPoint('internal', 'connect.cli.plugins.internal'),
-            EntryPoint('external', 'external.cli.plugin'),
-        ]),
+        'connect.cli.core.plugins.get_entry_points',
+        return_value=[
+            EntryPoint('internal', 'connect.cli.plugins.internal:get_group', 'connect.cli.plugins'),
+            EntryPoint('external-plugin', 'external.cli.plugin:get_group', 'connect.cli.plugins'),
+        ],
     )
 
     load_plugins(cli)
 
-    assert 'internal' in cli.commands
-    assert 'plugin' in cli.commands
-    assert 'external' in cli.commands['plugin'].commands
+    mocked_load.assert_not_called()
+    assert cli.list_commands(None) == ['internal', 'plugin']
+    assert cli.get_command(None, 'internal') is grp_internal
+    assert cli.get_command(None, 'internal') is grp_internal
+    assert cli.get_command(None, 'missing') is None
+    grp_plugins = cli.get_command(None, 'plugin')
+    assert grp_plugins.list_commands(None) == ['external']
+    assert grp_plugins.get_command(None, 'external') is grp_external
+    assert mocked_load.call_count == 2
 
 
 def test_load_no_external(mocker):
-    cli = click.Group()
+    cli = LazyGroup()
     grp_internal = click.MultiCommand('internal')
 
     mocker.patch.object(
@@ -47,13 +53,20 @@ def test_load_no_external(mocker):
         ],
     )
     mocker.patch(
-        'connect.cli.core.plugins.pkg_resources.iter_entry_points',
-        return_value=iter([
-            EntryPoint('internal', 'connect.cli.plugins.internal'),
-        ]),
+        'connect.cli.core.plugins.get_entry_points',
+        return_value=[
+            EntryPoint('internal', 'connect.cli.plugins.internal:get_group', 'connect.cli.plugins'),
+        ],
     )
 
     load_plugins(cli)
 
-    assert 'internal' in cli.commands
-    assert 'plugin' not in cli.commands
+    assert 'internal' in cli.list_commands(None)
+    assert 'plugin' not in cli.list_commands(None)
+    assert cli.get_command(None, 'internal') is grp_internal
+
+
+def test_get_entry_points():
+    entry_points = {entrypoint.name: entrypoint.value for entrypoint in get_entry_points('connect.cli.plugins')}
+
+    assert entry_points['product'] == 'connect.cli.plugins.product.commands:get_group'
@@ -0,0 +1,202 @@
+import pytest
+import requests
+
+from connect.cli.core.scheduler import (
+    AdaptiveConcurrency,
+    clear_schedulers,
+    create_client,
+    get_backoff,
+    get_retry_after,
+    get_scheduler,
+    RequestScheduler,
+    ScheduledClient,
+    TokenBucket,
+)
+from connect.client import ClientError
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _get_scheduler(max_retries=3):
+    return RequestScheduler(
+        bucket=TokenBucket(rate=1000, burst=1000),
+        concurrency=AdaptiveConcurrency(limit=8),
+        max_retries=max_retries,
+        backoff_base=0,
+    )
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    (
+        (None, None),
+        ('3', 3),
+        ('-1', 0),
+        ('Wed, 21 Oct 2015 07:28:00 GMT', 0),
+        ('soon', None),
+    ),
+)
+def test_get_retry_after(value, expected):
+    headers = {'Retry-After': value} if value else {}
+    assert get_retry_after(_Response(429, headers)) == expected
+
+
+def test_get_backoff():
+    for retries in range(1, 10):
+        delay = get_backoff(retries, base=1, maximum=8)
+        expected = min(8, 2 ** (retries - 1))
+        assert expected / 2 <= delay <= expected
+
+
+def test_token_bucket_waits_for_tokens(mocker):
+    clock = [100.0]
+    waits = []
+
+    def sleep(delay):
+        waits.append(round(delay, 3))
+        clock[0] += delay
+
+    mocker.patch('connect.cli.core.scheduler.time.monotonic', side_effect=lambda: clock[0])
+    mocker.patch('connect.cli.core.scheduler.time.sleep', side_effect=sleep)
+    bucket = TokenBucket(rate=4, burst=2)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert waits == [0.25, 0.25]
+    bucket.slow_down()
+    assert bucket.rate == 2
+    bucket.speed_up()
+    assert bucket.rate == 2.04
+
+
+def test_adaptive_concurrency():
+    concurrency = AdaptiveConcurrency(limit=2, max_limit=4, latency_tolerance=2)
+
+    concurrency.acquire()
+    concurrency.acquire()
+    concurrency.release(0.1)
+    assert concurrency.limit == 2.5
+    concurrency.release(0.1, throttled=True)
+    assert concurrency.limit == 1.25
+    assert concurrency.in_flight == 0
+
+
+def test_adaptive_concurrency_mixed_latencies():
+    concurrency = AdaptiveConcurrency(limit=8)
+
+    concurrency.acquire()
+    concurrency.release(0.02, endpoint='products/{id}/items')
+    for idx in range(200):
+        concurrency.acquire()
+        concurrency.release(0.1 + idx % 10 / 100, endpoint='products/{id}/items')
+        concurrency.acquire()
+        concurrency.release(0.01, endpoint='products/{id}/parameters')
+        concurrency.acquire()
+        concurrency.release(0.5, endpoint='products/{id}/media')
+    assert concurrency.limit >= 8
+
+
+def test_adaptive_concurrency_sustained_degradation():
+    concurrency = AdaptiveConcurrency(limit=8)
+
+    for _ in range(10):
+        concurrency.acquire()
+        concurrency.release(0.05, endpoint='products')
+    concurrency.acquire()
+    concurrency.release(1, endpoint='products')
+    assert concurrency.limit == 8
+    for _ in range(5):
+        concurrency.acquire()
+        concurrency.release(1, endpoint='products')
+    assert concurrency.limit == 8 * 0.9 * 0.9
+
+
+def test_scheduler_retries_throttled_requests():
+    responses = [_Response(429, {'Retry-After': '0'}), _Response(503), _Response(200)]
+    calls = []
+
+    def send(method, url, **kwargs):
+        calls.append((method, url))
+        return responses[len(calls) - 1]
+
+    scheduler = _get_scheduler()
+    response = scheduler.request(send, 'post', 'https://localhost/public/v1/products', {})
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert scheduler.concurrency.limit < 8
+    assert scheduler.bucket.rate < 1000
+
+
+def test_scheduler_gives_up():
+    scheduler = _get_scheduler(max_retries=2)
+    calls = []
+
+    def send(method, url, **kwargs):
+        calls.append(method)
+        return _Response(502)
+
+    assert scheduler.request(send, 'get', 'https://localhost', {}).status_code == 502
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(('method', 'calls'), (('get', 2), ('post', 1)))
+def test_scheduler_retries_connection_errors_on_get(method, calls):
+    scheduler = _get_scheduler(max_retries=1)
+    sent = []
+
+    def send(method, url, **kwargs):
+        sent.append(method)
+        raise requests.ConnectionError()
+
+    with pytest.raises(requests.ConnectionError):
+        scheduler.request(send, method, 'https://localhost', {})
+
+    assert len(sent) == calls
+    assert scheduler.concurrency.in_flight == 0
+
+
+def test_scheduler_per_account():
+    clear_schedulers()
+    scheduler = get_scheduler('https://localhost/public/v1', 'ApiKey SU:123')
+
+    assert get_scheduler('https://localhost/public/v1', 'ApiKey SU:123') is scheduler
+    assert get_scheduler('https://localhost/public/v1', 'ApiKey SU:456') is not scheduler
+    assert create_client('ApiKey SU:123', 'https://localhost/public/v1')._scheduler is scheduler
+    clear_schedulers()
+
+
+def test_scheduled_client(mocked_responses):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-000',
+        status=429,
+        headers={'Retry-After': '0'},
+    )
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-000',
+        json={'id': 'PRD-000'},
+    )
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-001',
+        status=404,
+    )
+    client = ScheduledClient(
+        'ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+        use_specs=False,
+        scheduler=_get_scheduler(),
+    )
+
+    assert client.products['PRD-000'].get() == {'id': 'PRD-000'}
+    with pytest.raises(ClientError) as e:
+        client.products['PRD-001'].get()
+    assert e.value.status_code == 404
+    assert len(mocked_responses.calls) == 3
@@ -1,5 +1,11 @@
+import json
+import threading
+import time
+
+import requests
+
 from connect.cli.core import utils
-from connect.cli.core.constants import PYPI_JSON_API_URL
+from connect.cli.core.constants import PYPI_JSON_API_URL, VERSION_CHECK_TTL
 
 
 def test_continue_or_quit_c(mocker):
@@ -42,3 +48,61 @@ def test_check_for_updates_is_latest(mocker, capsys, mocked_responses):
 
     assert 'You are running CloudBlue Connect CLI version 1.0.0. ' not in captured.out
     assert 'A newer version is available: 2.0.0' not in captured.out
+
+
+def test_check_for_updates_uses_cache(mocker, capsys, fs):
+    mocker.patch('connect.cli.core.utils.get_version', return_value='1.0.0')
+    mocked_fetch = mocker.patch('connect.cli.core.utils.fetch_latest_version')
+    with open(f'{fs.root_path}/version_check.json', 'w') as f:
+        json.dump({'checked_at': time.time(), 'version': '2.0.0'}, f)
+
+    utils.check_for_updates(fs.root_path)
+
+    mocked_fetch.assert_not_called()
+    assert 'A newer version is available: 2.0.0' in capsys.readouterr().out
+
+
+def test_check_for_updates_refreshes_cache(mocker, fs, mocked_responses):
+    mocked_register = mocker.patch('connect.cli.core.utils.atexit.register')
+    mocked_responses.add('GET', PYPI_JSON_API_URL, json={'info': {'version': '2.0.0'}})
+    with open(f'{fs.root_path}/version_check.json', 'w') as f:
+        json.dump({'checked_at': time.time() - VERSION_CHECK_TTL - 1, 'version': '1.0.0'}, f)
+
+    assert utils.get_latest_version(fs.root_path) == '1.0.0'
+
+    join, timeout = mocked_register.call_args[0]
+    join(timeout)
+    with open(f'{fs.root_path}/version_check.json') as f:
+        assert json.load(f)['version'] == '2.0.0'
+
+
+def test_check_for_updates_failure_is_cached(mocker, fs, mocked_responses):
+    mocked_responses.add('GET', PYPI_JSON_API_URL, body=requests.ConnectionError())
+    config_dir = f'{fs.root_path}/.ccli'
+
+    assert utils.get_latest_version(config_dir) is None
+    assert utils.get_latest_version(config_dir) is None
+    assert len(mocked_responses.calls) == 1
+
+
+def test_check_for_updates_offline(mocker, fs):
+    mocker.patch.dict('os.environ', {'CCLI_OFFLINE': '1'})
+    mocked_fetch = mocker.patch('connect.cli.core.utils.fetch_latest_version')
+
+    assert utils.get_latest_version(fs.root_path) is None
+    mocked_fetch.assert_not_called()
+
+
+def test_check_for_updates_timeout(mocker, fs):
+    event = threading.Event()
+    mocked_fetch = mocker.patch(
+        'connect.cli.core.utils.fetch_latest_version',
+        side_effect=lambda timeout: event.wait(),
+    )
+
+    started_at = time.monotonic()
+    assert utils.get_latest_version(fs.root_path, timeout=0.1) is None
+    assert utils.get_latest_version(fs.root_path, timeout=0.1) is None
+    assert time.monotonic() - started_at < 1
+    assert mocked_fetch.call_count == 1
+    event.set()
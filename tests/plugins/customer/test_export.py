@@ -32,3 +32,7 @@ def test_dump_customers(fs, mocked_responses, mocked_customer, mocked_reseller):
     ws = customers_wb['Customers']
     assert len(ws['A']) == 3
     assert ws['A2'].value == mocked_customer['id']
+    assert ws['A1'].fill.fgColor.rgb == '00d3d3d3'
+    assert [str(validation.sqref) for validation in ws.data_validations.dataValidation] == ['D2:D3', 'F2:F3']
+    countries_ws = customers_wb['Countries']
+    assert countries_ws.cell(countries_ws.max_row, 2).value == 'Not Selected'
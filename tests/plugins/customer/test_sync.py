@@ -1,4 +1,6 @@
-from connect.cli.plugins.customer.sync import CustomerSynchronizer
+import json
+
+from connect.cli.plugins.customer.sync import _get_levels, _RowData, CustomerSynchronizer
 from connect.client import ConnectClient
 
 
@@ -129,8 +131,8 @@ def test_update_customer_no_account_connect(fs, customers_workbook, mocked_respo
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/tier/accounts/TA-7374-0753-1907',
-        status=404,
+        url='https://localhost/public/v1/tier/accounts?in(id,(TA-7374-0753-1907))&limit=1000&offset=0',
+        json=[],
     )
     synchronizer = CustomerSynchronizer(
         account_id='VA-123',
@@ -209,8 +211,8 @@ def test_create_account_connect_parent_id(
     )
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts/{mocked_reseller["id"]}',
-        json=mocked_reseller,
+        url=f'https://localhost/public/v1/tier/accounts?in(id,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[mocked_reseller],
     )
     synchronizer = CustomerSynchronizer(
         account_id='VA-123',
@@ -236,8 +238,8 @@ def test_create_account_connect_parent_id_not_found(
 
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts/{mocked_reseller["id"]}',
-        status=404,
+        url=f'https://localhost/public/v1/tier/accounts?in(id,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[],
     )
     synchronizer = CustomerSynchronizer(
         account_id='VA-123',
@@ -264,19 +266,8 @@ def test_create_account_connect_parent_external_id(
 
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_id,{mocked_reseller["id"]})&limit=0&offset=0',
-        json=[mocked_reseller],
-        headers={
-            'Content-Range': 'items 0-1/1',
-        },
-    )
-    mocked_responses.add(
-        method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_id,{mocked_reseller["id"]})&limit=1&offset=0',
-        json=[mocked_reseller],
-        headers={
-            'Content-Range': 'items 0-1/1',
-        },
+        url=f'https://localhost/public/v1/tier/accounts?in(external_id,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[dict(mocked_reseller, external_id=mocked_reseller['id'])],
     )
     mocked_responses.add(
         method='POST',
@@ -308,11 +299,8 @@ def test_create_account_connect_parent_external_id_not_found(
 
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_id,{mocked_reseller["id"]})&limit=0&offset=0',
+        url=f'https://localhost/public/v1/tier/accounts?in(external_id,({mocked_reseller["id"]}))&limit=1000&offset=0',
         json=[],
-        headers={
-            'Content-Range': 'items 0-0/0',
-        },
     )
     synchronizer = CustomerSynchronizer(
         account_id='VA-123',
@@ -339,11 +327,11 @@ def test_create_account_connect_parent_external_id_more_than_one(
 
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_id,{mocked_reseller["id"]})&limit=0&offset=0',
-        json=[],
-        headers={
-            'Content-Range': 'items 0-2/2',
-        },
+        url=f'https://localhost/public/v1/tier/accounts?in(external_id,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[
+            dict(mocked_reseller, external_id=mocked_reseller['id']),
+            dict(mocked_reseller, id='TA-0000-0000-0000', external_id=mocked_reseller['id']),
+        ],
     )
     synchronizer = CustomerSynchronizer(
         account_id='VA-123',
@@ -370,19 +358,8 @@ def test_create_account_connect_parent_external_uid(
 
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_uid,{mocked_reseller["id"]})&limit=0&offset=0',
-        json=[mocked_reseller],
-        headers={
-            'Content-Range': 'items 0-1/1',
-        },
-    )
-    mocked_responses.add(
-        method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_uid,{mocked_reseller["id"]})&limit=1&offset=0',
-        json=[mocked_reseller],
-        headers={
-            'Content-Range': 'items 0-1/1',
-        },
+        url=f'https://localhost/public/v1/tier/accounts?in(external_uid,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[dict(mocked_reseller, external_uid=mocked_reseller['id'])],
     )
     mocked_responses.add(
         method='POST',
@@ -414,11 +391,8 @@ def test_create_account_connect_parent_external_uid_not_found(
 
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_uid,{mocked_reseller["id"]})&limit=0&offset=0',
+        url=f'https://localhost/public/v1/tier/accounts?in(external_uid,({mocked_reseller["id"]}))&limit=1000&offset=0',
         json=[],
-        headers={
-            'Content-Range': 'items 0-0/0',
-        },
     )
     synchronizer = CustomerSynchronizer(
         account_id='VA-123',
@@ -445,11 +419,11 @@ def test_create_account_connect_parent_external_uid_more_than_one(
 
     mocked_responses.add(
         method='GET',
-        url=f'https://localhost/public/v1/tier/accounts?eq(external_uid,{mocked_reseller["id"]})&limit=0&offset=0',
-        json=[],
-        headers={
-            'Content-Range': 'items 0-2/2',
-        },
+        url=f'https://localhost/public/v1/tier/accounts?in(external_uid,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[
+            dict(mocked_reseller, external_uid=mocked_reseller['id']),
+            dict(mocked_reseller, id='TA-0000-0000-0000', external_uid=mocked_reseller['id']),
+        ],
     )
     synchronizer = CustomerSynchronizer(
         account_id='VA-123',
@@ -459,3 +433,315 @@ def test_create_account_connect_parent_external_uid_more_than_one(
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
     skipped, created, updated, errors = synchronizer.sync()
     assert errors == {3: ['More than one Parent with external_uid TA-7374-0753-1907']}
+
+
+def test_sync_resolves_accounts_once(
+        fs,
+        customers_workbook,
+        mocked_responses,
+        mocked_reseller,
+):
+    customers_workbook['Customers']['D2'] = 'update'
+    customers_workbook['Customers']['D3'] = 'create'
+    customers_workbook['Customers']['A3'] = None
+    customers_workbook['Customers']['C3'] = None
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    client = get_client()
+
+    mocked_responses.add(
+        method='GET',
+        url=f'https://localhost/public/v1/tier/accounts?in(id,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[mocked_reseller],
+    )
+    mocked_responses.add(
+        method='PUT',
+        url=f'https://localhost/public/v1/tier/accounts/{mocked_reseller["id"]}',
+        json=mocked_reseller,
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/tier/accounts',
+        json=mocked_reseller,
+    )
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=client,
+        silent=True,
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert (created, updated, errors) == (1, 1, {})
+    assert len(mocked_responses.calls) == 3
+
+
+def test_sync_resolves_accounts_in_batches(
+        fs,
+        mocker,
+        customers_workbook,
+        mocked_responses,
+        mocked_reseller,
+):
+    mocker.patch('connect.cli.plugins.customer.sync.ACCOUNTS_LOOKUP_BATCH_SIZE', 1)
+    customers_workbook['Customers']['D2'] = 'update'
+    customers_workbook['Customers']['D3'] = 'create'
+    customers_workbook['Customers']['A3'] = None
+    customers_workbook['Customers']['C3'] = None
+    customers_workbook['Customers']['G3'] = 'TA-0000-0000-0000'
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    client = get_client()
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/tier/accounts?in(id,(TA-0000-0000-0000))&limit=1000&offset=0',
+        json=[dict(mocked_reseller, id='TA-0000-0000-0000')],
+    )
+    mocked_responses.add(
+        method='GET',
+        url=f'https://localhost/public/v1/tier/accounts?in(id,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        json=[mocked_reseller],
+    )
+    mocked_responses.add(
+        method='PUT',
+        url=f'https://localhost/public/v1/tier/accounts/{mocked_reseller["id"]}',
+        json=mocked_reseller,
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/tier/accounts',
+        json=mocked_reseller,
+    )
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=client,
+        silent=True,
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert (created, updated, errors) == (1, 1, {})
+
+
+def test_create_account_connect_parent_external_id_error(
+        fs,
+        customers_workbook,
+        mocked_responses,
+        mocked_reseller,
+):
+    customers_workbook['Customers']['D3'] = 'create'
+    customers_workbook['Customers']['A3'] = None
+    customers_workbook['Customers']['C3'] = None
+    customers_workbook['Customers']['F3'] = 'external_id'
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    client = get_client()
+
+    mocked_responses.add(
+        method='GET',
+        url=f'https://localhost/public/v1/tier/accounts?in(external_id,({mocked_reseller["id"]}))&limit=1000&offset=0',
+        status=500,
+    )
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=client,
+        silent=True,
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert errors == {3: ['Error when obtaining parent data from Connect']}
+
+
+def test_create_account_connect_parent_created_before(
+        fs,
+        customers_workbook,
+        mocked_responses,
+        mocked_reseller,
+):
+    customers_workbook['Customers']['D2'] = 'create'
+    customers_workbook['Customers']['A2'] = None
+    customers_workbook['Customers']['D3'] = 'create'
+    customers_workbook['Customers']['A3'] = None
+    customers_workbook['Customers']['C3'] = None
+    customers_workbook['Customers']['F3'] = 'external_id'
+    customers_workbook['Customers']['G3'] = '39878'
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    client = get_client()
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/tier/accounts?in(external_id,(39878))&limit=1000&offset=0',
+        json=[],
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/tier/accounts',
+        json=dict(mocked_reseller, external_id='39878'),
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/tier/accounts',
+        json=mocked_reseller,
+    )
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=client,
+        silent=True,
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert (created, errors) == (2, {})
+
+
+def _get_row(**kwargs):
+    return _RowData(*([None] * len(_RowData._fields)))._replace(**{'parent_search_criteria': '-', **kwargs})
+
+
+def test_get_levels():
+    rows = {
+        2: _get_row(external_id='R1'),
+        3: _get_row(parent_search_criteria='external_id', parent_search_value='R2'),
+        4: _get_row(external_id='R2', parent_search_criteria='external_id', parent_search_value='R1'),
+        5: _get_row(parent_search_criteria='id', parent_search_value='TA-0000-0000-0000'),
+        6: _get_row(external_uid='C1', parent_search_criteria='external_uid', parent_search_value='C2'),
+        7: _get_row(external_uid='C2', parent_search_criteria='external_uid', parent_search_value='C1'),
+    }
+
+    levels, circular = _get_levels({row_idx: (data, {}) for row_idx, data in rows.items()})
+
+    assert levels == [[2, 5], [4], [3]]
+    assert circular == [6, 7]
+
+
+def test_sync_parent_after_child(
+        fs,
+        customers_workbook,
+        mocked_responses,
+        mocked_reseller,
+):
+    customers_workbook['Customers']['D2'] = 'create'
+    customers_workbook['Customers']['A2'] = None
+    customers_workbook['Customers']['C2'] = None
+    customers_workbook['Customers']['F2'] = 'external_id'
+    customers_workbook['Customers']['G2'] = '80161'
+    customers_workbook['Customers']['H2'] = 'customer'
+    customers_workbook['Customers']['B3'] = '80161'
+    customers_workbook['Customers']['D3'] = 'create'
+    customers_workbook['Customers']['A3'] = None
+    customers_workbook['Customers']['F3'] = '-'
+    customers_workbook['Customers']['H3'] = 'reseller'
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    client = get_client()
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/tier/accounts?in(external_id,(80161))&limit=1000&offset=0',
+        json=[],
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/tier/accounts',
+        json=dict(mocked_reseller, id='TA-0000-0000-0000', external_id='80161'),
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/tier/accounts',
+        json=mocked_reseller,
+    )
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=client,
+        silent=True,
+        workers=4,
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert (created, errors) == (2, {})
+    assert json.loads(mocked_responses.calls[1].request.body).get('parent') is None
+    assert json.loads(mocked_responses.calls[2].request.body)['parent'] == {'id': 'TA-0000-0000-0000'}
+
+
+def test_sync_circular_parents(fs, customers_workbook, mocked_responses, mocked_reseller):
+    customers_workbook['Customers']['D2'] = 'update'
+    customers_workbook['Customers']['F2'] = 'id'
+    customers_workbook['Customers']['G2'] = 'TA-6905-9236-3873'
+    customers_workbook['Customers']['D3'] = 'update'
+    customers_workbook['Customers']['H3'] = 'reseller'
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    client = get_client()
+
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=client,
+        silent=True,
+        workers=4,
+    )
+    mocked_responses.add(
+        method='GET',
+        url=(
+            'https://localhost/public/v1/tier/accounts'
+            '?in(id,(TA-6905-9236-3873,TA-7374-0753-1907))&limit=1000&offset=0'
+        ),
+        json=[mocked_reseller, dict(mocked_reseller, id='TA-6905-9236-3873')],
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert errors == {
+        2: ['Circular reference between parent accounts'],
+        3: ['Circular reference between parent accounts'],
+    }
+
+
+def test_update_customer_lookup_error(fs, customers_workbook, mocked_responses):
+    customers_workbook['Customers']['D2'] = 'update'
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    client = get_client()
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/tier/accounts?in(id,(TA-7374-0753-1907))&limit=1000&offset=0',
+        status=500,
+    )
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=client,
+        silent=True,
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert errors == {2: ['Error when obtaining account data from Connect']}
+
+
+def test_index_account_replaces_changed_keys():
+    synchronizer = CustomerSynchronizer(account_id='VA-123', client=get_client(), silent=True)
+    synchronizer._index_account({'id': 'TA-1', 'external_id': 'X', 'external_uid': 'U1'})
+    synchronizer._index_account({'id': 'TA-2', 'external_id': 'X', 'external_uid': 'U2'})
+
+    synchronizer._index_account({'id': 'TA-1', 'external_id': 'Y', 'external_uid': 'U1'})
+
+    assert synchronizer._find_parent('external_id', 'X') == ('TA-2', None)
+    assert synchronizer._find_parent('external_id', 'Y') == ('TA-1', None)
+    assert synchronizer._find_parent('external_uid', 'U1') == ('TA-1', None)
+
+
+def test_sync_indexes_level_once_synced(fs, customers_workbook, mocker, mocked_reseller):
+    customers_workbook['Customers']['D2'] = 'create'
+    customers_workbook['Customers']['A2'] = None
+    customers_workbook['Customers']['D3'] = 'create'
+    customers_workbook['Customers']['A3'] = None
+    customers_workbook['Customers']['F3'] = '-'
+    customers_workbook['Customers']['H3'] = 'reseller'
+    customers_workbook.save(f'{fs.root_path}/test.xlsx')
+    calls = []
+    synchronizer = CustomerSynchronizer(
+        account_id='VA-123',
+        client=get_client(),
+        silent=True,
+        workers=4,
+    )
+    mocker.patch.object(
+        synchronizer,
+        '_sync_row',
+        side_effect=lambda data, model: calls.append('sync') or (mocked_reseller, None),
+    )
+    mocker.patch.object(synchronizer, '_index_account', side_effect=lambda account: calls.append('index'))
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Customers')
+    skipped, created, updated, errors = synchronizer.sync()
+    assert (created, errors) == (2, {})
+    assert calls == ['sync', 'sync', 'index', 'index']
@@ -1,4 +1,5 @@
 from connect.cli.plugins.product.sync.actions import ActionsSynchronizer
+from connect.cli.plugins.product.sync.diff import SyncDiff
 from connect.client import ConnectClient
 
 
@@ -347,3 +348,154 @@ def test_create_500(fs, get_sync_actions_env, mocked_responses, mocked_actions_r
     assert updated == 0
     assert deleted == 0
     assert errors == {2: ['500 Internal Server Error']}
+
+
+def test_update_diff_unchanged(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
+    get_sync_actions_env['Actions']['C2'] = 'update'
+
+    get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = ActionsSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+        diff=SyncDiff(),
+    )
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions',
+        json=mocked_actions_response,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert updated == 0
+    assert errors == {}
+
+
+def test_update_diff_changed(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
+    get_sync_actions_env['Actions']['C2'] = 'update'
+    get_sync_actions_env['Actions']['D2'] = 'New name'
+
+    get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
+
+    diff = SyncDiff()
+    synchronizer = ActionsSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+        diff=diff,
+    )
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions',
+        json=mocked_actions_response,
+    )
+    mocked_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions/ACT-276-377-545-001',
+        json=mocked_actions_response[0],
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 0
+    assert updated == 1
+    assert errors == {}
+    assert [change['field'] for change in diff.changes] == ['name']
+
+
+def test_update_dry_run(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
+    get_sync_actions_env['Actions']['C2'] = 'update'
+    get_sync_actions_env['Actions']['D2'] = 'New name'
+    get_sync_actions_env['Actions']['A3'] = None
+    get_sync_actions_env['Actions']['B3'] = 'new_action'
+    get_sync_actions_env['Actions']['C3'] = 'create'
+    get_sync_actions_env['Actions']['D3'] = 'New action'
+    get_sync_actions_env['Actions']['G3'] = 'asset'
+
+    get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
+
+    diff = SyncDiff(dry_run=True)
+    synchronizer = ActionsSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+        diff=diff,
+    )
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions',
+        json=mocked_actions_response,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert created == 1
+    assert updated == 1
+    assert errors == {}
+    assert diff.changes == [
+        {
+            'worksheet': 'Actions',
+            'row': 2,
+            'action': 'update',
+            'id': 'ACT-276-377-545-001',
+            'field': 'name',
+            'current': 'Action 1',
+            'new': 'New name',
+        },
+        {
+            'worksheet': 'Actions',
+            'row': 3,
+            'action': 'create',
+            'id': None,
+            'field': None,
+            'current': None,
+            'new': None,
+        },
+    ]
+    assert all(call.request.method == 'GET' for call in mocked_responses.calls)
+
+
+def test_delete_dry_run(fs, get_sync_actions_env, mocked_responses):
+    get_sync_actions_env['Actions']['C2'] = 'delete'
+
+    get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
+
+    diff = SyncDiff(dry_run=True)
+    synchronizer = ActionsSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+        diff=diff,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert deleted == 1
+    assert errors == {}
+    assert [(change['action'], change['id']) for change in diff.changes] == [('delete', 'ACT-276-377-545-001')]
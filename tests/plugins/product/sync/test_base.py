@@ -9,6 +9,7 @@ from openpyxl import load_workbook
 
 from connect.cli.plugins.exceptions import SheetNotFoundError
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
+from connect.cli.plugins.sheets import WorkbookSession
 from connect.client import ConnectClient
 
 
@@ -180,3 +181,36 @@ def test_save(fs, mocked_responses, mocked_product_response):
     synchronizer.save(f'{fs.root_path}//test.xlsx')
 
     assert os.path.isfile(f'{fs.root_path}/test.xlsx')
+
+
+def test_session_shared_workbook(fs, mocker, mocked_responses, mocked_product_response):
+    copy2('./tests/fixtures/comparation_product.xlsx', f'{fs.root_path}/test.xlsx')
+    load_mock = mocker.patch(
+        'connect.cli.plugins.sheets.load_workbook',
+        wraps=load_workbook,
+    )
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545',
+        json=mocked_product_response,
+    )
+    session = WorkbookSession(f'{fs.root_path}/test.xlsx')
+
+    items = ProductSynchronizer(client=client, silent=True, session=session)
+    items.open(session.input_file, 'Items')
+    templates = ProductSynchronizer(client=client, silent=True, session=session)
+    templates.open(session.input_file, 'Templates')
+
+    assert load_mock.call_count == 1
+    assert items._wb is templates._wb
+
+    session.get_patch('Items').cell(2, 1, value='PRD-276-377-545-0001')
+    session.save()
+
+    wb = load_workbook(f'{fs.root_path}/test.xlsx')
+    assert wb['Items']['A2'].value == 'PRD-276-377-545-0001'
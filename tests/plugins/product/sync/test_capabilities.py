@@ -1,3 +1,4 @@
+import json
 from copy import deepcopy
 
 import pytest
@@ -330,7 +331,6 @@ def test_ppu_disable_dynamic(
     fs,
     get_sync_capabilities_env_ppu_enabled,
     mocked_responses,
-    mocked_product_response,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities']['B3'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities']['C3'].value = 'Disabled'
@@ -345,17 +345,6 @@ def test_ppu_disable_dynamic(
         silent=True,
     )
 
-    response = deepcopy(mocked_product_response)
-    response['capabilities']['ppu'] = {
-        'schema': 'QT',
-    }
-
-    mocked_responses.add(
-        method='PUT',
-        url='https://localhost/public/v1/products/PRD-276-377-545',
-        json=response,
-    )
-
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
     skipped, updated, errors = synchronizer.sync()
@@ -363,6 +352,7 @@ def test_ppu_disable_dynamic(
     assert skipped == 8
     assert updated == 1
     assert errors == {}
+    assert not any(call.request.method == 'PUT' for call in mocked_responses.calls)
 
 
 def test_ppu_future_no_ppu(
@@ -464,7 +454,6 @@ def test_ppu_disable_future(
     fs,
     get_sync_capabilities_env_ppu_enabled,
     mocked_responses,
-    mocked_product_response,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities']['B4'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities']['C4'].value = 'Disabled'
@@ -479,17 +468,6 @@ def test_ppu_disable_future(
         silent=True,
     )
 
-    response = deepcopy(mocked_product_response)
-    response['capabilities']['ppu'] = {
-        'schema': 'QT',
-    }
-
-    mocked_responses.add(
-        method='PUT',
-        url='https://localhost/public/v1/products/PRD-276-377-545',
-        json=response,
-    )
-
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
     skipped, updated, errors = synchronizer.sync()
@@ -497,17 +475,18 @@ def test_ppu_disable_future(
     assert skipped == 8
     assert updated == 1
     assert errors == {}
+    assert not any(call.request.method == 'PUT' for call in mocked_responses.calls)
 
 
 @pytest.mark.parametrize(
-    ('row_action',),
+    ('row_action', 'changed'),
     (
-        (5,),
-        (6,),
-        (7,),
-        (8,),
-        (9,),
-        (10,),
+        (5, False),
+        (6, True),
+        (7, True),
+        (8, True),
+        (9, False),
+        (10, False),
     ),
 )
 def test_ppu_disable_feature(
@@ -516,6 +495,7 @@ def test_ppu_disable_feature(
     mocked_responses,
     mocked_product_response,
     row_action,
+    changed,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'B{row_action}'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'C{row_action}'].value = 'Disabled'
@@ -530,11 +510,12 @@ def test_ppu_disable_feature(
         silent=True,
     )
 
-    mocked_responses.add(
-        method='PUT',
-        url='https://localhost/public/v1/products/PRD-276-377-545',
-        json=mocked_product_response,
-    )
+    if changed:
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=mocked_product_response,
+        )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
@@ -546,13 +527,13 @@ def test_ppu_disable_feature(
 
 
 @pytest.mark.parametrize(
-    ('row_action',),
+    ('row_action', 'changed'),
     (
-        (5,),
-        (6,),
-        (7,),
-        (9,),
-        (10,),
+        (5, True),
+        (6, False),
+        (7, False),
+        (9, True),
+        (10, True),
     ),
 )
 def test_features_enable_future(
@@ -561,6 +542,7 @@ def test_features_enable_future(
     mocked_responses,
     mocked_product_response,
     row_action,
+    changed,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'B{row_action}'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'C{row_action}'].value = 'Enabled'
@@ -575,11 +557,12 @@ def test_features_enable_future(
         silent=True,
     )
 
-    mocked_responses.add(
-        method='PUT',
-        url='https://localhost/public/v1/products/PRD-276-377-545',
-        json=mocked_product_response,
-    )
+    if changed:
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=mocked_product_response,
+        )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
@@ -591,10 +574,11 @@ def test_features_enable_future(
 
 
 @pytest.mark.parametrize(
-    ('tier_level',),
+    ('tier_level', 'changed'),
     (
-        (1,),
-        (2,),
+        (1, True),
+        ('1', True),
+        (2, False),
     ),
 )
 def test_tier_level_feature(
@@ -603,6 +587,7 @@ def test_tier_level_feature(
     mocked_responses,
     mocked_product_response,
     tier_level,
+    changed,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities']['B8'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities']['C8'].value = tier_level
@@ -617,6 +602,43 @@ def test_tier_level_feature(
         silent=True,
     )
 
+    if changed:
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=mocked_product_response,
+        )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
+
+    skipped, updated, errors = synchronizer.sync()
+
+    assert skipped == 8
+    assert updated == 1
+    assert errors == {}
+
+
+def test_multiple_rows_single_update(
+    fs,
+    get_sync_capabilities_env_ppu_enabled,
+    mocked_responses,
+    mocked_product_response,
+):
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['B3'].value = 'update'
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['C3'].value = 'Enabled'
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['B4'].value = 'update'
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['C4'].value = 'Enabled'
+    get_sync_capabilities_env_ppu_enabled.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = CapabilitiesSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
     mocked_responses.add(
         method='PUT',
         url='https://localhost/public/v1/products/PRD-276-377-545',
@@ -624,9 +646,53 @@ def test_tier_level_feature(
     )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
+    opened_calls = len(mocked_responses.calls)
 
     skipped, updated, errors = synchronizer.sync()
 
-    assert skipped == 8
-    assert updated == 1
+    assert skipped == 7
+    assert updated == 2
     assert errors == {}
+    calls = list(mocked_responses.calls)[opened_calls:]
+    assert [call.request.method for call in calls] == ['GET', 'PUT']
+    ppu = json.loads(calls[1].request.body)['capabilities']['ppu']
+    assert ppu['dynamic'] is True
+    assert ppu['future'] is True
+
+
+def test_update_error_on_every_row(
+    fs,
+    get_sync_capabilities_env_ppu_enabled,
+    mocked_responses,
+):
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['B3'].value = 'update'
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['C3'].value = 'Enabled'
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['B4'].value = 'update'
+    get_sync_capabilities_env_ppu_enabled['Capabilities']['C4'].value = 'Enabled'
+    get_sync_capabilities_env_ppu_enabled.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = CapabilitiesSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    mocked_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545',
+        status=500,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
+
+    skipped, updated, errors = synchronizer.sync()
+
+    assert skipped == 7
+    assert updated == 0
+    assert errors == {
+        3: ['500 Internal Server Error'],
+        4: ['500 Internal Server Error'],
+    }
@@ -0,0 +1,43 @@
+from connect.cli.plugins.product.sync.diff import get_payload_changes, SyncDiff
+
+
+def test_get_payload_changes():
+    current = {
+        'name': 'Item',
+        'description': '',
+        'unit': {'id': 'unit', 'name': 'Unit'},
+        'commitment': {'count': 1},
+        'events': {'created': {'at': '2021-01-01'}},
+    }
+    payload = {
+        'name': 'Item',
+        'description': None,
+        'unit': {'id': 'unit-h'},
+        'commitment': {'count': 12},
+        'period': 'monthly',
+    }
+
+    assert get_payload_changes(current, payload) == [
+        ('unit.id', 'unit', 'unit-h'),
+        ('commitment.count', 1, 12),
+        ('period', None, 'monthly'),
+    ]
+
+
+def test_sync_diff_compare():
+    diff = SyncDiff()
+
+    assert diff.compare('Items', 2, 'PRD-1', {'name': 'a'}, {'name': 'a'}) == []
+    assert diff.changes == []
+    assert diff.compare('Items', 3, 'PRD-2', {'name': 'a'}, {'name': 'b'}) == [('name', 'a', 'b')]
+    assert diff.changes == [
+        {
+            'worksheet': 'Items',
+            'row': 3,
+            'action': 'update',
+            'id': 'PRD-2',
+            'field': 'name',
+            'current': 'a',
+            'new': 'b',
+        },
+    ]
@@ -0,0 +1,210 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from connect.cli.core.metrics import get_metrics
+from connect.cli.core.scheduler import get_scheduler
+from connect.cli.plugins.product.sync.executor import AsyncMutationExecutor, MutationExecutor
+from connect.client import ClientError, ConnectClient
+
+
+def _double(client, value):
+    return value * 2
+
+
+def _fail(client, value):
+    raise ValueError(f'error {value}')
+
+
+def _get_product(client, product_id):
+    product = yield client.products[product_id].get()
+    return product['id']
+
+
+@pytest.mark.parametrize('workers', (1, 4))
+def test_results_in_submission_order(workers):
+    with MutationExecutor(None, workers) as executor:
+        for row_idx in range(2, 10):
+            executor.submit(row_idx, 'items', _double, row_idx)
+        executor.submit(10, 'items', _fail, 10)
+
+        results = list(executor.results())
+
+    assert [row_idx for row_idx, _, _ in results] == list(range(2, 11))
+    assert [result for _, result, _ in results[:-1]] == [row_idx * 2 for row_idx in range(2, 10)]
+    assert results[-1][1] is None
+    assert str(results[-1][2]) == 'error 10'
+    assert list(executor.results()) == []
+
+
+def test_endpoint_limits():
+    lock = threading.Lock()
+    running = {'current': 0, 'max': 0}
+
+    def call(client):
+        with lock:
+            running['current'] += 1
+            running['max'] = max(running['max'], running['current'])
+        time.sleep(0.01)
+        with lock:
+            running['current'] -= 1
+
+    with MutationExecutor(None, 8, {'templates': 2}) as executor:
+        for row_idx in range(2, 20):
+            executor.submit(row_idx, 'templates', call)
+        results = list(executor.results())
+
+    assert len(results) == 18
+    assert all(error is None for _, _, error in results)
+    assert running['max'] <= 2
+
+
+def test_mutation_generator(mocked_responses, mocked_product_response):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545',
+        json=mocked_product_response,
+    )
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    executor = MutationExecutor(client)
+    executor.submit(2, 'products', _get_product, 'PRD-276-377-545')
+
+    assert list(executor.results()) == [(2, 'PRD-276-377-545', None)]
+
+
+def test_async_results(mocked_product_response):
+    def handler(request):
+        if request.url.path.endswith('PRD-276-377-545'):
+            return httpx.Response(200, json=mocked_product_response)
+        return httpx.Response(500)
+
+    executor = AsyncMutationExecutor(
+        'ApiKey SU:123',
+        'https://localhost/public/v1',
+        4,
+        transport=httpx.MockTransport(handler),
+    )
+    executor.submit(2, 'products', _get_product, 'PRD-276-377-545')
+    executor.submit(3, 'products', _get_product, 'PRD-000-000-000')
+    executor.submit(4, 'items', _double, 4)
+
+    results = list(executor.results())
+
+    assert [row_idx for row_idx, _, _ in results] == [2, 3, 4]
+    assert results[0] == (2, 'PRD-276-377-545', None)
+    assert isinstance(results[1][2], ClientError)
+    assert str(results[1][2]) == '500 Internal Server Error'
+    assert results[2] == (4, 8, None)
+
+
+def test_async_host_limit(mocked_product_response):
+    running = {'current': 0, 'max': 0}
+
+    async def handler(request):
+        running['current'] += 1
+        running['max'] = max(running['max'], running['current'])
+        await asyncio.sleep(0.01)
+        running['current'] -= 1
+        return httpx.Response(200, json=mocked_product_response)
+
+    executor = AsyncMutationExecutor(
+        'ApiKey SU:123',
+        'https://localhost/public/v1',
+        16,
+        host_limit=3,
+        transport=httpx.MockTransport(handler),
+    )
+    for row_idx in range(2, 20):
+        executor.submit(row_idx, 'products', _get_product, 'PRD-276-377-545')
+
+    results = list(executor.results())
+
+    assert all(error is None for _, _, error in results)
+    assert running['max'] == 3
+
+
+def test_async_backpressure(mocked_product_response):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={'Retry-After': '0.05'})
+        return httpx.Response(200, json=mocked_product_response)
+
+    executor = AsyncMutationExecutor(
+        'ApiKey SU:123',
+        'https://localhost/public/v1',
+        4,
+        transport=httpx.MockTransport(handler),
+    )
+    executor.submit(2, 'products', _get_product, 'PRD-276-377-545')
+
+    start = time.monotonic()
+    results = list(executor.results())
+
+    assert time.monotonic() - start >= 0.05
+    assert results == [(2, 'PRD-276-377-545', None)]
+    assert len(calls) == 2
+
+
+def test_async_uses_account_scheduler(mocked_product_response):
+    running = {'current': 0, 'max': 0}
+
+    async def handler(request):
+        running['current'] += 1
+        running['max'] = max(running['max'], running['current'])
+        await asyncio.sleep(0.01)
+        running['current'] -= 1
+        return httpx.Response(200, json=mocked_product_response)
+
+    scheduler = get_scheduler('https://localhost/public/v1', 'ApiKey SU:123')
+    scheduler.concurrency.limit = scheduler.concurrency.max_limit = 2
+    scheduler.pause(0.05)
+    executor = AsyncMutationExecutor(
+        'ApiKey SU:123',
+        'https://localhost/public/v1',
+        16,
+        transport=httpx.MockTransport(handler),
+    )
+    for row_idx in range(2, 10):
+        executor.submit(row_idx, 'products', _get_product, 'PRD-276-377-545')
+
+    start = time.monotonic()
+    results = list(executor.results())
+
+    assert time.monotonic() - start >= 0.05
+    assert all(error is None for _, _, error in results)
+    assert running['max'] == 2
+    assert scheduler.concurrency.in_flight == 0
+
+
+def test_async_records_transport_errors():
+    def handler(request):
+        raise httpx.ConnectTimeout('timed out', request=request)
+
+    metrics = get_metrics()
+    metrics.start('test')
+    executor = AsyncMutationExecutor(
+        'ApiKey SU:123',
+        'https://localhost/public/v1',
+        4,
+        transport=httpx.MockTransport(handler),
+    )
+    executor.submit(2, 'products', _get_product, 'PRD-276-377-545')
+
+    results = list(executor.results())
+    metrics.stop()
+
+    assert isinstance(results[0][2], ClientError)
+    assert len(metrics.requests) == 1
+    assert metrics.requests[0]['endpoint'] == 'products/{id}'
+    assert metrics.requests[0]['status'] is None
+    assert metrics.requests[0]['error'] == 'ConnectTimeout'
@@ -1,5 +1,8 @@
 import pytest
+from openpyxl import load_workbook
 
+from connect.cli.plugins.product.sync.diff import SyncDiff
+from connect.cli.plugins.product.sync.executor import MutationExecutor
 from connect.cli.plugins.product.sync.items import ItemSynchronizer
 from connect.client import ConnectClient
 
@@ -346,8 +349,7 @@ def test_create_item_exists_in_connect(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
     synchronizer = ItemSynchronizer(
@@ -384,8 +386,7 @@ def test_create_item_connect_exception(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -428,8 +429,7 @@ def test_create_item(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -471,8 +471,7 @@ def test_create_item_one_time(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -514,8 +513,7 @@ def test_create_item_yearly(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -558,8 +556,7 @@ def test_create_item_1_to_1_yearly(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -776,8 +773,7 @@ def test_update_item(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
 
@@ -819,8 +815,7 @@ def test_delete_item(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
 
@@ -860,6 +855,11 @@ def test_update_item_no_connect_item(
     get_sync_items_env['Items']['C2'].value = 'update'
 
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[],
+    )
     mocked_responses.add(
         method='GET',
         url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
@@ -899,6 +899,11 @@ def test_update_item_no_item_connect(
 
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
 
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[],
+    )
     mocked_responses.add(
         method='GET',
         url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
@@ -940,8 +945,7 @@ def test_update_item_draft(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[item],
     )
 
@@ -987,8 +991,7 @@ def test_update_item_draft_ppu(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[item],
     )
 
@@ -1032,8 +1035,7 @@ def test_update_item_draft_connect_exception(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[item],
     )
 
@@ -1073,6 +1075,11 @@ def test_delete_item_not_exists(
     get_sync_items_env['Items']['k2'].value = 'draft'
 
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[],
+    )
     mocked_responses.add(
         method='GET',
         url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
@@ -1115,8 +1122,7 @@ def test_delete_item_connect_error(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
 
@@ -1159,8 +1165,7 @@ def test_create_item_custom_uom(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -1195,3 +1200,153 @@ def test_create_item_custom_uom(
     assert created == 1
     assert updated == 0
     assert errors == {}
+
+
+def test_create_items_custom_uom_once(
+    fs,
+    get_sync_items_env,
+    mocked_responses,
+    mocked_items_response,
+):
+    ws = get_sync_items_env['Items']
+    ws['A2'].value = None
+    ws['C2'].value = 'create'
+    ws['H2'].value = 'unitary tests'
+    for col_idx in range(1, 14):
+        ws.cell(3, col_idx, value=ws.cell(2, col_idx).value)
+    ws['B3'].value = 'MPN-NEW-002'
+
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[],
+    )
+    for item in mocked_items_response[:2]:
+        mocked_responses.add(
+            method='POST',
+            url='https://localhost/public/v1/products/PRD-276-377-545/items',
+            json=item,
+        )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/settings/units',
+        json={
+            'id': '123',
+        },
+    )
+
+    synchronizer = ItemSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert created == 2
+    assert errors == {}
+    unit_calls = [
+        call for call in mocked_responses.calls
+        if call.request.method == 'POST' and call.request.url.endswith('/settings/units')
+    ]
+    assert len(unit_calls) == 1
+
+
+@pytest.mark.parametrize('workers', (1, 4))
+def test_update_items_single_lookup(
+    fs,
+    workers,
+    get_sync_items_env,
+    mocked_responses,
+    mocked_items_response,
+):
+    ws = get_sync_items_env['Items']
+    ws['C2'].value = 'update'
+    for row_idx, item in enumerate(mocked_items_response[1:3], start=3):
+        for col_idx in range(1, 14):
+            ws.cell(row_idx, col_idx, value=ws.cell(2, col_idx).value)
+        ws.cell(row_idx, 1).value = None
+        ws.cell(row_idx, 2).value = item['mpn']
+
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=mocked_items_response,
+    )
+    for item in mocked_items_response[0:3]:
+        mocked_responses.add(
+            method='PUT',
+            url=f'https://localhost/public/v1/products/PRD-276-377-545/items/{item["id"]}',
+            json=item,
+        )
+
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    synchronizer = ItemSynchronizer(
+        client=client,
+        silent=True,
+        executor=MutationExecutor(client, workers),
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert updated == 3
+    assert errors == {}
+    item_lookups = [
+        call for call in mocked_responses.calls
+        if call.request.method == 'GET' and '/items' in call.request.url
+    ]
+    assert len(item_lookups) == 1
+
+    synchronizer.save(f'{fs.root_path}/out.xlsx')
+    ws = load_workbook(f'{fs.root_path}/out.xlsx')['Items']
+    assert [ws.cell(row_idx, 1).value for row_idx in range(2, 5)] == [
+        item['id'] for item in mocked_items_response[0:3]
+    ]
+
+
+def test_update_item_diff_unchanged(
+    fs,
+    get_sync_items_env,
+    mocked_responses,
+    mocked_items_response,
+):
+    get_sync_items_env['Items']['C2'].value = 'update'
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=mocked_items_response,
+    )
+
+    synchronizer = ItemSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+        diff=SyncDiff(),
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert updated == 0
+    assert errors == {}
+    assert not any(call.request.method == 'PUT' for call in mocked_responses.calls)
@@ -0,0 +1,185 @@
+import json
+import os
+
+from click.testing import CliRunner
+from openpyxl import load_workbook, Workbook
+
+from connect.cli.core.config import Config
+from connect.cli.plugins.product.batch import ClientPool, export_products, get_product_ids, get_sync_inputs
+from connect.cli.plugins.product.commands import sync_batch_input
+from connect.cli.plugins.product.sync import MutationExecutor
+from connect.client import ConnectClient
+
+
+def _dump_product(api_url, api_key, product_id, output_file, silent, **kwargs):
+    assert kwargs['client'] is not None
+    if product_id == 'PRD-002':
+        raise Exception('boom')
+    return f'{product_id}.xlsx'
+
+
+def _get_config():
+    config = Config()
+    config.silent = True
+    return config
+
+
+def test_pool_shares_session(mocked_responses):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-001',
+        json={'id': 'PRD-001'},
+    )
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products',
+        json=[{'id': 'PRD-001'}, {'id': 'PRD-003'}],
+    )
+
+    with ClientPool('https://localhost/public/v1', 'ApiKey SU:123', 4) as pool:
+        first, second = pool.get_client(), pool.get_client()
+        assert first is not second
+        assert first._session is second._session
+        assert first.products['PRD-001'].get() == {'id': 'PRD-001'}
+        assert get_product_ids(second, ('PRD-002', 'PRD-001'), 'eq(status,published)') == [
+            'PRD-002', 'PRD-001', 'PRD-003',
+        ]
+
+
+def test_export_products_isolates_failures(mocker, capsys):
+    mocker.patch('connect.cli.plugins.product.batch.dump_product', side_effect=_dump_product)
+
+    summary = export_products(
+        'https://localhost/public/v1',
+        'ApiKey SU:123',
+        ('PRD-001', 'PRD-002', 'PRD-003', 'PRD-001'),
+        False,
+        workers=2,
+    )
+
+    assert summary['total'] == 3
+    assert summary['exported'] == 2
+    assert summary['failed'] == 1
+    assert [product['id'] for product in summary['products']] == ['PRD-001', 'PRD-002', 'PRD-003']
+    assert summary['products'][0]['output'] == 'PRD-001.xlsx'
+    assert summary['products'][1]['status'] == 'failed'
+    assert summary['products'][1]['error'] == 'Exception: boom'
+    output = capsys.readouterr().out
+    assert 'PRD-002 failed: Exception: boom' in output
+    assert 'PRD-003 exported to PRD-003.xlsx.' in output
+
+
+def test_export_batch_command(config_mocker, mocker, ccli, tmpdir):
+    mock = mocker.patch(
+        'connect.cli.plugins.product.commands.export_products',
+        return_value={
+            'total': 2,
+            'exported': 1,
+            'failed': 1,
+            'duration': 0.5,
+            'media_cache': None,
+            'products': [],
+        },
+    )
+    summary_file = str(tmpdir.join('summary.json'))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        ['product', 'export-batch', 'PRD-001', 'PRD-002', '-w', '8', '-s', summary_file],
+    )
+
+    mock.assert_called_once()
+    assert mock.mock_calls[0][1][2] == ('PRD-001', 'PRD-002')
+    assert mock.mock_calls[0][2]['workers'] == 8
+    assert result.exit_code == 1
+    assert '1 of 2 products exported' in result.output
+    assert '1 products could not be exported.' in result.output
+    with open(summary_file) as f:
+        assert json.load(f)['failed'] == 1
+
+
+def test_export_batch_requires_products(config_mocker, ccli):
+    runner = CliRunner()
+    result = runner.invoke(ccli, ['product', 'export-batch'])
+
+    assert result.exit_code == 2
+    assert 'Provide at least one product id or a query.' in result.output
+
+
+def test_get_sync_inputs(tmpdir):
+    os.makedirs(tmpdir.join('PRD-001'))
+    Workbook().save(str(tmpdir.join('PRD-001', 'PRD-001.xlsx')))
+    os.makedirs(tmpdir.join('PRD-002_csv'))
+    tmpdir.join('PRD-002_csv', 'general_information.csv').write('Product information\n')
+    Workbook().save(str(tmpdir.join('PRD-003.xlsx')))
+    tmpdir.join('~$PRD-003.xlsx').write('lock')
+    tmpdir.join('notes.txt').write('notes')
+    os.makedirs(tmpdir.join('media'))
+
+    assert get_sync_inputs(str(tmpdir)) == [
+        str(tmpdir.join('PRD-001', 'PRD-001.xlsx')),
+        str(tmpdir.join('PRD-002_csv')),
+        str(tmpdir.join('PRD-003.xlsx')),
+    ]
+
+
+def test_sync_batch_input_failure(tmpdir):
+    input_file = str(tmpdir.join('PRD-001.xlsx'))
+    wb = Workbook()
+    wb.active.title = 'Items'
+    wb.save(input_file)
+    client = ConnectClient('ApiKey SU:123', endpoint='https://localhost/public/v1', use_specs=False)
+
+    result = sync_batch_input(client, _get_config(), input_file, 1, False, False)
+
+    assert result['status'] == 'failed'
+    assert result['product_id'] is None
+    assert result['error'] == 'File does not contain General Information to synchronize'
+
+
+def test_sync_batch_input_dry_run(tmpdir, mocker):
+    input_file = str(tmpdir.join('PRD-001.xlsx'))
+    Workbook().save(input_file)
+    synchronizer = mocker.patch('connect.cli.plugins.product.commands.GeneralSynchronizer').return_value
+    synchronizer.open.return_value = 'PRD-001'
+
+    def _sync_sheets(client, config, session, executor, product_id, sync_diff, dry_run):
+        assert isinstance(executor, MutationExecutor)
+        assert dry_run and sync_diff.dry_run
+        sync_diff.add('Items', 2, 'create', None)
+        return [
+            {'module': 'Items', 'created': 1, 'updated': 0, 'deleted': 0, 'skipped': 0, 'errors': {3: ['error']}},
+        ]
+
+    mocker.patch('connect.cli.plugins.product.commands.sync_sheets', side_effect=_sync_sheets)
+
+    result = sync_batch_input(mocker.MagicMock(), _get_config(), input_file, 2, False, True)
+
+    synchronizer.sync.assert_not_called()
+    assert result['status'] == 'synchronized'
+    assert result['product_id'] == 'PRD-001'
+    assert result['errors'] == 1
+    assert [change['worksheet'] for change in result['changes']] == ['Items']
+
+
+def test_sync_batch_input_saves_on_failure(tmpdir, mocker):
+    input_file = str(tmpdir.join('PRD-001.xlsx'))
+    wb = Workbook()
+    wb.active.title = 'Items'
+    wb.save(input_file)
+    synchronizer = mocker.patch('connect.cli.plugins.product.commands.GeneralSynchronizer').return_value
+    synchronizer.open.return_value = 'PRD-001'
+    synchronizer.sync.return_value = []
+
+    def _sync_sheets(client, config, session, executor, product_id, sync_diff, dry_run):
+        session.get_patch('Items').cell(2, 1, value='PRD-001-0001')
+        raise Exception('boom')
+
+    mocker.patch('connect.cli.plugins.product.commands.sync_sheets', side_effect=_sync_sheets)
+
+    result = sync_batch_input(mocker.MagicMock(), _get_config(), input_file, 1, False, False)
+
+    assert result['status'] == 'failed'
+    assert result['error'] == 'Exception: boom'
+    assert load_workbook(input_file)['Items']['A2'].value == 'PRD-001-0001'
@@ -0,0 +1,75 @@
+import time
+
+from connect.cli.core.cache.helpers import ResponseCache, set_response_cache
+from connect.cli.plugins.product.categories import (
+    CategoryIndex,
+    clear_category_indexes,
+    get_category_index,
+)
+from connect.client import ConnectClient
+
+
+def _get_client(api_key='ApiKey SU:123'):
+    return ConnectClient(
+        use_specs=False,
+        api_key=api_key,
+        endpoint='https://localhost/public/v1',
+    )
+
+
+def test_index_loaded_once(mocked_responses, mocked_categories_response):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/categories',
+        json=mocked_categories_response,
+    )
+
+    index = get_category_index(_get_client())
+    category = mocked_categories_response[0]
+
+    assert get_category_index(_get_client()) is index
+    assert index.get_id(category['name']) == category['id']
+    assert index.get_id('Not a category') is None
+    assert [cat['name'] for cat in index.categories] == [
+        cat['name'] for cat in mocked_categories_response
+    ]
+    assert len(mocked_responses.calls) == 1
+
+
+def test_index_per_account(mocked_responses, mocked_categories_response):
+    assert get_category_index(_get_client()) is not get_category_index(_get_client('ApiKey SU:456'))
+
+
+def test_index_persisted(fs, mocked_responses, mocked_categories_response):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/categories',
+        json=mocked_categories_response,
+    )
+    set_response_cache(ResponseCache(fs.root_path))
+    category = mocked_categories_response[0]
+
+    get_category_index(_get_client()).get_id(category['name'])
+    clear_category_indexes()
+
+    assert get_category_index(_get_client()).get_id(category['name']) == category['id']
+    assert len(mocked_responses.calls) == 1
+
+
+def test_index_expired(fs, mocker, mocked_responses, mocked_categories_response):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/categories',
+        json=mocked_categories_response,
+    )
+    cache = ResponseCache(fs.root_path)
+    cache.set(_get_client(), 'categories', [], 30)
+    set_response_cache(cache)
+    mocker.patch('connect.cli.core.cache.helpers.time.time', return_value=time.time() + 60)
+    category = mocked_categories_response[0]
+
+    index = CategoryIndex(_get_client(), ttl=30)
+
+    assert index.get_id(category['name']) == category['id']
+    assert len(mocked_responses.calls) == 1
+    assert len(cache.get(_get_client(), 'categories')) == len(mocked_categories_response)
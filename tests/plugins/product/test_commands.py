@@ -1,16 +1,25 @@
 import json
 import re
 import os
+from copy import deepcopy
 
 import pytest
 
 from click import ClickException
 from click.testing import CliRunner
 
-from openpyxl import load_workbook
+from openpyxl import load_workbook, Workbook
 
 from connect.cli.core.config import Config
-from connect.cli.plugins.product.export import dump_product
+from connect.cli.plugins.product.export import (
+    _dump_actions,
+    _INCREMENTAL_COLLECTIONS,
+    _patch_collection,
+    _track_collections,
+    dump_product,
+)
+from connect.cli.plugins.product.manifest import ExportManifest
+from connect.cli.plugins.tables import TableBook
 
 
 def test_sync_general_sync(fs, get_general_env, mocked_responses, ccli):
@@ -156,8 +165,8 @@ def test_export_product_not_exists(fs, mocked_responses):
     assert str(e.value) == '404 - Not Found: Product PRD-0000 not found.'
 
 
-def test_export_product(
-    fs,
+@pytest.fixture
+def mocked_export_responses(
     mocked_responses,
     mocked_product_response,
     mocked_categories_response,
@@ -169,7 +178,6 @@ def test_export_product(
     mocked_configuration_params_response,
     mocked_actions_response,
     mocked_configurations_response,
-    sample_product_workbook,
 ):
     mocked_responses.add(
         method='GET',
@@ -282,16 +290,59 @@ def test_export_product(
             'Content-Range': 'items 0-17/18',
         },
     )
+    return mocked_responses
+
+
+@pytest.mark.parametrize('workers', (1, 4))
+@pytest.mark.parametrize(
+    ('incremental', 'output_format'),
+    ((False, 'xlsx'), (True, 'xlsx'), (False, 'csv'), (False, 'jsonl')),
+)
+def test_export_product(
+    workers,
+    incremental,
+    output_format,
+    fs,
+    mocked_responses,
+    mocked_export_responses,
+    sample_product_workbook,
+):
     output_file = dump_product(
         api_url='https://localhost/public/v1',
         api_key='ApiKey SU111:1111',
         product_id='PRD-276-377-545',
-        output_file='output.xlsx',
+        output_file='output.xlsx' if output_format == 'xlsx' else 'output',
         output_path=fs.root_path,
         silent=True,
+        workers=workers,
+        incremental=incremental,
+        output_format=output_format,
     )
+    if incremental:
+        mocked_responses.add(
+            method='GET',
+            url=re.compile(
+                r'https:\/\/localhost\/public\/v1\/products\/PRD-276-377-545\/parameters\?and\(eq\(phase,',
+            ),
+            json=[],
+        )
+        output_file = dump_product(
+            api_url='https://localhost/public/v1',
+            api_key='ApiKey SU111:1111',
+            product_id='PRD-276-377-545',
+            output_file='output.xlsx',
+            output_path=fs.root_path,
+            silent=True,
+            workers=workers,
+            incremental=True,
+        )
+        assert os.path.isfile(os.path.join(fs.root_path, 'PRD-276-377-545', 'output.manifest.json'))
+        assert any('ge(events.updated.at' in call.request.url for call in mocked_responses.calls)
 
-    product_wb = load_workbook(output_file)
+    if output_format == 'xlsx':
+        product_wb = load_workbook(output_file)
+    else:
+        product_wb = TableBook(output_file, output_format)
     for name in sample_product_workbook.sheetnames:
         assert name in product_wb.sheetnames
     for sheet in sample_product_workbook.sheetnames:
@@ -307,11 +358,24 @@ def test_export_product(
         while row_idx <= sample_sheet.max_row:
             while letter(letter_idx) != letter_limit:
                 expected = sample_sheet[f'{letter(letter_idx)}{row_idx}'].value
+                if output_format == 'csv' and expected is not None:
+                    expected = str(expected)
                 assert product_sheet[f'{letter(letter_idx)}{row_idx}'].value == expected
                 letter_idx = letter_idx + 1
             letter_idx = 0
             row_idx = row_idx + 1
 
+    if output_format != 'xlsx':
+        return
+    assert str(product_wb['General Information'].merged_cells) == 'A1:B1'
+    assert product_wb['Items']['A1'].fill.fgColor.rgb == '00d3d3d3'
+    assert product_wb['Ordering Parameters']['L2'].alignment.wrap_text is True
+    items_validations = {
+        str(validation.sqref)
+        for validation in product_wb['Items'].data_validations.dataValidation
+    }
+    assert f'C2:C{product_wb["Items"].max_row}' in items_validations
+
 
 def _get_col_limit_by_type(ws_type):
     if ws_type == 'General Information':
@@ -337,3 +401,120 @@ def _get_col_limit_by_type(ws_type):
     elif ws_type == 'Configuration':
         return 'G'
     return 'Z'
+
+
+def test_export_incremental_patch(fs, mocked_actions_response):
+    actions = deepcopy(mocked_actions_response[:2])
+    actions.append(deepcopy(actions[1]))
+    actions[2]['id'] = 'ACT-276-377-545-003'
+    wb = Workbook()
+    ws = wb.active
+    _dump_actions(ws, actions, True)
+    manifest = ExportManifest(f'{fs.root_path}/output.manifest.json', 'PRD-276-377-545')
+    _track_collections(manifest, {name: actions if name == 'actions' else [] for name in _INCREMENTAL_COLLECTIONS})
+
+    changed = deepcopy(actions[2])
+    changed['name'] = 'Changed'
+    changed['events']['updated']['at'] = '2021-01-01T00:00:00+00:00'
+    added = deepcopy(actions[0])
+    added['id'] = 'ACT-276-377-545-004'
+    remote = [actions[0], changed, added]
+
+    result = _patch_collection(ws, 'actions', remote, [changed, added], manifest)
+
+    assert result == (1, 1, 1)
+    assert [ws.cell(row_idx, 1).value for row_idx in range(2, ws.max_row + 1)] == [
+        'ACT-276-377-545-001',
+        'ACT-276-377-545-003',
+        'ACT-276-377-545-004',
+    ]
+    assert ws['D3'].value == 'Changed'
+    assert {str(validation.sqref) for validation in ws.data_validations.dataValidation} == {'C2:C3 C4', 'G2:G3 G4'}
+    assert manifest.get_rows('actions') == {
+        'ACT-276-377-545-001': 2,
+        'ACT-276-377-545-003': 3,
+        'ACT-276-377-545-004': 4,
+    }
+    assert manifest.get_mark('actions') == '2021-01-01T00:00:00+00:00'
+
+    manifest.save()
+    loaded = ExportManifest.load(f'{fs.root_path}/output.manifest.json', 'PRD-276-377-545')
+    assert loaded.collections == manifest.collections
+    assert ExportManifest.load(f'{fs.root_path}/output.manifest.json', 'PRD-000-000-000') is None
+
+
+def test_sync_products_saves_on_failure(fs, mocker, ccli):
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+    wb = Workbook()
+    wb.active.title = 'Items'
+    wb.save(f'{fs.root_path}/test.xlsx')
+    synchronizer = mocker.patch('connect.cli.plugins.product.commands.GeneralSynchronizer').return_value
+    synchronizer.open.return_value = 'PRD-276-377-545'
+    synchronizer.sync.return_value = []
+
+    def _sync_sheets(client, config, session, executor, product_id, sync_diff, dry_run):
+        session.get_patch('Items').cell(2, 1, value='PRD-276-377-545-0001')
+        raise KeyboardInterrupt()
+
+    mocker.patch('connect.cli.plugins.product.commands.sync_sheets', side_effect=_sync_sheets)
+
+    runner = CliRunner()
+    result = runner.invoke(ccli, ['-c', fs.root_path, 'product', 'sync', '--yes', f'{fs.root_path}/test.xlsx'])
+
+    assert result.exit_code != 0
+    assert load_workbook(f'{fs.root_path}/test.xlsx')['Items']['A2'].value == 'PRD-276-377-545-0001'
+
+
+@pytest.mark.parametrize('output_format', ('csv', 'jsonl'))
+def test_export_table_sync_back(fs, output_format, mocked_export_responses, mocked_product_response, ccli):
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+    output_path = dump_product(
+        api_url='https://localhost/public/v1',
+        api_key='ApiKey SU111:1111',
+        product_id='PRD-276-377-545',
+        output_file='output',
+        output_path=fs.root_path,
+        silent=True,
+        output_format=output_format,
+    )
+    with open('./tests/fixtures/units_response.json') as units_response:
+        mocked_export_responses.add(
+            method='GET',
+            url='https://localhost/public/v1/settings/units',
+            json=json.load(units_response),
+        )
+    mocked_export_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545',
+        json=mocked_product_response,
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(ccli, ['-c', fs.root_path, 'product', 'sync', '--yes', output_path])
+
+    assert result.exit_code == 0
+    assert '│Items                   │       18│      0│      0│      0│     18│     0│' in result.output
+    assert '│Configuration           │       18│      0│      0│      0│     18│     0│' in result.output
+    requests = [call.request for call in mocked_export_responses.calls if call.request.method != 'GET']
+    assert {(request.method, request.url) for request in requests} == {
+        ('PUT', 'https://localhost/public/v1/products/PRD-276-377-545'),
+    }
+    assert json.loads(requests[0].body)['name'] == mocked_product_response['name']
@@ -0,0 +1,94 @@
+import pytest
+from click import ClickException
+
+from connect.cli.plugins.product.media import MediaCache, MediaFetcher
+
+
+def test_fetch(fs, mocked_responses):
+    content = open('./tests/fixtures/image.png', 'rb').read()
+    for name in ('image1.png', 'image2.png'):
+        mocked_responses.add(
+            method='GET',
+            url=f'https://localhost/media/{name}',
+            body=content,
+            status=200,
+        )
+
+    with MediaFetcher(workers=2) as fetcher:
+        fetcher.fetch('https://localhost/media/image1.png', f'{fs.root_path}/image1.png')
+        fetcher.fetch('https://localhost/media/image2.png', f'{fs.root_path}/image2.png')
+        fetcher.wait()
+
+    assert open(f'{fs.root_path}/image1.png', 'rb').read() == content
+    assert open(f'{fs.root_path}/image2.png', 'rb').read() == content
+
+
+def test_fetch_error(fs, mocked_responses):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/media/image.png',
+        status=404,
+    )
+
+    with pytest.raises(ClickException) as e:
+        with MediaFetcher() as fetcher:
+            fetcher.fetch('https://localhost/media/image.png', f'{fs.root_path}/image.png')
+            fetcher.wait()
+
+    assert str(e.value) == 'Error obtaining image from https://localhost/media/image.png'
+
+
+def test_fetch_cached(fs, mocked_responses):
+    content = open('./tests/fixtures/image.png', 'rb').read()
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/media/image.png',
+        body=content,
+        status=200,
+        headers={'ETag': '"abc"'},
+    )
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/media/image.png',
+        status=304,
+    )
+    cache = MediaCache(f'{fs.root_path}/cache')
+
+    with MediaFetcher(cache=cache) as fetcher:
+        fetcher.fetch('https://localhost/media/image.png', f'{fs.root_path}/first.png')
+        fetcher.wait()
+
+    cache = MediaCache(f'{fs.root_path}/cache')
+    with MediaFetcher(cache=cache) as fetcher:
+        fetcher.fetch('https://localhost/media/image.png', f'{fs.root_path}/second.png')
+        fetcher.wait()
+
+    assert mocked_responses.calls[1].request.headers['If-None-Match'] == '"abc"'
+    assert open(f'{fs.root_path}/second.png', 'rb').read() == content
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_fetch_cached_blob_corrupted(fs, mocked_responses):
+    content = open('./tests/fixtures/image.png', 'rb').read()
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/media/image.png',
+        body=content,
+        status=200,
+        headers={'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'},
+    )
+    cache = MediaCache(f'{fs.root_path}/cache')
+
+    with MediaFetcher(cache=cache) as fetcher:
+        fetcher.fetch('https://localhost/media/image.png', f'{fs.root_path}/image.png')
+        fetcher.wait()
+        with open(f'{fs.root_path}/image.png', 'r+b') as f:
+            f.write(b'corrupted')
+        fetcher.fetch('https://localhost/media/image.png', f'{fs.root_path}/image.png')
+        fetcher.wait()
+
+    assert 'If-Modified-Since' not in mocked_responses.calls[1].request.headers
+    assert open(f'{fs.root_path}/image.png', 'rb').read() == content
+    assert cache.hits == 0
+    assert cache.misses == 2
@@ -7,7 +7,7 @@ import os
 
 def test_bootstrap_report_command(fs, ccli, mocker, capsys):
     mocked_bootstrap = mocker.patch(
-        'connect.cli.plugins.project.commands.bootstrap_report_project',
+        'connect.cli.plugins.project.report_helpers.bootstrap_report_project',
         side_effect=print('project_dir'),
     )
     os.mkdir(f'{fs.root_path}/projects')
@@ -31,7 +31,7 @@ def test_bootstrap_report_command(fs, ccli, mocker, capsys):
 
 def test_validate_report_command(fs, ccli, mocker, capsys):
     mocked_validate_project = mocker.patch(
-        'connect.cli.plugins.project.commands.validate_report_project',
+        'connect.cli.plugins.project.report_helpers.validate_report_project',
         side_effect=print('Report Project connect/.data/logan has been successfully validated.'),
     )
     os.mkdir(f'{fs.root_path}/project')
@@ -55,7 +55,7 @@ def test_validate_report_command(fs, ccli, mocker, capsys):
 
 def test_add_report_command(fs, ccli, mocker, capsys):
     mocked_add_report = mocker.patch(
-        'connect.cli.plugins.project.commands.add_report',
+        'connect.cli.plugins.project.report_helpers.add_report',
         side_effect=print('successfully added'),
     )
     os.mkdir(f'{fs.root_path}/project')
@@ -81,7 +81,7 @@ def test_add_report_command(fs, ccli, mocker, capsys):
 
 def test_bootstrap_extension_command(fs, ccli, mocker, capsys):
     mocked_bootstrap = mocker.patch(
-        'connect.cli.plugins.project.commands.bootstrap_extension_project',
+        'connect.cli.plugins.project.extension_helpers.bootstrap_extension_project',
         side_effect=print('project_dir'),
     )
     os.mkdir(f'{fs.root_path}/projects')
@@ -105,7 +105,7 @@ def test_bootstrap_extension_command(fs, ccli, mocker, capsys):
 
 def test_validate_extension_command(fs, ccli, mocker, capsys):
     mocked_validate_project = mocker.patch(
-        'connect.cli.plugins.project.commands.validate_extension_project',
+        'connect.cli.plugins.project.extension_helpers.validate_extension_project',
         side_effect=print('Extension Project connect/.data/logan has been successfully validated.'),
     )
     os.mkdir(f'{fs.root_path}/project')
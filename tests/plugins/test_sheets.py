@@ -0,0 +1,109 @@
+from collections import namedtuple
+from shutil import copy2
+
+from openpyxl import load_workbook, Workbook
+from openpyxl.styles import Alignment
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from connect.cli.plugins.sheets import (
+    add_named_styles,
+    get_header_row,
+    iter_rows,
+    SheetWriter,
+    TOP_LEFT_STYLE,
+    WorkbookSession,
+    WRAP_TEXT_STYLE,
+    write_row,
+)
+
+
+def test_get_header_row():
+    session = WorkbookSession('./tests/fixtures/comparation_product.xlsx')
+
+    header = get_header_row(session.workbook['Items'], 3)
+    session.close()
+
+    assert header == ('ID', 'MPN', 'Action')
+
+
+def test_iter_rows():
+    _RowData = namedtuple('RowData', ('id', 'mpn', 'action'))
+    session = WorkbookSession('./tests/fixtures/comparation_product.xlsx')
+    ws = session.workbook['Items']
+
+    rows = list(iter_rows(ws, _RowData, True))
+    session.close()
+
+    assert rows[0][0] == 2
+    assert rows[0][1] == _RowData('PRD-276-377-545-0001', 'MPN-R-001', '-')
+    assert len(rows) == ws.max_row - 1
+
+
+def test_session_save_patches(fs):
+    copy2('./tests/fixtures/comparation_product.xlsx', f'{fs.root_path}/test.xlsx')
+    session = WorkbookSession(f'{fs.root_path}/test.xlsx')
+    assert session.workbook['Items'].max_row > 2
+
+    patch = session.get_patch('Items')
+    patch.cell(2, 1, value='PRD-000-000-000-0001').alignment = Alignment(horizontal='left')
+    patch.cell(3, 11, value='draft')
+    session.save(f'{fs.root_path}/out.xlsx')
+
+    ws = load_workbook(f'{fs.root_path}/out.xlsx')['Items']
+    assert ws['A2'].value == 'PRD-000-000-000-0001'
+    assert ws['A2'].alignment.horizontal == 'left'
+    assert ws['K3'].value == 'draft'
+    assert ws['B2'].value == 'MPN-R-001'
+
+
+def test_session_save_no_patches(fs, mocker):
+    copy2('./tests/fixtures/comparation_product.xlsx', f'{fs.root_path}/test.xlsx')
+    load_mock = mocker.patch(
+        'connect.cli.plugins.sheets.load_workbook',
+        wraps=load_workbook,
+    )
+    session = WorkbookSession(f'{fs.root_path}/test.xlsx')
+    session.workbook
+    session.save()
+
+    assert load_mock.call_count == 1
+
+
+def test_sheet_writer_write_only(fs):
+    wb = Workbook(write_only=True)
+    writer = SheetWriter(wb.create_sheet('Items'))
+    validation = DataValidation(type='list', formula1='"-,update"')
+    writer.write_header(['ID', 'Action'], {'A': 20, 'B': 30})
+    for idx in range(5):
+        writer.append(
+            [f'PRD-000-000-000-000{idx}', '-'],
+            styles=(TOP_LEFT_STYLE, WRAP_TEXT_STYLE),
+            validations={'B': validation} if idx != 2 else None,
+        )
+    writer.merge('A7:B7')
+    writer.close()
+    wb.save(f'{fs.root_path}/out.xlsx')
+
+    ws = load_workbook(f'{fs.root_path}/out.xlsx')['Items']
+    assert ws['A1'].value == 'ID'
+    assert ws['A1'].fill.fgColor.rgb == '00d3d3d3'
+    assert ws.column_dimensions['B'].width == 30
+    assert ws['A6'].value == 'PRD-000-000-000-0004'
+    assert ws['A2'].alignment.horizontal == 'left'
+    assert ws['B2'].alignment.wrap_text is True
+    assert len(ws.data_validations.dataValidation) == 1
+    assert str(ws.data_validations.dataValidation[0].sqref) == 'B2:B3 B5:B6'
+    assert str(ws.merged_cells) == 'A7:B7'
+
+
+def test_write_row_applies_named_styles():
+    wb = Workbook()
+    add_named_styles(wb)
+    ws = wb.active
+    ws['B2'].value = 'old'
+
+    write_row(ws, 2, ['PRD-000-000-000-0001', None], styles=(TOP_LEFT_STYLE, None))
+
+    assert ws['A2'].value == 'PRD-000-000-000-0001'
+    assert ws['A2'].style == TOP_LEFT_STYLE
+    assert ws['B2'].value is None
@@ -0,0 +1,107 @@
+import json
+import os
+from collections import namedtuple
+
+import pytest
+
+from connect.cli.plugins.sheets import get_header_row, iter_rows, WorkbookSession
+from connect.cli.plugins.tables import (
+    get_table_format,
+    open_session,
+    TableBook,
+    TableSession,
+)
+
+
+def _write_items(path, table_format):
+    wb = TableBook(path, table_format)
+    writer = wb.create_sheet('Ordering Parameters')
+    writer.write_header(['ID', 'Action', 'Required'], {'A': 20})
+    writer.append(['PRM-001', '-', True])
+    writer.append(['PRM-002', 'update', None])
+    wb.save()
+
+
+@pytest.mark.parametrize('table_format', ('csv', 'jsonl'))
+def test_table_session_patch(fs, table_format):
+    path = f'{fs.root_path}/tables'
+    _write_items(path, table_format)
+
+    assert get_table_format(path) == table_format
+    session = open_session(path)
+    assert isinstance(session, TableSession)
+    assert session.workbook.sheetnames == ['Ordering Parameters']
+
+    ws = session.workbook['Ordering Parameters']
+    assert get_header_row(ws, 3) == ('ID', 'Action', 'Required')
+    row_type = namedtuple('RowData', ('id', 'action', 'required'))
+    rows = [values for _, values in iter_rows(ws, row_type, True)]
+    required = 'True' if table_format == 'csv' else True
+    assert rows == [row_type('PRM-001', '-', required), row_type('PRM-002', 'update', None)]
+    assert ws['A3'].value == 'PRM-002'
+    assert ws['D3'].value is None
+
+    session.get_patch('Ordering Parameters').cell(3, 2, value='-')
+    session.save()
+
+    ws = TableSession(path, table_format).workbook['Ordering Parameters']
+    assert ws['B3'].value == '-'
+    assert ws['A3'].value == 'PRM-002'
+
+
+def test_jsonl_rows_are_objects(fs):
+    path = f'{fs.root_path}/tables'
+    _write_items(path, 'jsonl')
+
+    with open(f'{path}/ordering_parameters.jsonl') as table_file:
+        lines = [json.loads(line) for line in table_file]
+
+    assert lines == [
+        {'ID': 'PRM-001', 'Action': '-', 'Required': True},
+        {'ID': 'PRM-002', 'Action': 'update', 'Required': None},
+    ]
+
+
+def test_jsonl_column_order_from_known_headers(fs):
+    path = f'{fs.root_path}/tables'
+    os.makedirs(path)
+    with open(f'{path}/capabilities.jsonl', 'w') as table_file:
+        table_file.write(json.dumps({'Value': 'Enabled', 'Action': '-', 'Capability': 'Pay-as-you-go'}))
+    with open(f'{path}/items.jsonl', 'w'):
+        pass
+
+    wb = TableBook(path, 'jsonl')
+    assert list(wb['Capabilities'].iter_rows()) == [
+        ('Capability', 'Action', 'Value'),
+        ('Pay-as-you-go', '-', 'Enabled'),
+    ]
+    assert get_header_row(wb['Items'], 3) == ('ID', 'MPN', 'Action')
+
+
+def test_table_writer_header_from_widths(fs):
+    path = f'{fs.root_path}/tables'
+    wb = TableBook(path, 'csv')
+    writer = wb.create_sheet('General Information')
+    writer.set_widths({'A': 50, 'B': 180})
+    writer.append(['Product information'])
+    writer.append(['Product ID', 'PRD-000', None, 'ignored'])
+    wb.save()
+
+    ws = TableBook(path, 'csv')['General Information']
+    assert get_header_row(ws, 2) == ('Product information', 'B')
+    assert ws['B2'].value == 'PRD-000'
+    assert ws['D2'].value is None
+
+
+def test_parquet_round_trip(fs):
+    pytest.importorskip('pyarrow')
+    path = f'{fs.root_path}/tables'
+    _write_items(path, 'parquet')
+
+    ws = open_session(path).workbook['Ordering Parameters']
+    assert list(ws.iter_rows(min_row=2)) == [('PRM-001', '-', 'True'), ('PRM-002', 'update', None)]
+
+
+def test_open_session_xlsx():
+    assert isinstance(open_session('./tests/fixtures/comparation_product.xlsx'), WorkbookSession)
+    assert get_table_format('./tests/fixtures/comparation_product.xlsx') is None